@@ -0,0 +1,136 @@
+"""
+Benchmark Module Measures Crawl Time, Download Throughput and Peak Memory Against a Local Mock Learn Server
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from mocklearn import MockLearnServer
+
+
+def get_arguments() -> argparse.Namespace:
+    """
+    Reads the Arguments Passed into The Script
+    :return: The Parsed and Default Arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Measures Crawl Time, Download Throughput and Peak Memory Against a Local Mock Learn Server')
+    parser.add_argument("--threads", help="Comma Separated Download Thread Counts to Compare", default="1,4,8,16")
+    parser.add_argument("--modes", help="Comma Separated Ways to Download: sequential, course (download_all_attachments"
+                                        " per Course) and scheduler (All Courses at Once)",
+                        default="sequential,course,scheduler")
+    parser.add_argument("--courses", help="Number of Courses", type=int, default=4)
+    parser.add_argument("--depth", help="Levels of Folders in Each Course", type=int, default=2)
+    parser.add_argument("--breadth", help="Folders in Each Folder", type=int, default=4)
+    parser.add_argument("--items", help="File Items in Each Folder", type=int, default=3)
+    parser.add_argument("--attachments", help="Attachments on Each File Item", type=int, default=1)
+    parser.add_argument("--file-size", help="Bytes in Each Attachment", type=int, default=256 * 1024)
+    parser.add_argument("--page-size", help="Most Results in a Page of a Listing", type=int, default=100)
+    parser.add_argument("--latency", help="Seconds the Server Waits Before Every Response", type=float, default=0.02)
+    parser.add_argument("--bandwidth", help="Most Bytes per Second per Connection", type=int, default=None)
+    return parser.parse_args()
+
+
+def run(url: str, mode: str, threads: int, location: str, results: multiprocessing.Queue) -> None:
+    """
+    Crawls then Downloads Every Course Twice (the Second Time Every File is Already Up to Date), in its Own Process
+    so the Peak Memory Belongs to this Run Alone
+
+    :param url: The Mock Server's URL
+    :param mode: sequential, course or scheduler
+    :param threads: The Number of Download Threads
+    :param location: The Directory to Download to
+    :param results: Where the Measurements are Sent
+    """
+    from blackboard import BlackBoardClient, ContentCrawler
+    from blackboardevents import event_bus, set_output, QuietOutput
+    set_output(QuietOutput())
+
+    client = BlackBoardClient(username="benchmark", password="benchmark", site=url, save_location=location,
+                              thread_count=threads)
+    client.login()
+
+    start = time.perf_counter()
+    courses = client.courses()
+    found = []
+    for course in courses:
+        ContentCrawler(course, client.crawl_pool, lambda attachment, path: found.append(attachment)) \
+            .crawl(os.path.join(location, course.name_safe))
+    crawl = time.perf_counter() - start
+
+    def download() -> float:
+        started = time.perf_counter()
+        if mode == 'scheduler':
+            client.download_courses(courses, location)
+        else:
+            for course in courses:
+                course.download_all_attachments(location, threaded=mode == 'course')
+        return time.perf_counter() - started
+
+    cold = download()
+    warm = download()
+    event_bus.flush()
+    results.put({
+        'attachments': len(found),
+        'crawl': crawl,
+        'cold': cold,
+        'warm': warm,
+        'peak': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024),
+    })
+
+
+def measure(server: MockLearnServer, mode: str, threads: int) -> Dict[str, float]:
+    """
+    Runs a Single Configuration in a Child Process
+
+    :param server: The Running Mock Server
+    :param mode: sequential, course or scheduler
+    :param threads: The Number of Download Threads
+    :return: The Measurements
+    """
+    location = tempfile.mkdtemp(prefix="bb-benchmark-")
+    try:
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=run, args=(server.url, mode, threads, location, results))
+        process.start()
+        result = results.get()
+        process.join()
+        return result
+    finally:
+        shutil.rmtree(location, ignore_errors=True)
+
+
+def main() -> None:
+    args = get_arguments()
+    server = MockLearnServer(courses=args.courses, depth=args.depth, breadth=args.breadth, items=args.items,
+                             attachments=args.attachments, file_size=args.file_size, page_size=args.page_size,
+                             latency=args.latency, bandwidth=args.bandwidth).start()
+    print(f"{len(server.courses)} Courses, {len(server.contents)} Contents, {server.attachment_count} Attachments "
+          f"({server.total_bytes / 2 ** 20:.1f} MiB), {args.latency * 1000:.0f}ms Latency\n")
+    print("{:<10} {:>7} {:>9} {:>10} {:>12} {:>10} {:>10}".format(
+        "mode", "threads", "crawl", "download", "throughput", "resync", "peak rss"))
+
+    configurations: List = []
+    for mode in args.modes.split(','):
+        thread_counts = [1] if mode == 'sequential' else [int(count) for count in args.threads.split(',')]
+        configurations.extend((mode, threads) for threads in thread_counts)
+    try:
+        for mode, threads in configurations:
+            result = measure(server, mode, threads)
+            if result['attachments'] != server.attachment_count:
+                print(f"[WARNING] Crawl Found {result['attachments']} of {server.attachment_count} Attachments")
+            print("{:<10} {:>7} {:>8.2f}s {:>9.2f}s {:>7.1f} MiB/s {:>9.2f}s {:>6.0f} MiB".format(
+                mode, threads, result['crawl'], result['cold'], server.total_bytes / 2 ** 20 / result['cold'],
+                result['warm'], result['peak'] / 2 ** 20))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
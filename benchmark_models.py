@@ -0,0 +1,194 @@
+"""
+Benchmark Module Measures the Memory and CPU Cost of Building Course and Content Model Objects
+"""
+import argparse
+import gc
+import importlib.util
+import time
+import tracemalloc
+from types import ModuleType, SimpleNamespace
+from typing import Callable, List, Tuple
+
+import blackboard
+
+
+def get_arguments() -> argparse.Namespace:
+    """
+    Reads the Arguments Passed into The Script
+    :return: The Parsed and Default Arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Measures Memory and CPU Used to Build Blackboard Model Objects from Learn Responses')
+    parser.add_argument("-n", "--count", help="Number of Content Objects to Build", type=int, default=50000)
+    parser.add_argument("--courses", help="Number of Course Objects to Build", type=int, default=200)
+    parser.add_argument("--baseline", help="Path to Another blackboard.py to Compare Against (eg. an Older Release)")
+    return parser.parse_args()
+
+
+def content_data(index: int) -> dict:
+    """
+    Makes a Content Response Shaped Like the Learn API's Output
+
+    :param index: Used to Make Each Content Unique
+    :return: The Content JSON
+    """
+    return {
+        'id': f"_{index}_1",
+        'parentId': f"_{index // 20}_1",
+        'title': f"Week {index % 12}: Lecture Slides / Notes ({index})",
+        'body': "<p>Slides for this week's lecture.</p>",
+        'created': "2020-09-14T10:15:30.000Z",
+        'position': index % 20,
+        'hasChildren': index % 5 == 0,
+        'hasGradebookColumns': False,
+        'hasAssociatedGroups': False,
+        'availability': {
+            'available': "Yes",
+            'allowGuests': True,
+            'adaptiveRelease': {},
+        },
+        'contentHandler': {
+            'id': "resource/x-bb-file",
+            'file': {'fileName': f"slides-{index}.pdf"},
+        },
+        'links': [{'href': f"/ultra/courses/_1_1/outline/edit/document/_{index}_1", 'rel': "alternate",
+                   'title': "User Interface View", 'type': "text/html"}],
+    }
+
+
+def course_data(index: int) -> dict:
+    """
+    Makes a Course Response Shaped Like the Learn API's Output
+
+    :param index: Used to Make Each Course Unique
+    :return: The Course JSON
+    """
+    return {
+        'id': f"_{index}_1",
+        'uuid': f"{index:032x}",
+        'externalId': f"COMP{index}-2020",
+        'courseId': f"COMP{index}-2020",
+        'name': f"COMP{index}: Algorithms & Data Structures",
+        'created': "2020-06-01T08:00:00.000Z",
+        'modified': "2020-09-01T08:00:00.000Z",
+        'organization': False,
+        'ultraStatus': "Classic",
+        'allowGuests': False,
+        'closedComplete': False,
+        'availability': {'available': "Yes", 'duration': {'type': "Continuous"}},
+        'enrollment': {'type': "InstructorLed"},
+        'locale': {'force': False},
+    }
+
+
+def hydrate_content(content) -> None:
+    """
+    Reads Every Parsed Attribute of a Content, Which is What the Previous Eager Constructor Did Up Front
+
+    :param content: The Content to Read
+    """
+    (content.title_safe, content.created, content.availability, content.content_handler, content.links)
+
+
+def crawl_content(content) -> None:
+    """
+    Reads Only the Attributes the Crawler Uses
+
+    :param content: The Content to Read
+    """
+    (content.id, content.has_children, content.title_safe, content.content_handler.id)
+
+
+def measure(build: Callable[[], List]) -> Tuple[float, int, List]:
+    """
+    Runs a Builder and Records how Long it Took and how Much Memory Remains Allocated Afterwards
+
+    -----
+
+    The Builder is Run Twice as Tracing Allocations Slows it Down too Much to Time it at the Same Time
+
+    :param build: Makes and Returns the Objects to Measure
+    :return: The Seconds Taken, the Bytes Still Allocated and the Built Objects
+    """
+    gc.collect()
+    start = time.perf_counter()
+    objects = build()
+    elapsed = time.perf_counter() - start
+    del objects
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, allocated, objects
+
+
+def benchmark(name: str, module: ModuleType, contents: List[dict], courses: List[dict]) -> None:
+    """
+    Prints the Cost of Building the Given Responses with a Version of the Blackboard Module
+
+    :param name: The Label Printed Alongside the Results
+    :param module: The Blackboard Module to Build the Objects With
+    :param contents: The Content Responses to Build
+    :param courses: The Course Responses to Build
+    """
+    client = SimpleNamespace(base_path='.', use_manifest=False, manifest_backend='sqlite')
+    course = module.BlackBoardCourse(client, course_data(0))
+
+    def build_contents() -> List:
+        return [module.BlackBoardContent(course, data) for data in contents]
+
+    def build_courses() -> List:
+        return [module.BlackBoardCourse(client, data) for data in courses]
+
+    def crawl() -> List:
+        built = build_contents()
+        for content in built:
+            crawl_content(content)
+        return built
+
+    def hydrate() -> List:
+        built = build_contents()
+        for content in built:
+            hydrate_content(content)
+        return built
+
+    rows = [
+        ("courses", build_courses),
+        ("contents", build_contents),
+        ("contents + crawl", crawl),
+        ("contents + all", hydrate),
+    ]
+    for label, build in rows:
+        elapsed, allocated, objects = measure(build)
+        print("{:<10} {:<18} {:>9.3f}s {:>10.1f} MiB {:>8.0f} B/object".format(
+            name, label, elapsed, allocated / 2 ** 20, allocated / max(len(objects), 1)))
+        del objects
+
+
+def load_module(path: str) -> ModuleType:
+    """
+    Imports a Blackboard Module from a File Path Without Replacing the Current One
+
+    :param path: The Path to the Module's Source
+    :return: The Loaded Module
+    """
+    spec = importlib.util.spec_from_file_location("blackboard_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    args = get_arguments()
+    # Responses are Built Before Measuring so Only the Model Objects are Counted
+    contents = [content_data(i) for i in range(args.count)]
+    courses = [course_data(i) for i in range(args.courses)]
+    print("{:<10} {:<18} {:>10} {:>14} {:>17}".format("module", "workload", "time", "retained", "per object"))
+    if args.baseline:
+        benchmark("baseline", load_module(args.baseline), contents, courses)
+    benchmark("current", blackboard, contents, courses)
+
+
+if __name__ == '__main__':
+    main()
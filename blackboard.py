@@ -3,22 +3,44 @@ Blackboard Module Provides the Classes to Interact With the Blackboard Learn Pub
 """
 
 from __future__ import annotations
+import abc
 import os
 import re
+import errno
+import hashlib
+import shutil
 
 import browser_cookie3
 from http.cookiejar import CookieJar
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+import socket
 from concurrent import futures
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import xmltodict
-from urllib.parse import unquote
+from urllib.parse import quote, unquote, urlencode
 from colorama import Fore, init
-from typing import List, Tuple, Callable, Optional, Dict, Any
+from typing import List, Tuple, Callable, Optional, Dict, Any, Iterator
 import json
+import random
+import sqlite3
 import time
 import threading
+import weakref
+import collections
+from functools import partial
+from blackboardevents import event_bus, Message, Discovered, Started, Bytes, Finished, Failed
+from blackboardmetrics import observe_request, record_retry, queue_depth, endpoint_family, http_cache_total
+from blackboardprofile import profiler
+
+try:
+    import fcntl  # Only Used to Clone (Reflink) Files, Not Available on Windows
+except ImportError:
+    fcntl = None
 
 
 init()
@@ -116,27 +138,102 @@ class BlackBoardClient:
         :keyword site: The Website Link to the Base of the LMS
         :keyword institute: The Institute that hosts the LMS
         :keyword thread_count: The Maximum Number of Threads to Create when using Threaded Downloads
+        :keyword crawl_thread_count: The Maximum Number of Threads to Discover Course Content with (Defaults to
+        thread_count)
         :keyword save_location: The Local System Path to Save Any Downloaded Documents
         :keyword use_manifest: Enables/Disables the Process of Recording Downloaded Document Versions
+        :keyword manifest_backend: How the Manifest is Stored, Either 'sqlite' (Default) or 'json'
         :keyword backup_files: Enables/Disables the Process of Keeping Outdated Files when a Newer Version is Downloaded
+        :keyword deduplicate: Store Every Distinct File Once (by Content Hash) and Link it Wherever it is Attached
+        :keyword blob_location: Where the Deduplicated Files are Stored (Defaults to .blobs Within the save_location)
+        :keyword incremental: Skip Listing Content that hasn't Changed Since the Last Crawl (Requires the Manifest)
+        :keyword full_crawl_days: Days Between Full Crawls when Crawling Incrementally (0 Always Crawls Everything)
+        :keyword http_cache: Cache API Responses on Disk, Revalidating them with Conditional Requests
+        :keyword http_cache_location: Where the HTTP Cache is Kept (Defaults to .http-cache Within the save_location)
+        :keyword http_cache_size: The Most Bytes of Responses the HTTP Cache Keeps
+        :keyword http_cache_ttls: Seconds Cached Responses are Used Without Revalidating, by Endpoint Family
+        :keyword chunk_size: The Number of Bytes Held in Memory at Once (Per Worker) when Streaming a Download to Disk
+        :keyword segments: The Number of Byte Ranges Large Files are Split into and Fetched in Parallel (1 Disables)
+        :keyword segment_threshold: The Size in Bytes a File Must Reach Before it is Split into Segments
+        :keyword pool_size: The Maximum Number of Connections Kept Open to a Single Host (Defaults to the Total Number
+        of Download Connections and Crawl Threads)
+        :keyword pool_hosts: The Number of Hosts to Keep Connection Pools for (The Learn Site, File CDNs, etc.)
+        :keyword keep_alive: Enables/Disables TCP Keep-Alive on Pooled Connections
+        :keyword connect_timeout: Seconds to Wait when Opening a Connection
+        :keyword read_timeout: Seconds to Wait Between Bytes Received from the Server
+        :keyword max_requests: The Most Requests the Rate Controller will Allow in Flight at Once (Defaults to the
+        Connection Pool Size)
+        :keyword throttle_retries: How Many Times a Throttled (429/503) Request is Retried Before it Fails
+        :keyword metadata_retries: How Many Attempts a Listing (Metadata) Request Gets Before it Fails
+        :keyword download_retries: How Many Attempts a File Download Gets Before it Fails
+        """
+        self._configure(**kwargs)
+        self.session = requests.Session()
+        self._login_lock = threading.Lock()
+        self.thread_count = kwargs.get('thread_count', 4)
+        self.thread_pool = DownloadQueue(self.thread_count)
+        self.crawl_thread_count = kwargs.get('crawl_thread_count', None) or self.thread_count
+        self.crawl_pool = futures.ThreadPoolExecutor(max_workers=self.crawl_thread_count)
+        self.course_scheduler: Optional[CourseScheduler] = None
+        # Fetches the Next Page of Listings in the Background (Never Waits on Other Work so Can't Deadlock)
+        self.prefetch_pool = futures.ThreadPoolExecutor(max_workers=self.crawl_thread_count)
+        self.stop_event = threading.Event()  # Set to Interrupt Running Downloads (Leaving them Resumable)
+
+        self.segments = max(int(kwargs.get('segments', 1)), 1)
+        self.segment_threshold = int(kwargs.get('segment_threshold', 64 * 1024 * 1024))
+
+        # Every Download (and its Segments) and Crawl Thread Shares the Session, so Size its Pools to Match
+        self.http_adapter = PooledHTTPAdapter(
+            pool_size=int(kwargs.get('pool_size', None) or
+                          self.thread_count * self.segments + self.crawl_thread_count * 2),
+            pool_hosts=int(kwargs.get('pool_hosts', 10)),
+            keep_alive=kwargs.get('keep_alive', True))
+        self.session.mount("https://", self.http_adapter)
+        self.session.mount("http://", self.http_adapter)
+        self.timeout = (float(kwargs.get('connect_timeout', 10)), float(kwargs.get('read_timeout', 60)))
+        self.rate_controller = RateController(
+            max_concurrency=int(kwargs.get('max_requests', None) or self.http_adapter.max_connections),
+            initial_concurrency=self.thread_count + self.crawl_thread_count)
+        self._terms_lock = threading.Lock()
+        self.incremental = kwargs.get('incremental', False)
+        self.full_crawl_days = float(kwargs.get('full_crawl_days', 7))
+        self.http_cache = HTTPCache(
+            kwargs.get('http_cache_location', None) or os.path.join(self.base_path, '.http-cache'),
+            max_size=int(kwargs.get('http_cache_size', 64 * 1024 * 1024)),
+            ttls=kwargs.get('http_cache_ttls', None)) if kwargs.get('http_cache', False) else None
+
+    def _configure(self, **kwargs) -> None:
+        """
+        Sets the Options Shared by Every Client (Account, Storage and Retry Settings), but None of the Threads,
+        Pools or Sessions the Synchronous Client Sends its Requests with
+
+        :param kwargs: The Client Options (See __init__)
         """
         self.username = kwargs.get('username', None)
         self.__password = kwargs.get('password', None)
         self.site = kwargs.get('site', None)
-        self.session = requests.Session()
         self.user_id = None
         self.batch_uid = None
+        self.session_generation = 0  # Incremented Every Time the Session is Refreshed After Expiring
         if self.username is None or self.__password is None or self.site is None:
             raise Exception("Missing Username and/or Password and/or Site")
         self.institute = kwargs.get('institute', None)
         self.use_rest_api = True  # Can/Cannot Use The Learn Rest API
         self.api_version = self.LearnAPIVersion("0.0.0")
-        self.thread_pool = DownloadQueue(kwargs.get('thread_count', 4))
+        self.throttle_retries = int(kwargs.get('throttle_retries', 5))
+        self.metadata_retry = RetryPolicy(attempts=int(kwargs.get('metadata_retries', 4)), base_delay=0.5)
+        self.download_retry = RetryPolicy(attempts=int(kwargs.get('download_retries', 3)), base_delay=2.0)
+        self.retry_report = RetryReport()
         self.base_path = kwargs.get('save_location', '.')
         self.additional_courses = []
+        self.terms: Dict[str, Optional[dict]] = {}  # Term Records Already Looked Up, by ID
         self.use_manifest = kwargs.get('use_manifest', True)
+        self.manifest_backend = kwargs.get('manifest_backend', 'sqlite')
         self.backup_files = kwargs.get('backup_files', False)
         self.browser = kwargs.get('browser', None)
+        self.chunk_size = int(kwargs.get('chunk_size', 1024 * 1024))
+        self.blob_store = BlobStore(kwargs.get('blob_location', None) or os.path.join(self.base_path, '.blobs')) \
+            if kwargs.get('deduplicate', False) else None
 
     # XML
     def login(self) -> Tuple[bool, requests.Response]:
@@ -161,7 +258,7 @@ class BlackBoardClient:
 
         login = self.session.post(login_endpoint + "sslUserLogin", 
             data={'username': self.username, 'password': self.__password}, 
-            cookies=(cookieJar if cookieJar is not None else None))
+            cookies=(cookieJar if cookieJar is not None else None), timeout=self.timeout)
 
         if login.status_code == 200:
             response_xml = xmltodict.parse(login.text)['mobileresponse']
@@ -169,8 +266,14 @@ class BlackBoardClient:
                 self.use_rest_api = response_xml['@use_learn_rest_api']
                 self.api_version = self.LearnAPIVersion(response_xml['@learn_version'])
                 if self.browser:
-                    user = self.send_get_request(BlackBoardEndPoints.get_user_by_username(self.username)).json()
-                    self.user_id = user['results'][0]['id']
+                    # Sent Directly, as login() Runs Under reauthenticate()'s Lock and a 401 Here (Expired Browser
+                    # Cookies) Must Fail the Login Rather than Try to Log in Again
+                    user = self.session.get(self.site + BlackBoardEndPoints.get_user_by_username(self.username),
+                                            timeout=self.timeout)
+                    try:
+                        self.user_id = user.json()['results'][0]['id']
+                    except (ValueError, KeyError, IndexError, TypeError):  # Rejected or Malformed Response
+                        return False, user
                     self.batch_uid = None
                 else:
                     self.user_id = response_xml['@userid']
@@ -178,73 +281,183 @@ class BlackBoardClient:
                 return True, login
         return False, login
 
+    def reauthenticate(self, stale_generation: int) -> None:
+        """
+        Logs Back in After a Request was Rejected (401), Unless Another Thread has Already Done so
+
+        -----
+
+        Only One Thread Logs in at a Time. Threads Whose Requests Failed with the Same (Expired) Session Wait for it
+        and then Retry with the Refreshed Session Instead of Each Sending their Own Login
+
+        :param stale_generation: The session_generation at the Time the Rejected Request was Sent
+        """
+        with self._login_lock:
+            if self.session_generation == stale_generation:
+                self.login()
+                self.session_generation += 1
+
     class BBRequestException(Exception):
         """
         An Exception is Thrown When a Error Outbound Request Error Occurs when Contacting the API
         """
         pass
 
-    def send_get_request(self, endpoint: str, **kwargs) -> Optional[requests.Response]:
+    class ListingFailed(BBRequestException):
+        """
+        Raised by a Strict Listing When a Page Couldn't be Fetched, so a Partial Listing isn't Mistaken for a Whole One
+        """
+        pass
+
+    def send_get_request(self, endpoint: str, retry: Optional[RetryPolicy] = None, **kwargs) \
+            -> Optional[requests.Response]:
         """
         Sends a GET Request to the Endpoint Specified Using the BlackboardClient's Base Site and Handles any HTTP Errors
         that Occur
 
+        -----
+
+        Transient Failures (Dropped Connections, Timeouts and 500/502/504 Responses) are Retried with Backoff According
+        to the Retry Policy. Only Once it is Exhausted is a BBRequestException Raised (and Recorded in the Retry
+        Report). When the Client has an HTTP Cache, Requests that aren't Streamed (and Don't Set their Own Headers) are
+        Answered Through it
+
         :param endpoint: The API Path that the Client Should Take (Excluding the Base Path)
+        :param retry: The Retry Policy to Follow (Defaults to the Clients Metadata Policy)
         :param kwargs: The Keyword Args are the kwargs Passed to requests.get()
         :return: Returns the Response from the Blackboard Server if it was Successful
         """
+        if self.http_cache is None or kwargs.get('stream', False) or 'headers' in kwargs:
+            return self.__send_get_request(endpoint, retry, **kwargs)
+        return self.http_cache.fetch(
+            f"{self.username}@{self.site}{endpoint}", self.site + endpoint,
+            lambda headers: self.__send_get_request(endpoint, retry, headers=headers, **kwargs))
 
-        request = None
-        try:
-            request = self.session.get(self.site + endpoint, **kwargs)
-            if request.status_code == 401:  # Unauthorised, Attempt to Log Back In
-                self.login()
-                request = self.session.get(self.site + endpoint, **kwargs)
-            elif request.status_code == 400 or request.status_code == 403 or request.status_code == 404:
-                # Bad Request | Forbidden | Not Found
-                # Most of the Time These Will Be Triggered Due to Just Spamming the API Trying to Find Stuff
-                raise BlackBoardClient.RestException(request)
+    def __send_get_request(self, endpoint: str, retry: Optional[RetryPolicy] = None, **kwargs) \
+            -> Optional[requests.Response]:
+        """
+        Sends a GET Request, Retrying Transient Failures (See send_get_request)
 
-        # If I want to Handle These
-        except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError, requests.exceptions.Timeout,
-                requests.exceptions.TooManyRedirects):
-            raise BlackBoardClient.BBRequestException()
-        except BlackBoardClient.RestException as e:
-            _println(f"{Fore.RED}{str(e)}")
+        :param endpoint: The API Path that the Client Should Take (Excluding the Base Path)
+        :param retry: The Retry Policy to Follow (Defaults to the Clients Metadata Policy)
+        :param kwargs: The Keyword Args are the kwargs Passed to requests.get()
+        :return: Returns the Response from the Blackboard Server if it was Successful
+        """
+        request = None
+        policy = retry or self.metadata_retry
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(policy.attempts):
+            try:
+                generation = self.session_generation
+                request = self.__throttled_get(endpoint, policy.report, **kwargs)
+                if request.status_code == 401:  # Unauthorised, Attempt to Log Back In
+                    request.close()
+                    self.reauthenticate(generation)
+                    request = self.__throttled_get(endpoint, policy.report, **kwargs)
+                if request.status_code in RetryPolicy.TRANSIENT_STATUS_CODES:
+                    request.close()
+                    if attempt + 1 >= policy.attempts:
+                        if policy.report:
+                            self.retry_report.failed(endpoint, f"Status {request.status_code}")
+                        raise BlackBoardClient.BBRequestException(f"Status {request.status_code}")
+                    self.retry_report.retried(endpoint, f"Status {request.status_code}")
+                    record_retry(endpoint, 'transient')
+                    time.sleep(policy.delay(attempt))
+                    continue
+                if request.status_code == 400 or request.status_code == 403 or request.status_code == 404:
+                    # Bad Request | Forbidden | Not Found
+                    # Most of the Time These Will Be Triggered Due to Just Spamming the API Trying to Find Stuff
+                    raise BlackBoardClient.RestException(request)
+                return request
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:  # Transient
+                if attempt + 1 >= policy.attempts:
+                    if policy.report:
+                        self.retry_report.failed(endpoint, e)
+                    raise BlackBoardClient.BBRequestException(str(e) or type(e).__name__)
+                self.retry_report.retried(endpoint, e)
+                record_retry(endpoint, 'transient')
+                time.sleep(policy.delay(attempt))
+            except (requests.exceptions.HTTPError, requests.exceptions.TooManyRedirects) as e:
+                if policy.report:
+                    self.retry_report.failed(endpoint, e)
+                raise BlackBoardClient.BBRequestException(str(e) or type(e).__name__)
+            except BlackBoardClient.BBRequestException:  # Throttled Past the Throttle Retries (Already Recorded)
+                raise
+            except BlackBoardClient.RestException as e:
+                _println(f"{Fore.RED}{str(e)}")
+                return request
         return request
 
-    def courses(self, existing_list: List[BlackBoardCourse] = None, endpoint: str = None) -> List[BlackBoardCourse]:
+    def __throttled_get(self, endpoint: str, report: bool = True, **kwargs) -> requests.Response:
         """
-        Attempts to get All the Courses that the BlackboardClient (User) has Access to.
+        Sends a GET Request Once the Rate Controller Allows it, Waiting Out and Retrying Throttling Responses
 
-        -----
+        :param endpoint: The API Path that the Client Should Take (Excluding the Base Path)
+        :param report: Record Running Out of Throttle Retries in the Retry Report
+        :param kwargs: The Keyword Args are the kwargs Passed to requests.get()
+        :return: The First Response that wasn't Throttled
+        :raises BlackBoardClient.BBRequestException: If Every Throttle Retry was Throttled Too
+        """
+        for _ in range(self.throttle_retries + 1):
+            self.rate_controller.acquire()
+            response = None
+            started = time.perf_counter()
+            hold = False
+            try:
+                with profiler.phase('request'):
+                    response = self.session.get(self.site + endpoint, **kwargs)
+                # A Streamed Body is Still in Flight, so its Slot is Held Until the Response is Closed
+                hold = kwargs.get('stream', False) and \
+                    response.status_code not in RateController.THROTTLING_STATUS_CODES
+            except Exception as e:
+                observe_request(endpoint, e, time.perf_counter() - started)
+                raise
+            finally:
+                self.rate_controller.release(response, free_slot=not hold)
+            if hold:
+                self.rate_controller.hold_until_closed(response)
+            observe_request(endpoint, response.status_code, time.perf_counter() - started)
+            if response.status_code not in RateController.THROTTLING_STATUS_CODES:
+                return response
+            response.close()
+            record_retry(endpoint, 'throttled')
+            _println(f"{Fore.YELLOW}[THROTTLED] {response.status_code} From {endpoint} "
+                     f"(Limiting to {self.rate_controller.concurrency} Concurrent Requests)")
+        error = f"Throttled {self.throttle_retries + 1} Time(s), Last With Status {response.status_code} " \
+                f"(Retry-After: {response.headers.get('Retry-After', None) or 'None'})"
+        if report:
+            self.retry_report.failed(endpoint, error)
+        raise BlackBoardClient.BBRequestException(error)
+
+    def courses(self) -> List[BlackBoardCourse]:
+        """
+        Attempts to get All the Courses that the BlackboardClient (User) has Access to.
 
-        Is a Recursive Function so when called existing_list and endpoint are not Required
+        :return: A List Containing All the Blackboard Courses the Client Access to
+        """
+        return list(self.iter_courses())
 
+    def iter_courses(self) -> Iterator[BlackBoardCourse]:
+        """
+        Lazily Yields All the Courses that the BlackboardClient (User) has Access to, Page by Page
 
-        :param existing_list: The List of Already Identified Courses
-        :param endpoint: The Endpoint (API Path) to Send the Next Request to (due to paging)
-        :return: A List Containing All the Blackboard Courses the Client Access to
+        :return: An Iterator over the Blackboard Courses the Client Access to
         """
-        if existing_list is None:
-            existing_list = list()
-        if endpoint is None:
-            endpoint = BlackBoardEndPoints.get_user_courses(self.user_id)
         if self.use_rest_api:
-            try:
-                request = self.send_get_request(endpoint)
-                course_data = request.json()
-                if "results" in course_data:
-                    for course in course_data["results"]:
-                        existing_list.append(BlackBoardCourse.generate_course(self, course['courseId']))
-                    if "paging" in course_data:
-                        return self.courses(existing_list, course_data['paging']['nextPage'])
-                    else:
-                        existing_list.extend(self.additional_courses)
-            except ValueError:  # JSON Response Malformed
-                _println("{}[ERROR] Failed to Decode JSON Response From Endpoint: {}", Fore.RED, self.site + endpoint)
-            except BlackBoardClient.BBRequestException:  # Request Error
-                pass
+            # Ask for the Course Records to be Embedded in the Membership Listing, Only Looking Up (in Concurrent
+            # Batches) the Courses the Server Didn't Embed
+            unresolved = []
+            for enrollment in self.paginate(BlackBoardEndPoints.get_user_courses(self.user_id, expand=['course'])):
+                if isinstance(enrollment.get('course', None), dict):
+                    yield from self.__valid_courses([BlackBoardCourse(self, enrollment['course'])])
+                else:
+                    unresolved.append(enrollment['courseId'])
+                    if len(unresolved) >= self.crawl_thread_count:
+                        yield from self.__resolve_courses(unresolved)
+                        unresolved = []
+            yield from self.__resolve_courses(unresolved)
+            yield from self.additional_courses
         # Remnants of XML Implementation.
         # else:
         #     course_data = xmltodict.parse(self.session.get(
@@ -254,11 +467,117 @@ class BlackBoardClient:
         #             existing_list.append(BlackBoardCourseXML(self, data=course))
         #         existing_list.extend(self.additional_courses)
 
-        # Verify Courses -- May Not Be Needed
-        for course in existing_list:
-            if course.id is None or course.name is None:
-                existing_list.remove(course)
-        return existing_list
+    def __resolve_courses(self, course_ids: List[str]) -> Iterator[BlackBoardCourse]:
+        """
+        Looks Up a Batch of Courses Concurrently on the Crawl Pool
+
+        :param course_ids: The IDs of the Courses to Look Up
+        :return: An Iterator over the Found Courses (In the Order Provided)
+        """
+        return self.__valid_courses(self.crawl_pool.map(partial(BlackBoardCourse.generate_course, self), course_ids))
+
+    @staticmethod
+    def __valid_courses(courses) -> Iterator[BlackBoardCourse]:
+        """
+        Filters Out Courses that Failed to Load or are Missing Required Attributes
+
+        :param courses: The Courses to Verify
+        :return: An Iterator over the Valid Courses
+        """
+        for course in courses:
+            if course is not None and course.id is not None and course.name is not None:
+                yield course
+
+    def paginate(self, endpoint: str, strict: bool = False) -> Iterator[dict]:
+        """
+        Yields Every Result of a Paged Listing Endpoint as Each Page Arrives
+
+        -----
+
+        While the Results of One Page are Being Processed the Next Page is Already Being Fetched in the Background, so
+        Only About One Page is Held in Memory at Once
+
+        :param endpoint: The First Page of the Listing
+        :param strict: Raise ListingFailed if a Page Fails, Rather than Ending the Listing Early
+        :return: An Iterator over the Raw Results of Each Page
+        """
+        next_page = self.prefetch_pool.submit(self.__fetch_page, endpoint, strict)
+        while next_page is not None:
+            page = next_page.result()
+            if page is None:
+                return
+            next_endpoint = page.get("paging", {}).get("nextPage", None)
+            next_page = self.prefetch_pool.submit(self.__fetch_page, next_endpoint, strict) if next_endpoint else None
+            yield from page.get("results", [])
+
+    def __fetch_page(self, endpoint: str, strict: bool = False) -> Optional[dict]:
+        """
+        Fetches a Single Page of a Paged Listing
+
+        :param endpoint: The Endpoint (API Path) of the Page
+        :param strict: Raise ListingFailed if the Page Couldn't be Fetched
+        :return: The Decoded Page (None if the Request Failed)
+        """
+        try:
+            page = self.send_get_request(endpoint).json()
+            if isinstance(page, dict) and (not strict or 'results' in page):  # Error Responses Still Decode
+                return page
+        except ValueError:  # JSON Response Malformed
+            _println("{}[ERROR] Failed to Decode JSON Response From Endpoint: {}", Fore.RED, self.site + endpoint)
+        except BlackBoardClient.BBRequestException:  # Request Error
+            pass
+        if strict:
+            raise BlackBoardClient.ListingFailed(f"Failed to List {endpoint}")
+        return None
+
+    def download_courses(self, courses: List[BlackBoardCourse], save_location: str) -> None:
+        """
+        Crawls and Downloads Several Courses at Once, Sharing the Clients crawl_thread_count and thread_count Workers
+        Fairly Between Them
+
+        :param courses: The Courses to Download
+        :param save_location: The Base Location to Save All Attachment Downloads
+        """
+        self.course_scheduler = CourseScheduler(self.thread_count, self.crawl_thread_count)
+        self.course_scheduler.run(courses, save_location)
+
+    def find_courses(self, identifiers: List[str]) -> List[BlackBoardCourse]:
+        """
+        Looks Up Only the Provided Courses (Concurrently on the Crawl Pool) Rather than Listing Every Enrollment
+
+        :param identifiers: The Course Identifiers (Primary IDs, or externalId:, courseId: or uuid: Prefixed IDs)
+        :return: The Found Courses in the Order Provided, Each Course at Most Once
+        """
+        keys = [BlackBoardCourse.course_key(identifier) for identifier in identifiers]
+        courses, found = [], set()
+        for identifier, course in zip(identifiers, self.crawl_pool.map(
+                partial(BlackBoardCourse.generate_course, self), keys)):
+            if course is None or course.id is None or course.name is None:
+                _println("{}[WARNING] Course Not Found: {}", Fore.YELLOW, identifier)
+            elif course.id not in found:
+                found.add(course.id)
+                courses.append(course)
+        return courses
+
+    def term(self, term_id: str) -> Optional[dict]:
+        """
+        Looks Up a Term Record, Each Term Only Once
+
+        :param term_id: The ID of the Term
+        :return: The Term's JSON Record (None if it Couldn't be Fetched)
+        """
+        with self._terms_lock:
+            if term_id in self.terms:
+                return self.terms[term_id]
+        try:
+            term = self.send_get_request(BlackBoardEndPoints.get_term(term_id)).json()
+        except (ValueError, TypeError, BlackBoardClient.BBRequestException):  # Malformed, None Type or Request Error
+            term = None
+        if not isinstance(term, dict) or 'id' not in term:  # Error Responses Still Decode
+            term = None
+        with self._terms_lock:
+            self.terms[term_id] = term
+        return term
 
     def add_course(self, course_id: str) -> None:
         """
@@ -368,15 +687,515 @@ class BlackBoardClient:
         """
         Shuts down the Download Queue that is Managing Threaded Downloads
         """
-        _println(f"{Fore.LIGHTCYAN_EX}SIGINT Received Please Wait For The Currently Running Downloads to Complete....")
+        _println(f"{Fore.LIGHTCYAN_EX}SIGINT Received Please Wait While The Running Downloads Save Their Progress....")
+        self.stop_event.set()
+        self.crawl_pool.shutdown(wait=False, cancel_futures=True)
+        if self.course_scheduler is not None:
+            self.course_scheduler.shutdown()
         self.thread_pool.shutdown(wait=True, cancel_futures=True)
 
+    def flush(self) -> None:
+        """
+        Closes the On Disk Stores the Client has Opened (They are Reopened if the Client is Used Again)
+        """
+        if self.blob_store is not None:
+            self.blob_store.flush()
+        if self.http_cache is not None:
+            self.http_cache.flush()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTP Adapter Whose Connection Pools are Sized to the Clients Workers
+
+    -----
+
+    Connections are Kept Alive Between Requests and the Adapter Records How Often a Connection had to be Opened
+    Compared to How Many Requests were Sent, so Connection Reuse Can be Monitored
+    """
+
+    class Statistics:
+        """
+        Thread Safe Counters Describing the Adapters Connection Usage
+        """
+
+        def __init__(self):
+            self._lock = threading.Lock()
+            self.requests = 0
+            self.connections_opened = 0
+
+        def request_sent(self) -> None:
+            with self._lock:
+                self.requests += 1
+
+        def connection_opened(self) -> None:
+            with self._lock:
+                self.connections_opened += 1
+
+        @property
+        def connections_reused(self) -> int:
+            return max(self.requests - self.connections_opened, 0)
+
+        def __str__(self):
+            return "Requests: {} | Connections Opened: {} | Connections Reused: {}".format(
+                self.requests, self.connections_opened, self.connections_reused)
+
+    def __init__(self, pool_size: int, pool_hosts: int = 10, keep_alive: bool = True):
+        """
+        :param pool_size: The Maximum Number of Connections Kept Open to a Single Host
+        :param pool_hosts: The Number of Hosts to Keep Connection Pools for
+        :param keep_alive: Enables/Disables TCP Keep-Alive on Pooled Connections
+        """
+        self.stats = PooledHTTPAdapter.Statistics()
+        self.keep_alive = keep_alive
+        self.max_connections = pool_size
+        super().__init__(pool_connections=pool_hosts, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive:
+            socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            if hasattr(socket, "TCP_KEEPIDLE"):  # Not Available on Every Platform
+                socket_options += [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+                                   (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)]
+            pool_kwargs['socket_options'] = socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self.__counting_pool(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, **kwargs):
+        self.stats.request_sent()
+        return super().send(request, **kwargs)
+
+    def __counting_pool(self, pool_class: type) -> type:
+        """
+        Wraps a urllib3 Connection Pool Class so New Connections are Recorded in the Adapters Statistics
+
+        :param pool_class: The Connection Pool Class to Wrap
+        :return: The Wrapped Connection Pool Class
+        """
+        stats = self.stats
+
+        class CountingConnectionPool(pool_class):
+            def _new_conn(self):
+                stats.connection_opened()
+                return super()._new_conn()
+
+        return CountingConnectionPool
+
+
+class RateController:
+    """
+    Limits How Many Requests the Client has in Flight at Once, Adapting the Limit to the Server (AIMD)
+
+    -----
+
+    Every Healthy Response Raises the Limit by a Fraction so it Grows by One Request per Round of Responses (Additive
+    Increase). A Throttling Response (429/503) Halves the Limit (Multiplicative Decrease) and Pauses Every Request for
+    the Servers Retry-After, so the Client Runs as Fast as Each Institute Allows Without Being Blocked
+    """
+
+    THROTTLING_STATUS_CODES = (429, 503)
+    DEFAULT_BACKOFF = 2.0  # Seconds to Pause when the Server Doesn't Provide a Retry-After
+
+    def __init__(self, max_concurrency: int, initial_concurrency: Optional[int] = None, min_concurrency: int = 1):
+        """
+        :param max_concurrency: The Highest the Limit Can Grow to
+        :param initial_concurrency: The Limit to Start at (Defaults to max_concurrency)
+        :param min_concurrency: The Lowest the Limit Can Shrink to
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = max(min(min_concurrency, self.max_concurrency), 1)
+        self.limit = float(min(initial_concurrency or self.max_concurrency, self.max_concurrency))
+        self.active = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        self._held: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # Streamed Responses Holding a Slot
+
+    @property
+    def concurrency(self) -> int:
+        """
+        :return: The Current Number of Requests Allowed in Flight
+        """
+        return max(int(self.limit), self.min_concurrency)
+
+    def acquire(self) -> None:
+        """
+        Blocks Until Another Request is Allowed to be Sent
+        """
+        with self._condition:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self.active < self.concurrency:
+                    self.active += 1
+                    return
+                else:
+                    self._condition.wait()
+
+    def release(self, response: Optional[requests.Response], free_slot: bool = True) -> None:
+        """
+        Releases a Request Slot, Adjusting the Limit Based on the Response
+
+        :param response: The Response Received (None if the Request Failed Before a Response Arrived)
+        :param free_slot: Free the Slot Now (False When the Body is Still Being Streamed, See hold_until_closed)
+        """
+        with self._condition:
+            if free_slot:
+                self.active -= 1
+            if response is not None and response.status_code in RateController.THROTTLING_STATUS_CODES:
+                self.throttled += 1
+                now = time.monotonic()
+                if now >= self._paused_until:  # Only Back Off Once per Throttling Event
+                    self.limit = max(self.limit / 2, self.min_concurrency)
+                retry_after = _parse_retry_after(response.headers.get('Retry-After', None))
+                self._paused_until = max(self._paused_until,
+                                         now + (retry_after if retry_after is not None else
+                                                RateController.DEFAULT_BACKOFF))
+            elif response is not None and response.status_code < 500:
+                self.limit = min(self.limit + 1 / self.limit, self.max_concurrency)
+            self._condition.notify_all()
+
+    def hold_until_closed(self, response: requests.Response) -> None:
+        """
+        Keeps a Streamed Response's Slot Until the Response is Closed (or Garbage Collected, if it Never is)
+
+        :param response: The Streamed Response, Already Passed to release with free_slot=False
+        """
+        free = self._held[response] = weakref.finalize(response, self.__free)  # Runs at Most Once
+        # Only a Weak Reference Back to the Response, so Dropping it Unclosed Frees the Slot Straight Away Rather
+        # than Once the Cyclic Garbage Collector Happens to Run
+        response.close = partial(RateController._close_and_free, weakref.ref(response), free)
+
+    def idle(self, response: requests.Response) -> None:
+        """
+        Frees the Slot of a Streamed Response that is Left Open but Unread (eg. While its File is Fetched in Segments)
+
+        :param response: The Streamed Response
+        """
+        free = self._held.get(response, None)
+        if free is not None:
+            free()
+
+    def __free(self) -> None:
+        with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    @staticmethod
+    def _close_and_free(response_ref: weakref.ref, free: weakref.finalize) -> None:
+        """
+        Replaces the close() of a Held Response, Closing it and then Freeing its Slot
+
+        :param response_ref: A Weak Reference to the Response
+        :param free: The Finalizer that Frees the Responses Slot
+        """
+        response = response_ref()
+        try:
+            if response is not None:
+                requests.Response.close(response)
+        finally:
+            free()
+
+
+class RetryPolicy:
+    """
+    Describes How Many Times a Transiently Failing Request is Attempted and How Long to Wait Between Attempts
+
+    -----
+
+    Waits Follow a Capped Exponential Backoff with Full Jitter, so Threads that Failed Together Don't Retry Together
+    """
+
+    TRANSIENT_STATUS_CODES = (500, 502, 504)
+
+    def __init__(self, attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0, report: bool = True):
+        """
+        :param attempts: The Total Number of Attempts (Including the First)
+        :param base_delay: The Maximum Wait Before the Second Attempt (Doubled for Each Attempt After)
+        :param max_delay: The Cap on the Wait Between Attempts
+        :param report: Record Exhausted Attempts in the Retry Report (Off When the Caller Retries and Reports Itself)
+        """
+        self.attempts = max(attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.report = report
+
+    @staticmethod
+    def once() -> RetryPolicy:
+        """
+        :return: A Single Attempt Policy, for Requests Whose Caller Retries (and Reports) the Whole Operation
+        """
+        return RetryPolicy(attempts=1, report=False)
+
+    def delay(self, attempt: int) -> float:
+        """
+        :param attempt: The (Zero Based) Attempt that just Failed
+        :return: The Number of Seconds to Wait Before the Next Attempt
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryReport:
+    """
+    Records What was Retried and What Finally Failed During a Run so it Can be Summarised at the End
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries: Dict[str, int] = collections.Counter()
+        self.failures: Dict[str, str] = {}
+
+    def retried(self, target: str, error: Any) -> None:
+        """
+        :param target: The Endpoint or File that was Retried
+        :param error: What Went Wrong
+        """
+        with self._lock:
+            self.retries[target] += 1
+
+    def failed(self, target: str, error: Any) -> None:
+        """
+        :param target: The Endpoint or File that Ran Out of Attempts
+        :param error: What Went Wrong on the Final Attempt
+        """
+        with self._lock:
+            self.failures[target] = str(error) or type(error).__name__
+
+    def summary(self) -> str:
+        """
+        :return: A Readable Summary of the Retries and Failures (Empty if there were None)
+        """
+        with self._lock:
+            if not self.retries and not self.failures:
+                return ''
+            lines = ["Retried {} Request(s) {} Time(s) in Total, {} Finally Failed".format(
+                len(self.retries), sum(self.retries.values()), len(self.failures))]
+            lines.extend(f"[FAILED] {target}: {error}" for target, error in self.failures.items())
+        return '\n'.join(lines)
+
+
+def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After Header, which is Either a Number of Seconds or an HTTP Date
+
+    :param retry_after: The Header Value
+    :return: The Number of Seconds to Wait (None if Not Provided or Invalid)
+    """
+    if not retry_after:
+        return None
+    if retry_after.strip().isdigit():
+        return float(retry_after.strip())
+    try:
+        return max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPCache:
+    """
+    An On Disk Cache of API (JSON) Responses that are Revalidated with Conditional Requests
+
+    -----
+
+    Responses are Kept in an SQLite Database Along with their ETag and Last-Modified Validators. A Cached Response
+    Younger than the Time to Live of its Endpoint Family is Served Without a Request, an Older One is Revalidated
+    (If-None-Match/If-Modified-Since) and Served from Disk when the Server Answers 304. Once the Stored Bodies Exceed
+    max_size the Least Recently Used Responses are Evicted. When Responses are Used is Only Written in Batches (and
+    Before Evicting), so Serving a Fresh Response Never Writes to the Database
+    """
+
+    # Seconds a Response is Served Without Revalidating, by Endpoint Family (See blackboardmetrics.endpoint_family)
+    DEFAULT_TTLS = {'courses': 300, 'contents': 60, 'children': 60, 'attachments': 60, 'other': 0}
+    ACCESS_BATCH = 256  # Uses Remembered Before they are Written
+
+    class Entry:
+        """
+        A Cached Response
+        """
+
+        __slots__ = ('headers', 'body', 'stored')
+
+        def __init__(self, headers: Dict[str, str], body: bytes, stored: float):
+            self.headers = headers
+            self.body = body
+            self.stored = stored
+
+        def validators(self) -> Dict[str, str]:
+            """
+            :return: The Conditional Request Headers to Revalidate the Response With
+            """
+            validators = {}
+            if 'ETag' in self.headers:
+                validators['If-None-Match'] = self.headers['ETag']
+            if 'Last-Modified' in self.headers:
+                validators['If-Modified-Since'] = self.headers['Last-Modified']
+            return validators
+
+        def response(self, url: str) -> requests.Response:
+            """
+            Rebuilds the Response
+
+            :param url: The URL the Response was for
+            :return: A Complete (Already Read) Response
+            """
+            response = requests.Response()
+            response.status_code = 200
+            response.reason = "OK"
+            response.url = url
+            response.headers = CaseInsensitiveDict(self.headers)
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            response._content = self.body
+            response._content_consumed = True
+            return response
+
+    def __init__(self, location: str, max_size: int = 64 * 1024 * 1024, ttls: Optional[Dict[str, float]] = None):
+        """
+        :param location: The Directory the Cache is Kept in
+        :param max_size: The Most Bytes of Response Bodies to Keep
+        :param ttls: Seconds Responses are Served Without Revalidating, by Endpoint Family (Merged Over DEFAULT_TTLS)
+        """
+        self.location = location
+        self.max_size = max_size
+        self.ttls = dict(HTTPCache.DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._size = 0
+        self._accessed: Dict[str, float] = {}  # When Responses were Last Used, Not Yet Written
+
+    def fetch(self, key: str, url: str, send: Callable[[Dict[str, str]], Optional[requests.Response]]) \
+            -> Optional[requests.Response]:
+        """
+        Answers a GET Request from the Cache Where Possible
+
+        :param key: Identifies the Request (Including Who it was Made as)
+        :param url: The URL Requested
+        :param send: Sends the Request with the Given Extra (Conditional) Headers
+        :return: The Cached, Revalidated or Newly Fetched Response
+        """
+        family = endpoint_family(url)
+        entry = self.__get(key)
+        if entry is not None and time.time() - entry.stored < self.ttls.get(family, 0):
+            http_cache_total.inc(endpoint=family, result='hit')
+            return entry.response(url)
+        response = send(entry.validators() if entry is not None else {})
+        if response is None:
+            return None
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.__refresh(key)
+            http_cache_total.inc(endpoint=family, result='revalidated')
+            return entry.response(url)
+        http_cache_total.inc(endpoint=family, result='miss')
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', ''):
+            self.__put(key, dict(response.headers), response.content)
+        return response
+
+    def flush(self) -> None:
+        """
+        Writes When Responses were Last Used and Closes the Database (it is Reopened if the Cache is Used Again)
+        """
+        with self._lock:
+            if self._connection is not None:
+                self.__write_accessed(self._connection)
+                self._connection.close()
+                self._connection = None
+
+    def __get(self, key: str) -> Optional[HTTPCache.Entry]:
+        with self._lock:
+            connection = self.__connect()
+            row = connection.execute("SELECT headers, body, stored FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= HTTPCache.ACCESS_BATCH:
+                self.__write_accessed(connection)
+        return HTTPCache.Entry(json.loads(row[0]), row[1], row[2])
+
+    def __write_accessed(self, connection: sqlite3.Connection) -> None:
+        """
+        Writes the Remembered Uses of Responses in a Single Transaction. Must be Called Holding self._lock
+        """
+        if self._accessed:
+            with connection:
+                connection.executemany("UPDATE responses SET accessed = ? WHERE key = ?",
+                                       [(accessed, key) for key, accessed in self._accessed.items()])
+            self._accessed.clear()
+
+    def __refresh(self, key: str) -> None:
+        """
+        Restarts the Time to Live of a Response the Server has Confirmed is Still Current
+        """
+        with self._lock:
+            connection = self.__connect()
+            with connection:
+                connection.execute("UPDATE responses SET stored = ? WHERE key = ?", (time.time(), key))
+
+    def __put(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Stores a Response, Evicting the Least Recently Used Responses Once the Cache is Over its Size
+        """
+        if len(body) > self.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            connection = self.__connect()
+            self._accessed.pop(key, None)
+            self.__write_accessed(connection)  # So the Least Recently Used Responses are the Ones Evicted
+            with connection:
+                previous = connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                connection.execute("INSERT OR REPLACE INTO responses (key, headers, body, size, stored, accessed) "
+                                   "VALUES (?, ?, ?, ?, ?, ?)", (key, json.dumps(headers), body, len(body), now, now))
+                self._size += len(body) - (previous[0] if previous is not None else 0)
+                while self._size > self.max_size:
+                    rows = connection.execute("SELECT key, size FROM responses WHERE key != ? ORDER BY accessed "
+                                              "LIMIT 64", (key,)).fetchall()
+                    if not rows:
+                        break
+                    connection.executemany("DELETE FROM responses WHERE key = ?", [(row[0],) for row in rows])
+                    self._size -= sum(row[1] for row in rows)
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens (and if Required Creates) the Database
+
+        :return: The Database Connection
+        """
+        if self._connection is None:
+            os.makedirs(self.location, exist_ok=True)
+            # Shared Between the Crawl Threads, Access is Serialised by self._lock
+            self._connection = sqlite3.connect(os.path.join(self.location, "responses.db"), check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, headers TEXT NOT NULL, "
+                    "body BLOB NOT NULL, size INTEGER NOT NULL, stored REAL NOT NULL, accessed REAL NOT NULL)")
+                self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._connection
+
 
 class BlackBoardEndPoints:
     """
     A Static Helper Class that Formats the public LearnAPI Paths and Routes
     """
 
+    @staticmethod
+    def _query(path: str, **params: Optional[List[str]]) -> str:
+        """
+        Appends the Provided (Comma Separated) Query Parameters to a Path, Skipping Any that aren't Set
+
+        :param path: The API Path
+        :param params: The Query Parameters
+        :return: The API Path Including its Query String
+        """
+        query = urlencode({key: ','.join(value) for key, value in params.items() if value}, safe=',')
+        return f"{path}?{query}" if query else path
+
     @staticmethod
     def get_course_children(course_id: str) -> str:
         """
@@ -388,24 +1207,26 @@ class BlackBoardEndPoints:
         return f"/learn/api/public/v1/courses/{course_id}/children"
 
     @staticmethod
-    def get_course(course_id: str) -> str:
+    def get_course(course_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Course (V2 Path)
 
         :param course_id: The Course ID that is to be Formatted
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to Access the Provided Course
         """
-        return f"/learn/api/public/v2/courses/{course_id}"
+        return BlackBoardEndPoints._query(f"/learn/api/public/v2/courses/{course_id}", fields=fields)
 
     @staticmethod
-    def get_course_v1(course_id: str) -> str:
+    def get_course_v1(course_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Course (V1 Path)
 
         :param course_id: The Course ID that is to be Formatted
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to Access the Provided Course
         """
-        return f"/learn/api/public/v1/courses/{course_id}"
+        return BlackBoardEndPoints._query(f"/learn/api/public/v1/courses/{course_id}", fields=fields)
 
     @staticmethod
     def get_child_course(course_id: str, child_course_id: str) -> str:
@@ -428,25 +1249,38 @@ class BlackBoardEndPoints:
         return f"/learn/api/public/v1/users?userName={username}"
 
     @staticmethod
-    def get_user_courses(user_id: str) -> str:
+    def get_term(term_id: str) -> str:
+        """
+        Returns the Desired Path for a Term
+
+        :param term_id: The Term ID that is to be Formatted
+        :return: A String that has the required API Path to Access the Provided Term
+        """
+        return f"/learn/api/public/v1/terms/{term_id}"
+
+    @staticmethod
+    def get_user_courses(user_id: str, expand: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a All of a Users Registered Courses
 
         :param user_id: The User ID that is to be Formatted
+        :param expand: The Related Objects to Embed in Each Membership (eg. ['course'])
         :return: A String that has the required API Path to See All of a Users Registered Courses
         """
-        return f"/learn/api/public/v1/users/{user_id}/courses"
+        return BlackBoardEndPoints._query(f"/learn/api/public/v1/users/{user_id}/courses", expand=expand)
 
     @staticmethod
-    def get_file_attachments(course_id: str, content_id: str) -> str:
+    def get_file_attachments(course_id: str, content_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Contents Attachment List
 
         :param course_id: The Course ID that is to be Formatted
         :param content_id: The Content ID that is to be
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to Preview the Attachments of the Provided Course and Content
         """
-        return f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}/attachments"
+        return BlackBoardEndPoints._query(
+            f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}/attachments", fields=fields)
 
     @staticmethod
     def get_file_attachment(course_id: str, content_id: str, attachment_id: str) -> str:
@@ -473,43 +1307,87 @@ class BlackBoardEndPoints:
         return f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}/attachments/{attachment_id}/download"
 
     @staticmethod
-    def get_contents(course_id: str) -> str:
+    def get_contents(course_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Courses Contents
 
         :param course_id: The Course ID that is to be Formatted
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to Access a Courses Contents
         """
-        return f"/learn/api/public/v1/courses/{course_id}/contents"
+        return BlackBoardEndPoints._query(f"/learn/api/public/v1/courses/{course_id}/contents", fields=fields)
 
     @staticmethod
-    def get_content(course_id: str, content_id: str) -> str:
+    def get_content(course_id: str, content_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Specific Courses Content Information
 
         :param course_id: The Course ID that is to be Formatted
         :param content_id: The Content ID that is to be Formatted
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to Access a Specific Courses Content Information
         """
-        return f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}"
+        return BlackBoardEndPoints._query(
+            f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}", fields=fields)
 
     @staticmethod
-    def get_content_children(course_id: str, content_id: str) -> str:
+    def get_content_children(course_id: str, content_id: str, fields: Optional[List[str]] = None) -> str:
         """
         Returns the Desired Path for a Contents Child Content
 
         :param course_id: The Course ID that is to be Formatted
         :param content_id: The Content ID that is to be Formatted
+        :param fields: The Only Fields to Include in the Response (All Fields if None)
         :return: A String that has the required API Path to a Contents Child Content
         """
-        return f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}/children"
+        return BlackBoardEndPoints._query(
+            f"/learn/api/public/v1/courses/{course_id}/contents/{content_id}/children", fields=fields)
+
+
+class _LazyAttribute:
+    """
+    Computes an Attribute the First Time it is Read and Caches it in the Instance's Matching Underscored Slot
+
+    -----
+
+    Works like functools.cached_property but for Classes that Define __slots__ and so have no __dict__,
+    the Owning Class Must List the "_<name>" Slot
+    """
+
+    def __init__(self, compute: Callable[[Any], Any]):
+        """
+        :param compute: The Function that Computes the Value from the Instance
+        """
+        self.compute = compute
+        self.slot = '_' + compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.compute(instance)
+            setattr(instance, self.slot, value)
+            return value
 
 
 class BlackBoardCourse:
     """
     Represents a Blackboard Course
+
+    -----
+
+    Dates, Nested Attributes and the Safe Name are Parsed From the Raw Data the First Time they are Read
     """
 
+    __slots__ = ('client', '_course_data', 'id', 'uuid', 'external_id', 'data_source_id', 'course_id', 'name',
+                 'description', 'organization', 'ultra_status', 'allow_guests', 'closed_complete', 'term_id',
+                 'has_children', 'parent_id', 'external_access_url', 'guest_access_url', 'read_only',
+                 'local_location', 'manifest',
+                 '_name_safe', '_created', '_modified', '_availability', '_enrollment', '_locale')
+
     def __init__(self, client: BlackBoardClient, data: dict):
         """
         :param client: The Blackboard Client to Interact with this Course with
@@ -523,18 +1401,12 @@ class BlackBoardCourse:
         self.data_source_id = self._course_data.get('dataSourceId', None)
         self.course_id = self._course_data.get('courseId', None)
         self.name = self._course_data.get('name', None)
-        self.name_safe = re.sub('[<>:"/\\\\|?*]', '-', self.name) if self.name is not None else ''
         self.description = self._course_data.get('description', None)
-        self.created = _to_date(self._course_data.get('created', None))
-        self.modified = _to_date(self._course_data.get('modified', None))
         self.organization = self._course_data.get('organization', None)
         self.ultra_status = self._course_data.get('ultraStatus', None)
         self.allow_guests = self._course_data.get('allowGuests', None)
         self.closed_complete = self._course_data.get('closedComplete', None)
         self.term_id = self._course_data.get('termId', None)
-        self.availability = self.Availability(self._course_data.get('available', None))
-        self.enrollment = self.Enrollment(self._course_data.get('enrollment', None))
-        self.locale = self.Locale(self._course_data.get('locale', None))
         self.has_children = self._course_data.get('hasChildren', None)
         self.parent_id = self._course_data.get('parentId', None)
         self.external_access_url = self._course_data.get('externalAccessUrl', None)
@@ -544,15 +1416,10 @@ class BlackBoardCourse:
 
         # Custom Attributes
         self.local_location = os.path.join(self.client.base_path, self.name_safe)
-        self.active_downloads = 0
 
         # Manifest
-        self.manifest_location = os.path.join(self.local_location, ".manifest.json")
-        if self.client.use_manifest and os.path.isdir(self.local_location) and os.path.isfile(self.manifest_location):
-            with open(self.manifest_location) as f:
-                self.download_manifest = json.load(f)
-        else:
-            self.download_manifest = {}
+        self.manifest: Optional[DownloadManifest] = DownloadManifest.open(
+            self.local_location, self.client.manifest_backend) if self.client.use_manifest else None
 
     def __str__(self):
         return "{} ({})".format(self.name, self.id)
@@ -560,11 +1427,55 @@ class BlackBoardCourse:
     def __repr__(self):
         return str(self)
 
+    @_LazyAttribute
+    def name_safe(self) -> str:
+        """
+        The Course Name with the Characters Windows Disallows in Paths Replaced
+        """
+        return re.sub('[<>:"/\\\\|?*]', '-', self.name) if self.name is not None else ''
+
+    @_LazyAttribute
+    def created(self) -> Optional[datetime]:
+        """
+        When the Course was Created
+        """
+        return _to_date(self._course_data.get('created', None))
+
+    @_LazyAttribute
+    def modified(self) -> Optional[datetime]:
+        """
+        When the Course was Last Modified
+        """
+        return _to_date(self._course_data.get('modified', None))
+
+    @_LazyAttribute
+    def availability(self) -> BlackBoardCourse.Availability:
+        """
+        The Course's Availability Attributes
+        """
+        return self.Availability(self._course_data.get('availability', self._course_data.get('available', None)))
+
+    @_LazyAttribute
+    def enrollment(self) -> BlackBoardCourse.Enrollment:
+        """
+        The Course's Enrollment Attributes
+        """
+        return self.Enrollment(self._course_data.get('enrollment', None))
+
+    @_LazyAttribute
+    def locale(self) -> BlackBoardCourse.Locale:
+        """
+        The Course's Locale Attributes
+        """
+        return self.Locale(self._course_data.get('locale', None))
+
     class Availability:
         """
         Represents a Blackboard Courses Availability Attributes
         """
 
+        __slots__ = ('available', 'duration')
+
         def __init__(self, availability_4: dict):
             if not availability_4:
                 availability_4 = {}
@@ -577,6 +1488,8 @@ class BlackBoardCourse:
         Represents a Blackboard Courses Enrollment Attributes
         """
 
+        __slots__ = ('type', 'start', 'end', 'access_code')
+
         def __init__(self, enrollment_0: dict):
             if not enrollment_0:
                 enrollment_0 = {}
@@ -590,6 +1503,8 @@ class BlackBoardCourse:
         Represents a Blackboard Courses Locale Attributes
         """
 
+        __slots__ = ('id', 'force')
+
         def __init__(self, locale_0: dict):
             if not locale_0:
                 locale_0 = {}
@@ -601,6 +1516,8 @@ class BlackBoardCourse:
         Represents a Blackboard Courses Duration Attributes
         """
 
+        __slots__ = ('type', 'start', 'end', 'daysOfUse')
+
         def __init__(self, duration: dict):
             if not duration:
                 duration = {}
@@ -609,42 +1526,26 @@ class BlackBoardCourse:
             self.end = _to_date(duration.get('end', None))
             self.daysOfUse = duration.get('daysOfUse', None)
 
-    def contents(self, existing_list=None, endpoint=None) -> List[BlackBoardContent]:
+    def contents(self) -> List[BlackBoardContent]:
         """
         Generates a List of the Contents that the Course Contains
 
-        -----
-
-        Is a Recursive Function so when called existing_list and endpoint are not Required
-
-
-        :param existing_list: The List of the Already Identified Course Contents
-        :param endpoint: The Endpoint (API Path) to Send the Next Request to (due to paging)
         :return: A List Containing All the Blackboard Content Accessible Within a Given Course
         """
-        if existing_list is None:
-            existing_list = list()
-        if endpoint is None:
-            endpoint = BlackBoardEndPoints.get_contents(self.id)
-        try:
-            request = self.client.send_get_request(endpoint)
-            content_data = request.json()
-            if "results" in content_data:
-                for content in content_data["results"]:
-                    existing_list.append(BlackBoardContent(self, content))
-                if "paging" in content_data:
-                    return self.contents(existing_list, content_data['paging']['nextPage'])
-        except ValueError:  # JSON Response Malformed
-            _println("{}[ERROR] Failed to Decode JSON Response From Endpoint: {}",
-                     Fore.RED, self.client.site + endpoint)
-        except BlackBoardClient.BBRequestException:  # Request Error
-            pass
+        return list(self.iter_contents())
 
-        # Verify Content
-        for content in existing_list:
-            if content.id is None or content.title is None:
-                existing_list.remove(content)
-        return existing_list
+    def iter_contents(self, fields: Optional[List[str]] = None, strict: bool = False) -> Iterator[BlackBoardContent]:
+        """
+        Lazily Yields the Contents that the Course Contains, Page by Page
+
+        :param fields: The Only Fields to Request for Each Content (All Fields if None)
+        :param strict: Raise BlackBoardClient.ListingFailed if the Listing Fails Part Way
+        :return: An Iterator over the Blackboard Content Accessible Within a Given Course
+        """
+        for data in self.client.paginate(BlackBoardEndPoints.get_contents(self.id, fields=fields), strict):
+            content = BlackBoardContent(self, data, fields)
+            if content.id is not None and content.title is not None:
+                yield content
 
     def get_content(self, content_id: str) -> Optional[BlackBoardContent]:
         """
@@ -657,12 +1558,34 @@ class BlackBoardCourse:
 
     def download_all_attachments(self, save_location='./', threaded=False) -> None:
         """
-        Enumerates Through all the Possible Content Within the Course and then Downloading All Attachments
+        Enumerates Through all the Possible Content Within the Course and then Downloading All Attachments, Returning
+        Once Every Download has Finished (or been Paused)
 
         :param save_location: The Base Location to Save All Attachment Downloads
         :param threaded: Download The Files Across Multiple Threads
         """
 
+        course_path = os.path.join(save_location, self.name_safe)
+        if threaded:
+            # Discovery Runs on the Clients Crawl Pool and Feeds Attachments Straight into the Download Queue, the
+            # Course Finishes (Once) when the Crawl is Done and the Last Queued Download has Settled
+            latch = CompletionLatch(self.finished_course_downloads)
+            try:
+                ContentCrawler(self, self.client.crawl_pool,
+                               lambda attachment, path: attachment.thread_download(path, latch)).crawl(course_path)
+            finally:
+                latch.close()
+            latch.wait()
+            return
+
+        snapshot = CrawlSnapshot.open(self, course_path)
+        complete = True  # Whether Every Listing Succeeded
+
+        def listing_failed(error: BlackBoardClient.ListingFailed) -> None:
+            nonlocal complete
+            complete = False
+            _println(f"{Fore.RED}[FAILED TO CRAWL] {self.name_safe}\nError: {str(error)}")
+
         # Content Iteration Loop
         def iterate_with_path(content: BlackBoardContent, path: str) -> None:
             """
@@ -673,23 +1596,43 @@ class BlackBoardCourse:
             """
             if content.content_handler.id == "resource/x-bb-folder":
                 path = os.path.join(path, content.title_safe)
-            for attachment in content.attachments():
-                if threaded:
-                    # Will Raise DownloadQueueCancelled if downloading has been cancelled
-                    attachment.thread_download(path)
-                else:
+            entry = snapshot.unchanged(content) if snapshot is not None else None
+            if entry is not None:  # Nothing to Download Here, and the Children are Already Known
+                snapshot.keep(content, entry)
+                for child in snapshot.children(content, entry):
+                    iterate_with_path(child, path)
+                return
+            # A Listing that Failed isn't Recorded, so the Content is Listed Again Next Time
+            try:
+                attachment_ids = []
+                for attachment in content.iter_attachments(ContentCrawler.ATTACHMENT_FIELDS, strict=True):
+                    attachment_ids.append(attachment.id)
+                    event_bus.publish(Discovered(attachment.file_name_safe))
                     attachment.download(path)
-            if content.has_children:
-                for child in content.children():
+                if snapshot is not None:
+                    snapshot.record_attachments(content, attachment_ids)
+            except BlackBoardClient.ListingFailed as e:
+                listing_failed(e)
+            try:
+                child_ids = []
+                for child in content.iter_children(ContentCrawler.CONTENT_FIELDS, strict=True):
+                    child_ids.append(child.id)
                     iterate_with_path(child, path)
+                if snapshot is not None:
+                    snapshot.record_children(content, child_ids)
+            except BlackBoardClient.ListingFailed as e:
+                listing_failed(e)
 
         # Content Iteration Start
-        contents = self.contents()
-        for c in contents:
-            iterate_with_path(c, os.path.join(save_location, self.name_safe))
+        try:
+            for c in self.iter_contents(ContentCrawler.CONTENT_FIELDS, strict=True):
+                iterate_with_path(c, course_path)
+        except BlackBoardClient.ListingFailed as e:
+            listing_failed(e)
+        if snapshot is not None:
+            snapshot.save(complete=complete)
 
-        if not threaded:
-            self.finished_course_downloads()
+        self.finished_course_downloads()
 
     def get_manifest_entry(self, attachment: BlackBoardAttachment) -> Optional[str]:
         """
@@ -698,17 +1641,50 @@ class BlackBoardCourse:
         :param attachment: The Attachment to Get Manifest Data For
         :return: The ETag that was Recorded when the Attachment was Last Downloaded
         """
-        return self.download_manifest.get(attachment.content.id, {}).get(attachment.id, None)
+        if self.manifest is None:
+            return None
+        return self.manifest.get(attachment.content.id, attachment.id)
+
+    def record_manifest_entry(self, attachment: BlackBoardAttachment, etag: Any) -> None:
+        """
+        Records the Version of an Attachment that has just been Downloaded
+
+        :param attachment: The Attachment that was Downloaded
+        :param etag: The ETag Returned with the Download (-1 if the Server Didn't Supply One)
+        """
+        if self.manifest is not None:
+            self.manifest.record(attachment.content.id, attachment.id, etag)
 
     def finished_course_downloads(self):
         """
         Writes Changes to Manifest (If Enabled) and Notifies that The Course Content has been Downloaded
         """
         _println(f"{Fore.MAGENTA}[COURSE DOWNLOADED] {self.name_safe}\n")
-        # Manifest Save - Check if Directory Exists Because if it doesn't No Files Have Been Downloaded
-        if self.client.use_manifest and os.path.isdir(self.local_location):
-            with open(self.manifest_location, 'w+') as f:
-                json.dump(self.download_manifest, f)
+        if self.manifest is not None:
+            self.manifest.flush()
+
+    COURSE_KEY_PREFIXES = ('externalId', 'courseId', 'uuid')
+
+    @staticmethod
+    def course_key(identifier: str) -> str:
+        """
+        Normalises a Course Identifier Given by the User into the Form the Course Endpoints Accept
+
+        -----
+
+        Primary IDs (eg. _123_1) are Used as Given, externalId:, courseId: and uuid: Prefixed IDs are Looked Up by that
+        Field, and Anything Else is Assumed to be the Course ID Shown in Learn (eg. CS101-2021)
+
+        :param identifier: The Course Identifier
+        :return: The Identifier to Place in a Course Endpoint Path
+        """
+        identifier = identifier.strip()
+        prefix, separator, value = identifier.partition(':')
+        if separator and prefix in BlackBoardCourse.COURSE_KEY_PREFIXES:
+            return f"{prefix}:{quote(value, safe='')}"
+        if re.fullmatch(r"_\d+_\d+", identifier):
+            return identifier
+        return f"courseId:{quote(identifier, safe='')}"
 
     @staticmethod
     def generate_course(client: BlackBoardClient, course_id: str) -> Optional[BlackBoardCourse]:
@@ -732,34 +1708,439 @@ class BlackBoardCourse:
             pass
 
 
+class DownloadManifest(abc.ABC):
+    """
+    Records the Version (ETag) of Every Attachment Downloaded Within a Course
+    """
+
+    @staticmethod
+    def open(course_location: str, backend: str = 'sqlite') -> DownloadManifest:
+        """
+        Opens the Manifest of a Course
+
+        :param course_location: The Local Directory of the Course
+        :param backend: Either 'sqlite' or 'json'
+        :return: The Courses Manifest
+        """
+        if backend == 'json':
+            return JSONManifest(course_location)
+        return SQLiteManifest(course_location)
+
+    @abc.abstractmethod
+    def get(self, content_id: str, attachment_id: str) -> Optional[str]:
+        """
+        Looks Up the ETag Recorded when an Attachment was Last Downloaded
+
+        :param content_id: The ID of the Content the Attachment Belongs to
+        :param attachment_id: The ID of the Attachment
+        :return: The Recorded ETag (None if the Attachment has Never Been Downloaded or had No ETag)
+        """
+
+    @abc.abstractmethod
+    def content_entries(self, content_id: str) -> Dict[str, Optional[str]]:
+        """
+        Looks Up Every Attachment Recorded for a Content Item
+
+        :param content_id: The ID of the Content
+        :return: The Recorded ETag of Each Attachment, Keyed by Attachment ID
+        """
+
+    @abc.abstractmethod
+    def record(self, content_id: str, attachment_id: str, etag: Any) -> None:
+        """
+        Records the Version of an Attachment that has just been Downloaded
+
+        :param content_id: The ID of the Content the Attachment Belongs to
+        :param attachment_id: The ID of the Attachment
+        :param etag: The ETag Returned with the Download (-1 if the Server Didn't Supply One)
+        """
+
+    def flush(self) -> None:
+        """
+        Ensures Every Recorded Entry is Written to Disk
+        """
+        pass
+
+
+class JSONManifest(DownloadManifest):
+    """
+    A Manifest Held in Memory and Written to the Courses .manifest.json File as a Whole
+    """
+
+    def __init__(self, course_location: str):
+        """
+        :param course_location: The Local Directory of the Course
+        """
+        self.course_location = course_location
+        self.location = os.path.join(course_location, ".manifest.json")
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.isfile(self.location):
+            with open(self.location) as f:
+                self.entries = json.load(f)
+
+    def get(self, content_id: str, attachment_id: str) -> Optional[str]:
+        with self._lock:
+            etag = self.entries.get(content_id, {}).get(attachment_id, None)
+        return etag if isinstance(etag, str) else None
+
+    def content_entries(self, content_id: str) -> Dict[str, Optional[str]]:
+        with self._lock:
+            return dict(self.entries.get(content_id, {}))
+
+    def record(self, content_id: str, attachment_id: str, etag: Any) -> None:
+        with self._lock:
+            self.entries.setdefault(content_id, {})[attachment_id] = etag
+
+    def flush(self) -> None:
+        # Check if Directory Exists Because if it doesn't No Files Have Been Downloaded
+        if os.path.isdir(self.course_location):
+            with self._lock, open(self.location, 'w+') as f:
+                json.dump(self.entries, f)
+
+
+class SQLiteManifest(DownloadManifest):
+    """
+    A Manifest Stored in an SQLite Database (.manifest.db) in Write-Ahead Logging Mode
+
+    -----
+
+    Every Completed Download is Recorded in its Own Small Transaction, so a Crash Only Loses the Files that were Still
+    in Flight. An Existing .manifest.json is Migrated into the Database the First Time it is Opened
+    """
+
+    def __init__(self, course_location: str):
+        """
+        :param course_location: The Local Directory of the Course
+        """
+        self.course_location = course_location
+        self.location = os.path.join(course_location, ".manifest.db")
+        self.json_location = os.path.join(course_location, ".manifest.json")
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def get(self, content_id: str, attachment_id: str) -> Optional[str]:
+        with self._lock:
+            connection = self.__connect(create=False)
+            if connection is None:
+                return None
+            row = connection.execute("SELECT etag FROM downloads WHERE content_id = ? AND attachment_id = ?",
+                                     (content_id, attachment_id)).fetchone()
+        return row[0] if row is not None else None
+
+    def content_entries(self, content_id: str) -> Dict[str, Optional[str]]:
+        with self._lock:
+            connection = self.__connect(create=False)
+            if connection is None:
+                return {}
+            rows = connection.execute("SELECT attachment_id, etag FROM downloads WHERE content_id = ?",
+                                      (content_id,)).fetchall()
+        return dict(rows)
+
+    def record(self, content_id: str, attachment_id: str, etag: Any) -> None:
+        with self._lock:
+            connection = self.__connect(create=True)
+            with connection:  # Commits the Entry as its Own Transaction
+                connection.execute(
+                    "INSERT OR REPLACE INTO downloads (content_id, attachment_id, etag, downloaded) "
+                    "VALUES (?, ?, ?, ?)",
+                    (content_id, attachment_id, etag if isinstance(etag, str) else None,
+                     datetime.now().isoformat()))
+
+    def flush(self) -> None:
+        # Entries are Already Committed, Closing Checkpoints the Write-Ahead Log Back into the Database
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        """
+        Opens (and if Required Creates and Migrates) the Database
+
+        :param create: Create the Database (and Course Directory) if it Doesn't Already Exist
+        :return: The Database Connection (None if it Doesn't Exist and create is False)
+        """
+        if self._connection is not None:
+            return self._connection
+        if not create and not os.path.isfile(self.location) and not os.path.isfile(self.json_location):
+            return None
+        os.makedirs(self.course_location, exist_ok=True)
+        # Shared Between the Download Threads, Access is Serialised by self._lock
+        self._connection = sqlite3.connect(self.location, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS downloads (content_id TEXT NOT NULL, attachment_id TEXT NOT NULL, "
+                "etag TEXT, downloaded TEXT, PRIMARY KEY (content_id, attachment_id))")
+        if os.path.isfile(self.json_location):
+            self.__migrate()
+        return self._connection
+
+    def __migrate(self) -> None:
+        """
+        Imports the Entries of an Existing .manifest.json and Moves it Aside
+        """
+        try:
+            with open(self.json_location) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            _println(f"{Fore.RED}[ERROR] Failed to Migrate Manifest: {self.json_location}")
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO downloads (content_id, attachment_id, etag) VALUES (?, ?, ?)",
+                [(content_id, attachment_id, etag if isinstance(etag, str) else None)
+                 for content_id, attachments in entries.items() for attachment_id, etag in attachments.items()])
+        os.replace(self.json_location, self.json_location + ".migrated")
+
+
+class BlobStore:
+    """
+    Keeps a Single Copy (Blob) of Every Distinct File Downloaded, Named by the SHA-256 Digest of its Contents, and Links
+    it Wherever the File is Attached
+
+    -----
+
+    Blobs are Linked into the Course Folders with a Hardlink Where the Filesystem Allows it, Otherwise a Reflink (Copy
+    on Write Clone) and as a Last Resort a Plain Copy. An Index in an SQLite Database Remembers the Digest of the File
+    Served for Each Strong ETag and Size, so a File Already in the Store is Linked Without Transferring it Again
+
+    Hardlinked Copies Share the Blob, so Editing One in Place Edits them All. The Blob's Modification Time and Inode
+    are Recorded when it is Indexed, and a Blob that No Longer Matches them is Re-Hashed Before it is Linked Again,
+    so an Edited Blob is Dropped from the Store (Leaving the Edited Copies Alone) and the File is Downloaded Afresh
+    """
+
+    def __init__(self, location: str):
+        """
+        :param location: The Directory the Blobs and their Index are Kept in
+        """
+        self.location = location
+        self.index_location = os.path.join(location, "index.db")
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def blob_location(self, digest: str) -> str:
+        """
+        :param digest: The Hex SHA-256 Digest of a File
+        :return: Where the Blob with that Digest is Kept
+        """
+        return os.path.join(self.location, digest[:2], digest)
+
+    def lookup(self, etag: Optional[str], size: Optional[Any]) -> Optional[str]:
+        """
+        Finds the Blob Previously Downloaded for a Version of a File
+
+        :param etag: The ETag of the Version (Weak ETags Never Match, they Don't Promise Identical Bytes)
+        :param size: The Size of the File in Bytes
+        :return: The Digest of the Blob (None if it isn't in the Store)
+        """
+        if not etag or etag.startswith('W/') or size is None or not str(size).isdigit():
+            return None
+        with self._lock:
+            connection = self.__connect()
+            row = connection.execute("SELECT digest, mtime, inode FROM blobs WHERE etag = ? AND size = ?",
+                                     (etag, int(size))).fetchone()
+            if row is None:
+                return None
+            digest, mtime, inode = row
+            if not self.__verify(connection, digest, int(size), mtime, inode):
+                return None
+        return digest
+
+    def add(self, location: str, digest: str, etag: Optional[str] = None) -> None:
+        """
+        Moves a Completed File into the Store (Unless an Identical Blob is Already There) and Links the Blob Back in its
+        Place
+
+        :param location: The Completed File
+        :param digest: The Hex SHA-256 Digest of the File
+        :param etag: The ETag the File was Served With, to Recognise it Next Time (None if Unknown)
+        """
+        blob_location = self.blob_location(digest)
+        size = os.path.getsize(location)
+        with self._lock:
+            connection = self.__connect()
+            row = connection.execute("SELECT mtime, inode FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row is None or not self.__verify(connection, digest, size, *row):
+                os.makedirs(os.path.dirname(blob_location), exist_ok=True)
+                try:
+                    os.replace(location, blob_location)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # The Store is on Another Filesystem, so Copy it There (Never Exposing a Half Written Blob)
+                    shutil.copyfile(location, blob_location + ".tmp")
+                    os.replace(blob_location + ".tmp", blob_location)
+                stat = os.stat(blob_location)
+                with connection:
+                    connection.execute("UPDATE blobs SET mtime = ?, inode = ? WHERE digest = ?",
+                                       (stat.st_mtime_ns, stat.st_ino, digest))
+            else:
+                stat = os.stat(blob_location)
+            if etag and not etag.startswith('W/'):
+                with connection:
+                    connection.execute("INSERT OR REPLACE INTO blobs (etag, size, digest, stored, mtime, inode) "
+                                       "VALUES (?, ?, ?, ?, ?, ?)",
+                                       (etag, size, digest, datetime.now().isoformat(), stat.st_mtime_ns, stat.st_ino))
+        self.link(digest, location)
+
+    def link(self, digest: str, location: str) -> str:
+        """
+        Places a Blob at the Given Location, Replacing Anything Already There
+
+        :param digest: The Digest of the Blob
+        :param location: Where the File Should Appear
+        :return: The Location
+        """
+        blob_location = self.blob_location(digest)
+        temporary = location + ".link"
+        if os.path.lexists(temporary):
+            os.remove(temporary)
+        try:
+            os.link(blob_location, temporary)
+        except OSError:  # Cross Device, Too Many Links or No Hardlink Support
+            try:
+                _reflink(blob_location, temporary)
+            except OSError:
+                shutil.copyfile(blob_location, temporary)
+        os.replace(temporary, location)
+        return location
+
+    def flush(self) -> None:
+        """
+        Closes the Index (it is Reopened if the Store is Used Again)
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __verify(self, connection: sqlite3.Connection, digest: str, size: int, mtime: Optional[int],
+                 inode: Optional[int]) -> bool:
+        """
+        Checks a Blob Still Holds the Bytes it was Indexed With, Dropping it from the Store if it Doesn't
+
+        -----
+
+        A Blob Whose Modification Time and Inode Still Match the Index is Trusted, Otherwise (eg. it was Edited Through
+        a Hardlinked Copy, or was Indexed Before they were Recorded) it is Re-Hashed. Must be Called Holding self._lock
+
+        :param connection: The Index
+        :param digest: The Digest the Blob was Stored Under
+        :param size: The Size the Blob Should Be
+        :param mtime: The Recorded Modification Time of the Blob in Nanoseconds (None if Unknown)
+        :param inode: The Recorded Inode of the Blob (None if Unknown)
+        :return: Whether the Blob is Intact and Can be Linked
+        """
+        blob_location = self.blob_location(digest)
+        try:
+            stat = os.stat(blob_location)
+        except OSError:  # Removed Since it was Indexed
+            stat = None
+        if stat is not None and stat.st_size == size:
+            if stat.st_mtime_ns == mtime and stat.st_ino == inode:
+                return True
+            if _hash_file(blob_location) == digest:  # Touched but Unchanged, so Record its New Details
+                with connection:
+                    connection.execute("UPDATE blobs SET mtime = ?, inode = ? WHERE digest = ?",
+                                       (stat.st_mtime_ns, stat.st_ino, digest))
+                return True
+        with connection:
+            connection.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        if stat is not None:
+            os.remove(blob_location)  # Only the Stores Name, Hardlinked Copies Keep their (Edited) Contents
+        return False
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens (and if Required Creates) the Index
+
+        :return: The Database Connection
+        """
+        if self._connection is None:
+            os.makedirs(self.location, exist_ok=True)
+            # Shared Between the Download Threads, Access is Serialised by self._lock
+            self._connection = sqlite3.connect(self.index_location, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS blobs (etag TEXT NOT NULL, size INTEGER NOT NULL, "
+                    "digest TEXT NOT NULL, stored TEXT, mtime INTEGER, inode INTEGER, PRIMARY KEY (etag, size))")
+                columns = [row[1] for row in self._connection.execute("PRAGMA table_info(blobs)")]
+                for column in ('mtime', 'inode'):  # Indexes Written Before Blobs were Verified
+                    if column not in columns:
+                        self._connection.execute(f"ALTER TABLE blobs ADD COLUMN {column} INTEGER")
+        return self._connection
+
+
+def _reflink(source: str, destination: str) -> None:
+    """
+    Clones a File so Both Share the Same Blocks Until One is Modified (Btrfs, XFS and Other Copy on Write Filesystems)
+
+    :param source: The File to Clone
+    :param destination: Where to Create the Clone
+    :raises OSError: If the Platform or Filesystem Can't Clone Files
+    """
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "Reflinks are Not Supported on this Platform")
+    with open(source, 'rb') as file_in, open(destination, 'wb') as file_out:
+        try:
+            fcntl.ioctl(file_out.fileno(), 0x40049409, file_in.fileno())  # FICLONE
+        except OSError:
+            file_out.close()
+            os.remove(destination)
+            raise
+
+
+def _hash_file(location: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hashes a File Already on Disk
+
+    :param location: The File to Hash
+    :param chunk_size: The Number of Bytes to Read at a Time
+    :return: The Hex SHA-256 Digest of the File
+    """
+    hasher = hashlib.sha256()
+    with open(location, 'rb') as f:
+        for chunk in iter(partial(f.read, chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 class BlackBoardContent:
     """
     Represents a Piece Content Within a Blackboard Course
+
+    -----
+
+    Dates, Nested Attributes and the Safe Title are Parsed From the Raw Data the First Time they are Read
     """
 
-    def __init__(self, course: BlackBoardCourse, data: dict):
+    __slots__ = ('course', 'client', 'fields', '_content_data', 'id', 'parent_id', 'title', 'body', 'description',
+                 'position', 'has_children', 'has_gradebook_columns', 'has_associated_groups',
+                 '_title_safe', '_created', '_modified', '_availability', '_content_handler', '_links')
+
+    def __init__(self, course: BlackBoardCourse, data: dict, fields: Optional[List[str]] = None):
         """
         :param course: The Blackboard Course that holds this Content
         :param data: The JSON data returned from the Learn API
+        :param fields: The Fields the Data was Limited to (None if it is the Complete Object)
         """
         self.course = course
         self.client = course.client
-        self.__content_data = data
-        self.id = self.__content_data.get('id', None)
-        self.parent_id = self.__content_data.get('parentId', None)
-        self.title = self.__content_data.get('title', None)
-        self.title_safe = re.sub(
-            '[<>:"/\\\\|?*]', '-', self.title) if self.title is not None else ''
-        self.body = self.__content_data.get('body', None)
-        self.description = self.__content_data.get('description', None)
-        self.created = _to_date(self.__content_data.get('created', None))
-        self.position = self.__content_data.get('position', None)
-        self.has_children = self.__content_data.get('hasChildren', None)
-        self.has_gradebook_columns = self.__content_data.get('hasGradebookColumns', None)
-        self.has_associated_groups = self.__content_data.get('hasAssociatedGroups', None)
-        self.availability = self.Availability(self.__content_data.get('availability', None))
-        self.content_handler = self.ContentHandler(self.__content_data.get('contentHandler', None))
-        self.links = [self.Link(link) for link in self.__content_data.get('links', [])]
+        self.fields = fields
+        self._content_data = data
+        self.id = self._content_data.get('id', None)
+        self.parent_id = self._content_data.get('parentId', None)
+        self.title = self._content_data.get('title', None)
+        self.body = self._content_data.get('body', None)
+        self.description = self._content_data.get('description', None)
+        self.position = self._content_data.get('position', None)
+        self.has_children = self._content_data.get('hasChildren', None)
+        self.has_gradebook_columns = self._content_data.get('hasGradebookColumns', None)
+        self.has_associated_groups = self._content_data.get('hasAssociatedGroups', None)
 
     def __str__(self):
         return "{} ({})".format(self.title, self.id)
@@ -767,11 +2148,55 @@ class BlackBoardContent:
     def __repr__(self):
         return str(self)
 
+    @_LazyAttribute
+    def title_safe(self) -> str:
+        """
+        The Content Title with the Characters Windows Disallows in Paths Replaced
+        """
+        return re.sub('[<>:"/\\\\|?*]', '-', self.title) if self.title is not None else ''
+
+    @_LazyAttribute
+    def created(self) -> Optional[datetime]:
+        """
+        When the Content was Created
+        """
+        return _to_date(self._content_data.get('created', None))
+
+    @_LazyAttribute
+    def modified(self) -> Optional[datetime]:
+        """
+        When the Content was Last Modified
+        """
+        return _to_date(self._content_data.get('modified', None))
+
+    @_LazyAttribute
+    def availability(self) -> BlackBoardContent.Availability:
+        """
+        The Content's Availability Attributes
+        """
+        return self.Availability(self._content_data.get('availability', None))
+
+    @_LazyAttribute
+    def content_handler(self) -> BlackBoardContent.ContentHandler:
+        """
+        The Content's Content Handler Attributes
+        """
+        return self.ContentHandler(self._content_data.get('contentHandler', None))
+
+    @_LazyAttribute
+    def links(self) -> List[BlackBoardContent.Link]:
+        """
+        The Content's Links
+        """
+        return [self.Link(link) for link in self._content_data.get('links', [])]
+
     class Availability:
         """
         Represents the Blackboard Content's Availability Attributes
         """
 
+        __slots__ = ('available', 'duration')
+
         def __init__(self, availability_0: dict):
             if not availability_0:
                 availability_0 = {}
@@ -785,6 +2210,8 @@ class BlackBoardContent:
         Represents the Blackboard Content's Adaptive Release Attributes
         """
 
+        __slots__ = ('start', 'end')
+
         def __init__(self, adaptive_release: dict):
             if not adaptive_release:
                 adaptive_release = {}
@@ -796,6 +2223,9 @@ class BlackBoardContent:
         Represents the Blackboard Content's Content Handler Attributes
         """
 
+        __slots__ = ('id', 'url', 'is_bb_page', 'target_id', 'target_type', 'discussion_id', 'custom_parameters',
+                     'file', 'assessment_id', 'grade_column_id', 'group_content')
+
         def __init__(self, content_handler: dict):
             if not content_handler:
                 content_handler = {}
@@ -815,8 +2245,7 @@ class BlackBoardContent:
         def __str__(self):
             return "Content Type: {} - Populated Attributes: {}" \
                 .format(self.id,
-                        [k for k, v in self.__dict__.items() if
-                         '__' not in k and 'object at' not in k and v is not None])
+                        [k for k in self.__slots__ if getattr(self, k) is not None])
 
         def __repr__(self):
             return str(self)
@@ -826,6 +2255,8 @@ class BlackBoardContent:
             Represents a Blackboard File Embedded in the Content Handler
             """
 
+            __slots__ = ('upload_id', 'file_name', 'mime_type', 'duplicate_file_handling')
+
             def __init__(self, content_handler: dict):
                 if not content_handler:
                     content_handler = {}
@@ -839,6 +2270,8 @@ class BlackBoardContent:
                 Represents a Blackboard File Embedded in the Content's File Handling Attributes
                 """
 
+                __slots__ = ('rename', 'replace', 'throw_error')
+
                 def __init__(self, content_handler: dict):
                     if not content_handler:
                         content_handler = {}
@@ -858,86 +2291,62 @@ class BlackBoardContent:
         Represents the Blackboard Content's Linking Attributes
         """
 
+        __slots__ = ('href', 'rel', 'title', 'type')
+
         def __init__(self, data: dict):
             self.href = data.get("href", None)
             self.rel = data.get("ref", None)
             self.title = data.get("title", None)
             self.type = data.get("type", None)
 
-    def children(self, existing_list=None, endpoint=None) -> List[BlackBoardContent]:
+    def children(self) -> List[BlackBoardContent]:
         """
         Get All Child Content Associated with the current Content
 
-        -----
-
-        Is a Recursive Function so when called existing_list and endpoint are not Required
+        :return: A List Containing All the Child Blackboard Content Accessible Within the Given Content
+        """
+        return list(self.iter_children())
 
+    def iter_children(self, fields: Optional[List[str]] = None, strict: bool = False) -> Iterator[BlackBoardContent]:
+        """
+        Lazily Yields the Child Content Associated with the current Content, Page by Page
 
-        :param existing_list: The List of the Already Identified Course Contents
-        :param endpoint: The Endpoint (API Path) to Send the Next Request to (due to paging)
-        :return: A List Containing All the Child Blackboard Content Accessible Within the Given Content
+        :param fields: The Only Fields to Request for Each Child (All Fields if None)
+        :param strict: Raise BlackBoardClient.ListingFailed if the Listing Fails Part Way
+        :return: An Iterator over the Child Blackboard Content Accessible Within the Given Content
         """
-        if existing_list is None:
-            existing_list = list()
-        if endpoint is None:
-            endpoint = BlackBoardEndPoints.get_content_children(self.course.id, self.id)
-        if self.has_children:
-            try:
-                request = self.client.send_get_request(endpoint)
-                children_content = request.json()  # Can Produce Value Error
-                if "results" in children_content:
-                    for content in children_content["results"]:
-                        existing_list.append(BlackBoardContent(self.course, content))
-                    if "paging" in children_content:
-                        return self.children(existing_list, children_content['paging']['nextPage'])
-            except ValueError:  # JSON Response Malformed
-                _println(
-                    f"{Fore.RED}[ERROR] Failed to Decode JSON Response From Endpoint: {self.client.site + endpoint}")
-            except BlackBoardClient.BBRequestException:  # Request Error
-                pass
-
-        # Verify Children
-        for content in existing_list:
-            if content.id is None or content.title is None:
-                existing_list.remove(content)
-        return existing_list
-
-    def attachments(self, existing_list=None, endpoint=None) -> List[BlackBoardAttachment]:
+        if not self.has_children:
+            return
+        for data in self.client.paginate(
+                BlackBoardEndPoints.get_content_children(self.course.id, self.id, fields=fields), strict):
+            content = BlackBoardContent(self.course, data, fields)
+            if content.id is not None and content.title is not None:
+                yield content
+
+    def attachments(self) -> List[BlackBoardAttachment]:
         """
         Get All Attachments Associated with the current Content
 
-        -----
-
-        Is a Recursive Function so when called existing_list and endpoint are not Required
+        :return: A List Containing All the Blackboard Attachments Accessible Within the Given Content
+        """
+        return list(self.iter_attachments())
 
+    def iter_attachments(self, fields: Optional[List[str]] = None,
+                         strict: bool = False) -> Iterator[BlackBoardAttachment]:
+        """
+        Lazily Yields the Attachments Associated with the current Content, Page by Page
 
-        :param existing_list: The List of the Already Identified Course Contents
-        :param endpoint: The Endpoint (API Path) to Send the Next Request to (due to paging)
-        :return: A List Containing All the Blackboard Attachments Accessible Within the Given Content
+        :param fields: The Only Fields to Request for Each Attachment (All Fields if None)
+        :param strict: Raise BlackBoardClient.ListingFailed if the Listing Fails Part Way
+        :return: An Iterator over the Blackboard Attachments Accessible Within the Given Content
         """
-        if existing_list is None:
-            existing_list = list()
-        if endpoint is None:
-            endpoint = BlackBoardEndPoints.get_file_attachments(self.course.id, self.id)
-        if self.content_handler.id in ("resource/x-bb-file", "resource/x-bb-document", "resource/x-bb-assignment"):
-            try:
-                request = self.client.send_get_request(endpoint)
-                attachments = request.json()
-                if "results" in attachments:
-                    for content in attachments["results"]:
-                        existing_list.append(BlackBoardAttachment(self, content))
-                    if "paging" in attachments:
-                        return self.attachments(existing_list, attachments['paging']['nextPage'])
-            except ValueError:  # JSON Response Malformed
-                _println("{}[ERROR] Failed to Decode JSON Response From Endpoint: {}",
-                         Fore.RED, self.client.site + endpoint)
-            except BlackBoardClient.BBRequestException:  # Request Error
-                pass
-        # Verify Attachment
-        for content in existing_list:
-            if content.id is None or content.file_name is None:
-                existing_list.remove(content)
-        return existing_list
+        if self.content_handler.id not in ("resource/x-bb-file", "resource/x-bb-document", "resource/x-bb-assignment"):
+            return
+        for data in self.client.paginate(
+                BlackBoardEndPoints.get_file_attachments(self.course.id, self.id, fields=fields), strict):
+            attachment = BlackBoardAttachment(self, data)
+            if attachment.id is not None and attachment.file_name is not None:
+                yield attachment
 
     @staticmethod
     def generate_content(course: BlackBoardCourse, content_id: str) -> Optional[BlackBoardContent]:
@@ -988,64 +2397,156 @@ class BlackBoardAttachment:
         """
         Downloads the Attachment File to The Specified Location
 
+        -----
+
+        The File is Streamed to Disk in Chunks of the Clients chunk_size so Large Files are Never Held in Memory. If
+        the Transfer Drops Part Way it is Retried According to the Clients Download Retry Policy, Resuming from the
+        Bytes Already Written Where the Server Allows
+
+        :param location: The Location to Save the Attachment to (Is a Directory as Download Will Append the File Name)
+        """
+        policy = self.client.download_retry
+        key = self.save_location(location)
+        for attempt in range(policy.attempts):
+            try:
+                return self.__download(location)
+            except DownloadQueue.DownloadQueueCancelled:
+                event_bus.publish(Finished(key, self.file_name_safe, 'PAUSED'))
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError, BlackBoardClient.BBRequestException) as e:
+                if attempt + 1 >= policy.attempts or self.client.stop_event.is_set():
+                    self.client.retry_report.failed(self.file_name_safe, e)
+                    event_bus.publish(Failed(key, self.file_name_safe, e))
+                    raise
+                self.client.retry_report.retried(self.file_name_safe, e)
+                record_retry(None, 'transient', family='download')
+                time.sleep(policy.delay(attempt))
+            except Exception as e:
+                event_bus.publish(Failed(key, self.file_name_safe, e))
+                raise
+
+    def save_location(self, location: Optional[str]) -> str:
+        """
+        Works Out Where the Attachment is Saved
+
+        :param location: The Directory to Save the Attachment to
+        :return: The Absolute Path of the Saved File
+        """
+        return os.path.abspath(os.path.join("." if location is None else location, self.file_name_safe))
+
+    def __download(self, location: str) -> None:
+        """
+        Makes a Single Attempt at Downloading the Attachment File to The Specified Location
+
         :param location: The Location to Save the Attachment to (Is a Directory as Download Will Append the File Name)
         """
         # Just Work in Absolute Paths
-        download_location = os.path.abspath(os.path.join("." if location is None else location, self.file_name_safe))
+        download_location = self.save_location(location)
         download_directory = os.path.dirname(download_location)
 
-        request_headers = {}
+        # Continue Any Previously Interrupted Download of this File
+        blob_store = self.client.blob_store
+        partial_download = PartialDownload(download_location, hash_content=blob_store is not None)
+        request_headers = partial_download.request_headers()
         if self.client.use_manifest and self.course.get_manifest_entry(self) is not None:
-            request_headers["If-None-Match"] = self.course.download_manifest[self.content.id][self.id]
+            request_headers["If-None-Match"] = self.course.get_manifest_entry(self)
 
         endpoint = BlackBoardEndPoints.get_file_attachment_download(self.course.id, self.content.id, self.id)
-        download = self.client.send_get_request(endpoint, allow_redirects=True, headers=request_headers)
+        # A Single Attempt, as download() Retries the Whole Transfer (Headers and Body) Under the Download Policy
+        download = self.client.send_get_request(endpoint, retry=RetryPolicy.once(), allow_redirects=True,
+                                                headers=request_headers, stream=True)
 
-        if download.status_code == 302:  # Redirect Already Handled By Requests
-            _println(f"{Fore.CYAN}[REDIRECT]: {download.headers.get('Location', None)}")
-        elif download.status_code == 304:  # No Need to Update File
-            _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
-        elif download.status_code == 200:
-            if not os.path.exists(download_directory):
-                os.makedirs(download_directory)
+        try:
+            if download.status_code == 302:  # Redirect Already Handled By Requests
+                _println(f"{Fore.CYAN}[REDIRECT]: {download.headers.get('Location', None)}")
+            elif download.status_code == 304:  # No Need to Update File
+                partial_download.discard()  # Any Partial Copy is of a Different Version
+                _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
+                event_bus.publish(Finished(download_location, self.file_name_safe, 'UP TO DATE'))
+            elif download.status_code == 200 or download.status_code == 206:  # Full or Resumed (Partial) Content
+                if not os.path.exists(download_directory):
+                    os.makedirs(download_directory)
 
-            file_exists = os.path.isfile(download_location)
+                file_exists = os.path.isfile(download_location)
 
-            if file_exists and not self.client.use_manifest:
-                _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
-                return
+                if file_exists and not self.client.use_manifest:
+                    _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
+                    event_bus.publish(Finished(download_location, self.file_name_safe, 'UP TO DATE'))
+                    return
 
-            if file_exists and self.client.use_manifest and self.client.backup_files:
                 try:
-                    backup_folder = os.path.join(download_directory, "backups")
-                    split_file_name = self.file_name_safe.split('.')
-                    date_updated = datetime.strptime(download.headers['Last-Modified'], "%a, %d %b %Y %H:%M:%S %Z")
-                    new_file_name = "{}_{}.{}".format('.'.join(split_file_name[:-1]), date_updated.strftime('%d-%m-%Y'),
-                                                      split_file_name[-1])
-                    backup_file = os.path.join(backup_folder, f"_{new_file_name}")
-                    _println(f"{Fore.YELLOW}[BACKING UP] {self.file_name_safe}\n[LOCATION] {backup_file}")
-                    if not os.path.exists(f"{backup_folder}"):
-                        os.makedirs(f"{backup_folder}")
-                    os.replace(download_location, backup_file)
-                except OSError:
-                    _println(f"{Fore.RED}[FAILED BACKUP] Failed to Backup File: {self.file_name_safe}")
-
-            if self.content.id not in self.course.download_manifest:
-                self.course.download_manifest[self.content.id] = {}
-
-            # Possible Server Doesn't Supply ETag
-            self.course.download_manifest[self.content.id][self.id] = download.headers.get("ETag", -1)
+                    part_location = None
+                    digest = None
+                    if blob_store is not None and download.status_code == 200:
+                        digest = blob_store.lookup(download.headers.get('ETag', None),
+                                                   download.headers.get('Content-Length', None))
+                    if digest is not None:  # Already Downloaded (Elsewhere), so the Body is Never Read
+                        partial_download.discard()
+                        part_location = blob_store.link(digest, partial_download.part_location)
+                    else:
+                        if SegmentedDownload.applicable(self.client, download):
+                            try:
+                                part_location = SegmentedDownload(self.client, download, endpoint) \
+                                    .fetch(partial_download)
+                            except SegmentedDownload.Unsupported:
+                                _println(f"{Fore.YELLOW}[SEGMENTS UNSUPPORTED] {self.file_name_safe} "
+                                         f"(Downloading Over a Single Connection)")
+                        if part_location is None:
+                            part_location = partial_download.stream(download, self.client.chunk_size,
+                                                                    self.client.stop_event)
+                        if blob_store is not None:
+                            blob_store.add(part_location, partial_download.digest(), download.headers.get('ETag', None))
+                except requests.exceptions.RequestException:  # A Dropped Transfer (Also an OSError), download() Retries
+                    raise
+                except OSError as e:  # Local Disk Error
+                    _println(f"{Fore.RED}[FAILED TO DOWNLOAD FILE] {self.file_name_safe}")
+                    event_bus.publish(Failed(download_location, self.file_name_safe, e))
+                    return
+
+                # Only Backup Once the New Version is Safely on Disk
+                if file_exists and self.client.use_manifest and self.client.backup_files:
+                    self._backup(download_location, download.headers)
 
-            try:
-                with open(download_location, 'wb+') as file_out:
-                    file_out.write(download.content)
-                _println(
-                    "{}[{}] {}\n[LOCATION] {}",
-                    Fore.GREEN, 'UPDATED' if file_exists else 'DOWNLOADED', self.file_name_safe, download_directory)
-            except OSError:
-                _println(f"{Fore.RED}[FAILED TO DOWNLOAD FILE] {self.file_name_safe}")
-        else:
-            _println(f"{Fore.RED}[UNKNOWN STATUS CODE] {download.status_code}")
+                try:
+                    os.replace(part_location, download_location)
+                except OSError as e:
+                    _println(f"{Fore.RED}[FAILED TO DOWNLOAD FILE] {self.file_name_safe}")
+                    event_bus.publish(Failed(download_location, self.file_name_safe, e))
+                    return
+
+                # Possible Server Doesn't Supply ETag
+                self.course.record_manifest_entry(self, download.headers.get("ETag", -1))
+                status = 'LINKED' if digest is not None else 'UPDATED' if file_exists else 'DOWNLOADED'
+                _println("{}[{}] {}\n[LOCATION] {}", Fore.GREEN, status, self.file_name_safe, download_directory)
+                event_bus.publish(Finished(download_location, self.file_name_safe, status))
+            else:
+                _println(f"{Fore.RED}[UNKNOWN STATUS CODE] {download.status_code}")
+                event_bus.publish(Failed(download_location, self.file_name_safe))
+        finally:
+            download.close()  # Return the Connection to the Pool Even if the Body was Never Read
+
+    def _backup(self, download_location: str, headers: Dict[str, str]) -> None:
+        """
+        Moves the Outdated Local Copy of the Attachment into the Backups Folder
+
+        :param download_location: The Current Location of the Outdated File
+        :param headers: The Response Headers of the Newer Version (Used for its Last-Modified Date)
+        """
+        download_directory = os.path.dirname(download_location)
+        try:
+            backup_folder = os.path.join(download_directory, "backups")
+            split_file_name = self.file_name_safe.split('.')
+            date_updated = datetime.strptime(headers['Last-Modified'], "%a, %d %b %Y %H:%M:%S %Z")
+            new_file_name = "{}_{}.{}".format('.'.join(split_file_name[:-1]), date_updated.strftime('%d-%m-%Y'),
+                                              split_file_name[-1])
+            backup_file = os.path.join(backup_folder, f"_{new_file_name}")
+            _println(f"{Fore.YELLOW}[BACKING UP] {self.file_name_safe}\n[LOCATION] {backup_file}")
+            if not os.path.exists(f"{backup_folder}"):
+                os.makedirs(f"{backup_folder}")
+            os.replace(download_location, backup_file)
+        except (OSError, KeyError, ValueError):
+            _println(f"{Fore.RED}[FAILED BACKUP] Failed to Backup File: {self.file_name_safe}")
 
     @staticmethod
     def generate_attachment(content: BlackBoardContent, attachment_id: str) -> Optional[BlackBoardAttachment]:
@@ -1066,69 +2567,597 @@ class BlackBoardAttachment:
         except BlackBoardClient.BBRequestException:  # Request Error
             pass
 
-    def thread_download(self, path: str):
+    def thread_download(self, path: str, latch: Optional[CompletionLatch] = None):
         """
         Starts a Download Using the Thread Pool Provided by the Client
         :param path: The Save Path for the Attachment
+        :param latch: The Courses Completion Latch, Held Open Until this Download has Settled
         """
-        self.course.active_downloads += 1
-        self.client.thread_pool.enqueue(self.download, self.__download_callback, path)
+        if latch is not None:
+            latch.add()
+        try:
+            self.client.thread_pool.enqueue(self.download, partial(self.__download_callback, latch), path)
+        except DownloadQueue.DownloadQueueCancelled:
+            if latch is not None:
+                latch.done()
+            raise
 
-    def __download_callback(self, error: Optional[Exception]) -> None:
+    def __download_callback(self, latch: Optional[CompletionLatch], error: Optional[Exception]) -> None:
         """
-        A Callback Function that is called after an Attachment has been Downloaded so the Manifest
+        A Callback Function that is called after an Attachment has been Downloaded to Report Errors and Settle the
+        Download on the Courses Completion Latch
 
+        :param latch: The Courses Completion Latch (if Tracked)
         :param error: Provided if there was an Error During the Main Function Execution
         """
 
-        if error is not None:
+        if isinstance(error, DownloadQueue.DownloadQueueCancelled):
+            _println(f"{Fore.YELLOW}[PAUSED] {self.file_name_safe} (Will Resume on the Next Run)")
+        elif error is not None:
             _println(f"{Fore.RED}[FAILED TO DOWNLOAD FILE] {self.file_name_safe}\nError: {str(error)}")
 
-        # Probably Will Spam on Faster Downloads :(
-        time.sleep(1)  # I/O Block For 1 Sec to Give Time
-        self.course.active_downloads -= 1
-        if self.course.active_downloads < 1:
-            self.course.finished_course_downloads()
+        if latch is not None:
+            latch.done()
 
 
-class FunctionQueue:
+class CompletionLatch:
     """
-    Add Functions that are to be Executed in the Added Order
+    Fires a Callback Exactly Once, After it has been Closed and Every Item Added to it has Settled
+
+    -----
+
+    Items are Added as Work is Discovered and Settled as it Finishes (Whether it Succeeded or Not). Closing the Latch
+    Marks Discovery as Done, so the Count Briefly Reaching Zero While Work is Still Being Found Never Fires it Early
     """
-    def __init__(self):
-        self.queue: List[Tuple[Callable[..., None], Tuple[Any, ...], Dict[str, Any]]] = []
-        self.thread: Optional[threading.Thread] = None
 
-    def enqueue(self, fn: Callable[..., None], *args, **kwargs) -> None:
+    def __init__(self, on_complete: Callable[[], None]):
+        """
+        :param on_complete: Called (on Whichever Thread Settles the Last Item or Closes the Latch) Once Complete
+        """
+        self.on_complete = on_complete
+        self._pending = 0
+        self._closed = False
+        self._fired = False
+        self._complete = False
+        self._condition = threading.Condition()
+
+    def add(self) -> None:
         """
-        Places a Function into a Queue that is then executed in the order it was received
+        Holds the Latch Open for Another Item
+        """
+        with self._condition:
+            if self._fired:
+                raise RuntimeError("Cannot Add Items to a Completed Latch")
+            self._pending += 1
 
-        :param fn: Function to Execute
-        :param args: Arguments for the Provided Function
-        :param kwargs: Keyword Arguments for the Provided Function
+    def done(self) -> None:
+        """
+        Settles a Previously Added Item
         """
-        self.queue.append((fn, args, kwargs))
-        if self.thread is None:
-            self.thread = threading.Thread(target=self._run)
-            self.thread.start()
+        with self._condition:
+            self._pending -= 1
+        self.__fire_if_complete()
 
-    def _run(self) -> None:
+    def close(self) -> None:
         """
-        The Worker Function that Runs Inside a Thread Executing the Received Functions
+        Marks that No More Items Will be Added
         """
-        while len(self.queue) > 0:
-            (fn, args, kwargs) = self.queue.pop(0)
-            fn(*args, **kwargs)
+        with self._condition:
+            self._closed = True
+        self.__fire_if_complete()
 
-        # Probably Not the best idea to wastefully spam thread creations
-        # Sleep will also create some text pausing and jumping
-        time.sleep(0.8)  # Wait 0.8 Seconds and if no more Functions come Exit Thread..
-        if len(self.queue) > 0:
-            self._run()
-        self.thread = None
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks Until the Latch has Fired and its Callback has Returned
 
+        :param timeout: The Most Seconds to Wait (Forever if None)
+        :return: Whether the Latch has Completed
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._complete, timeout)
 
-function_queue = FunctionQueue()
+    def __fire_if_complete(self) -> None:
+        with self._condition:
+            if self._fired or not self._closed or self._pending > 0:
+                return
+            self._fired = True
+        try:
+            self.on_complete()
+        finally:
+            with self._condition:
+                self._complete = True
+                self._condition.notify_all()
+
+
+class CrawlSnapshot:
+    """
+    The Shape of a Courses Content Tree as it was Last Crawled, Used to Skip Listing Content that hasn't Changed
+
+    -----
+
+    The Modified Time, Title, Handler, Child IDs and Attachment IDs of Every Content Listed are Kept in the Courses
+    .snapshot.json. A Content is Skipped (Neither its Attachments nor its Children are Listed) when its Metadata
+    Matches the Snapshot, Every Child it had is Also in the Snapshot and Every Attachment it had is in the Manifest,
+    its Children are Then Taken from the Snapshot. A Change Deep in the Tree isn't Always Reflected in its Parents
+    Modified Time, so Everything is Listed Again Once the Last Full Crawl is Older than the Clients full_crawl_days
+    """
+
+    def __init__(self, course: BlackBoardCourse, course_location: str):
+        """
+        :param course: The Course the Snapshot Belongs to
+        :param course_location: The Local Directory of the Course
+        """
+        self.course = course
+        self.location = os.path.join(course_location, ".snapshot.json")
+        self.previous: Dict[str, dict] = {}
+        self.verified: Optional[datetime] = None  # When the Last Full Crawl Finished
+        try:
+            with open(self.location) as f:
+                snapshot = json.load(f)
+            self.previous = snapshot['contents']
+            self.verified = datetime.fromisoformat(snapshot['verified']) if snapshot.get('verified') else None
+        except (OSError, ValueError, KeyError, TypeError):  # No (Valid) Snapshot, so Crawl Everything
+            self.previous = {}
+            self.verified = None
+        self.full = self.verified is None or \
+            (datetime.now(timezone.utc) - self.verified).total_seconds() >= course.client.full_crawl_days * 86400
+        self.contents: Dict[str, dict] = {}
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def open(course: BlackBoardCourse, course_location: str) -> Optional[CrawlSnapshot]:
+        """
+        Opens the Snapshot of a Course if the Client Crawls Incrementally
+
+        :param course: The Course to Crawl
+        :param course_location: The Local Directory of the Course
+        :return: The Courses Snapshot (None if the Whole Tree Should Always be Listed)
+        """
+        if not course.client.incremental or course.manifest is None:
+            return None
+        return CrawlSnapshot(course, course_location)
+
+    def unchanged(self, content: BlackBoardContent) -> Optional[dict]:
+        """
+        Checks Whether a Content (and So its Whole Subtree) Can be Skipped
+
+        :param content: The Content About to be Crawled
+        :return: The Contents Entry in the Previous Snapshot (None if it Must be Listed)
+        """
+        if self.full:
+            return None
+        entry = self.previous.get(content.id, None)
+        modified = content._content_data.get('modified', None)
+        if entry is None or modified is None or entry.get('modified', None) != modified or \
+                entry.get('title', None) != content.title or entry.get('hasChildren', None) != content.has_children \
+                or entry.get('handler', None) != content.content_handler.id or 'attachments' not in entry:
+            return None
+        if content.has_children and ('children' not in entry or
+                                     any(child_id not in self.previous for child_id in entry['children'])):
+            return None
+        # Only Skip Attachments that were Actually Downloaded
+        downloaded = self.course.manifest.content_entries(content.id)
+        if any(attachment_id not in downloaded for attachment_id in entry['attachments']):
+            return None
+        return entry
+
+    def children(self, content: BlackBoardContent, entry: dict) -> List[BlackBoardContent]:
+        """
+        Rebuilds the Children of an Unchanged Content from the Snapshot
+
+        :param content: The Unchanged Content
+        :param entry: The Contents Entry in the Previous Snapshot
+        :return: The Children as they were Last Listed
+        """
+        children = []
+        for child_id in entry.get('children', []):
+            child = self.previous[child_id]
+            children.append(BlackBoardContent(self.course, {
+                'id': child_id, 'title': child['title'], 'parentId': content.id, 'hasChildren': child['hasChildren'],
+                'contentHandler': {'id': child['handler']}, 'modified': child['modified'],
+            }, ContentCrawler.CONTENT_FIELDS))
+        return children
+
+    def keep(self, content: BlackBoardContent, entry: dict) -> None:
+        """
+        Carries the Entry of a Skipped Content Over to the New Snapshot
+
+        :param content: The Skipped Content
+        :param entry: The Contents Entry in the Previous Snapshot
+        """
+        with self._lock:
+            self.contents[content.id] = entry
+            self.skipped += 1
+
+    def record_attachments(self, content: BlackBoardContent, attachment_ids: List[str]) -> None:
+        """
+        Records the Attachments Listed for a Content
+
+        :param content: The Listed Content
+        :param attachment_ids: The IDs of its Attachments
+        """
+        with self._lock:
+            self.__entry(content)['attachments'] = attachment_ids
+
+    def record_children(self, content: BlackBoardContent, child_ids: List[str]) -> None:
+        """
+        Records the Children Listed for a Content
+
+        :param content: The Listed Content
+        :param child_ids: The IDs of its Children
+        """
+        with self._lock:
+            self.__entry(content)['children'] = child_ids
+
+    def __entry(self, content: BlackBoardContent) -> dict:
+        entry = self.contents.get(content.id, None)
+        if entry is None:
+            entry = self.contents[content.id] = {
+                'title': content.title, 'hasChildren': content.has_children, 'handler': content.content_handler.id,
+                'modified': content._content_data.get('modified', None),
+            }
+        return entry
+
+    def save(self, complete: bool) -> None:
+        """
+        Writes the New Snapshot, Replacing the Previous One
+
+        :param complete: Whether Every Listing Succeeded (Only a Complete Full Crawl Resets the Full Crawl Schedule)
+        """
+        verified = datetime.now(timezone.utc) if self.full and complete else self.verified
+        with self._lock:
+            snapshot = {'verified': verified.isoformat() if verified is not None else None, 'contents': self.contents}
+            os.makedirs(os.path.dirname(self.location), exist_ok=True)
+            with open(self.location + ".tmp", 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(self.location + ".tmp", self.location)
+        if self.skipped:
+            _println(f"{Fore.CYAN}[UNCHANGED] {self.skipped} of {len(self.contents)} Contents in "
+                     f"{self.course.name_safe} Skipped Since the Last Crawl")
+
+
+class ContentCrawler:
+    """
+    Walks a Courses Content Tree Concurrently
+
+    -----
+
+    Sibling Folders, Child Listings and Attachment Listings are Fetched in Parallel on the Provided Executor, and Each
+    Attachment is Handed to the Callback as Soon as it is Discovered so Transfers Start While the Tree is Still Being
+    Walked
+    """
+
+    # The Only Fields the Crawl Uses, Requested so Listings Skip Bodies, Descriptions and Release Rules
+    CONTENT_FIELDS = ['id', 'title', 'parentId', 'hasChildren', 'contentHandler', 'modified']
+    ATTACHMENT_FIELDS = ['id', 'fileName', 'mimeType']
+
+    def __init__(self, course: BlackBoardCourse, executor: futures.Executor,
+                 on_attachment: Callable[[BlackBoardAttachment, str], None]):
+        """
+        :param course: The Course to Crawl
+        :param executor: The (Bounded) Executor to Run Listing Requests on
+        :param on_attachment: Called with Each Discovered Attachment and the Directory it Should be Saved to
+        """
+        self.course = course
+        self.executor = executor
+        self.on_attachment = on_attachment
+        self.cancelled = False
+        self.failed = False
+        self.snapshot: Optional[CrawlSnapshot] = None
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._discovery = None
+
+    def crawl(self, path: str) -> None:
+        """
+        Crawls the Entire Course and Blocks Until Every Listing has been Processed
+
+        :param path: The Directory the Course Content is Saved to
+        """
+        self.start(path)
+        self.wait()
+
+    def start(self, path: str) -> None:
+        """
+        Starts Crawling the Course Without Waiting for it to Finish
+
+        :param path: The Directory the Course Content is Saved to
+        """
+        self._discovery = profiler.phase(f"discovery {self.course.name_safe}")
+        self.snapshot = CrawlSnapshot.open(self.course, path)
+        self.__submit(self.__crawl_course, path)
+
+    def wait(self) -> None:
+        """
+        Blocks Until Every Listing has been Processed
+        """
+        with self._condition:
+            while self._pending > 0:
+                self._condition.wait()
+        if self.cancelled:
+            raise DownloadQueue.DownloadQueueCancelled()
+
+    def __submit(self, fn: Callable[..., None], *args) -> None:
+        """
+        Schedules a Crawl Task and Tracks it Until it has Settled (Finished, Failed or Been Cancelled)
+
+        :param fn: The Crawl Task
+        :param args: The Arguments for the Crawl Task
+        """
+        if self.cancelled:
+            return
+        with self._condition:
+            self._pending += 1
+        try:
+            self.executor.submit(fn, *args).add_done_callback(self.__settle)
+        except RuntimeError:  # Executor has been Shutdown
+            self.cancelled = True
+            self.__settle(None)
+
+    def __settle(self, future: Optional[futures.Future]) -> None:
+        """
+        Called Once a Crawl Task is Done
+
+        :param future: The Future of the Task (None if it was Never Scheduled)
+        """
+        if future is not None:
+            if future.cancelled():
+                self.cancelled = True
+            elif isinstance(future.exception(), DownloadQueue.DownloadQueueCancelled):
+                self.cancelled = True
+            elif future.exception() is not None:
+                self.failed = True
+                _println(f"{Fore.RED}[FAILED TO CRAWL] {self.course.name_safe}\nError: {str(future.exception())}")
+        with self._condition:
+            self._pending -= 1
+            if self._pending == 0:
+                self._discovery.end()
+                if self.snapshot is not None:
+                    self.snapshot.save(complete=not self.cancelled and not self.failed)
+                self._condition.notify_all()
+
+    def __crawl_course(self, path: str) -> None:
+        """
+        Lists the Top Level Course Contents
+
+        :param path: The Directory the Course Content is Saved to
+        """
+        for content in self.course.iter_contents(ContentCrawler.CONTENT_FIELDS, strict=True):
+            self.__submit(self.__crawl_content, content, path)
+
+    def __crawl_content(self, content: BlackBoardContent, path: str) -> None:
+        """
+        Schedules the Child Listing of a Content Item and then Lists its Attachments
+
+        :param content: The Content to Crawl
+        :param path: The Directory of the Contents Parent
+        """
+        if content.content_handler.id == "resource/x-bb-folder":
+            path = os.path.join(path, content.title_safe)
+        entry = self.snapshot.unchanged(content) if self.snapshot is not None else None
+        if entry is not None:  # Nothing to Download Here, and the Children are Already Known
+            self.snapshot.keep(content, entry)
+            for child in self.snapshot.children(content, entry):
+                self.__submit(self.__crawl_content, child, path)
+            return
+        if content.has_children:
+            self.__submit(self.__crawl_children, content, path)
+        attachment_ids = []
+        for attachment in content.iter_attachments(ContentCrawler.ATTACHMENT_FIELDS, strict=True):
+            attachment_ids.append(attachment.id)
+            event_bus.publish(Discovered(attachment.file_name_safe))
+            self.on_attachment(attachment, path)
+        if self.snapshot is not None:
+            self.snapshot.record_attachments(content, attachment_ids)
+
+    def __crawl_children(self, content: BlackBoardContent, path: str) -> None:
+        """
+        Lists the Children of a Content Item
+
+        :param content: The Parent Content
+        :param path: The Directory the Children are Saved to
+        """
+        child_ids = []
+        for child in content.iter_children(ContentCrawler.CONTENT_FIELDS, strict=True):
+            child_ids.append(child.id)
+            self.__submit(self.__crawl_content, child, path)
+        if self.snapshot is not None:
+            self.snapshot.record_children(content, child_ids)
+
+
+class CourseScheduler:
+    """
+    Crawls and Downloads Several Courses at Once
+
+    -----
+
+    Each Course Gets its Own Queues of Work (a Lane), and a Fixed Number of Workers Take Turns Pulling Tasks from Each
+    Lane in Round-Robin Order, so a Course with Thousands of Items Can't Starve the Courses Queued After it
+
+    Listing Requests and Transfers are Queued Separately and Run by their Own Workers, so Discovery is Bounded by the
+    Crawl Worker Count the Same Way it is When Downloading a Single Course
+    """
+
+    class Lane(futures.Executor):
+        """
+        A Single Courses Share of the Scheduler, Usable Anywhere an Executor is Expected
+        """
+
+        def __init__(self, scheduler: CourseScheduler, course: BlackBoardCourse):
+            """
+            :param scheduler: The Scheduler that Runs this Lanes Tasks
+            :param course: The Course the Lanes Tasks Belong to
+            """
+            self.scheduler = scheduler
+            self.course = course
+            self.crawls = collections.deque()
+            self.transfers = collections.deque()
+            self.pending = 0  # Queued and Running Tasks
+
+        def submit(self, fn: Callable[..., Any], *args, **kwargs) -> futures.Future:
+            return self.scheduler._enqueue(self, self.crawls, fn, args, kwargs)
+
+        def transfer(self, fn: Callable[..., Any], *args, **kwargs) -> futures.Future:
+            """
+            Queues a Download on the Lane, to be Run by the Schedulers Transfer Workers
+            """
+            return self.scheduler._enqueue(self, self.transfers, fn, args, kwargs)
+
+    def __init__(self, worker_count: int, crawl_worker_count: Optional[int] = None):
+        """
+        :param worker_count: The Total Number of Transfer Workers Shared Between All Courses
+        :param crawl_worker_count: The Total Number of Discovery Workers Shared Between All Courses (Defaults to
+        worker_count)
+        """
+        self.worker_count = worker_count
+        self.crawl_worker_count = crawl_worker_count or worker_count
+        self._lanes: List[CourseScheduler.Lane] = []
+        self._next_lane = {'crawls': 0, 'transfers': 0}
+        self._completed = 0
+        self._cancelled = False
+        self._condition = threading.Condition()
+        queue_depth.track(lambda: sum(len(lane.crawls) + len(lane.transfers) for lane in self._lanes), queue='courses')
+
+    def run(self, courses: List[BlackBoardCourse], save_location: str) -> None:
+        """
+        Crawls and Downloads All the Provided Courses, Blocking Until Every Course has Finished
+
+        :param courses: The Courses to Download
+        :param save_location: The Base Location to Save All Attachment Downloads
+        """
+        self._lanes = [CourseScheduler.Lane(self, course) for course in courses]
+        for lane in self._lanes:
+            ContentCrawler(lane.course, lane, partial(self.__download, lane)) \
+                .start(os.path.join(save_location, lane.course.name_safe))
+
+        workers = [threading.Thread(target=self.__work, args=('crawls',), daemon=True)
+                   for _ in range(self.crawl_worker_count)]
+        workers += [threading.Thread(target=self.__work, args=('transfers',), daemon=True)
+                    for _ in range(self.worker_count)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        if self._cancelled:
+            raise DownloadQueue.DownloadQueueCancelled()
+
+    def shutdown(self) -> None:
+        """
+        Cancels All Queued Tasks, Letting the Currently Running Tasks Finish
+        """
+        with self._condition:
+            self._cancelled = True
+            for lane in self._lanes:
+                for tasks in (lane.crawls, lane.transfers):
+                    while tasks:
+                        tasks.popleft()[0].cancel()
+            self._condition.notify_all()
+
+    def _enqueue(self, lane: CourseScheduler.Lane, tasks: collections.deque, fn: Callable[..., Any], args: tuple,
+                 kwargs: dict) -> futures.Future:
+        """
+        Queues a Task on the Given Lane
+
+        :param lane: The Lane of the Course the Task Belongs to
+        :param tasks: The Lanes Crawl or Transfer Queue
+        :param fn: The Task to Run
+        :param args: The Arguments for the Task
+        :param kwargs: The Keyword Arguments for the Task
+        :return: A Future Representing the Task
+        """
+        future = futures.Future()
+        with self._condition:
+            if self._cancelled:
+                raise RuntimeError("Cannot Schedule New Tasks After Shutdown")
+            lane.pending += 1
+            tasks.append((future, fn, args, kwargs))
+            self._condition.notify_all()  # Wake a Worker of the Right Kind
+        return future
+
+    def __next_task(self, kind: str) \
+            -> Optional[Tuple[CourseScheduler.Lane, Tuple[futures.Future, Callable, tuple, dict]]]:
+        """
+        Waits for the Next Task, Starting the Search at the Lane After the One Last Served
+
+        :param kind: The Queue to Take the Task from ('crawls' or 'transfers')
+        :return: The Lane and Task to Run, or None Once Every Course has Finished (or the Scheduler was Cancelled)
+        """
+        with self._condition:
+            while not self._cancelled and self._completed < len(self._lanes):
+                for offset in range(len(self._lanes)):
+                    index = (self._next_lane[kind] + offset) % len(self._lanes)
+                    tasks = getattr(self._lanes[index], kind)
+                    if tasks:
+                        self._next_lane[kind] = (index + 1) % len(self._lanes)
+                        return self._lanes[index], tasks.popleft()
+                self._condition.wait()
+        return None
+
+    def __work(self, kind: str) -> None:
+        """
+        The Worker Loop that Runs Tasks Until Every Course has Finished
+
+        :param kind: The Queue the Worker Takes Tasks from ('crawls' or 'transfers')
+        """
+        while True:
+            task = self.__next_task(kind)
+            if task is None:
+                return
+            lane, (future, fn, args, kwargs) = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            self.__settle(lane)
+
+    def __settle(self, lane: CourseScheduler.Lane) -> None:
+        """
+        Marks a Task of the Lane as Done, Reporting the Course as Finished Once its Last Task has Settled
+
+        -----
+
+        Tasks Only Ever Queue More Work for their Lane Before they Finish, so a Lane Only Empties Once Discovery and
+        All of its Transfers are Done
+
+        :param lane: The Lane the Settled Task Belonged to
+        """
+        with self._condition:
+            lane.pending -= 1
+            finished = lane.pending == 0 and not self._cancelled
+            if finished:
+                self._completed += 1
+                completed = self._completed
+                self._condition.notify_all()
+        if finished:
+            lane.course.finished_course_downloads()
+            _println(f"{Fore.MAGENTA}[{completed}/{len(self._lanes)} COURSES COMPLETE]")
+
+    @staticmethod
+    def __download(lane: CourseScheduler.Lane, attachment: BlackBoardAttachment, path: str) -> None:
+        """
+        Queues the Download of a Discovered Attachment on its Courses Lane
+
+        :param lane: The Lane of the Attachments Course
+        :param attachment: The Attachment to Download
+        :param path: The Directory to Save the Attachment to
+        """
+
+        def report(future: futures.Future) -> None:
+            if future.cancelled():
+                return
+            if isinstance(future.exception(), DownloadQueue.DownloadQueueCancelled):
+                _println(f"{Fore.YELLOW}[PAUSED] {attachment.file_name_safe} (Will Resume on the Next Run)")
+            elif future.exception() is not None:
+                _println(f"{Fore.RED}[FAILED TO DOWNLOAD FILE] {attachment.file_name_safe}\n"
+                         f"Error: {str(future.exception())}")
+
+        try:
+            lane.transfer(attachment.download, path).add_done_callback(report)
+        except RuntimeError:
+            raise DownloadQueue.DownloadQueueCancelled()
 
 
 def _println(text: str, *args, **kwargs) -> None:
@@ -1138,8 +3167,7 @@ def _println(text: str, *args, **kwargs) -> None:
     :param args: The Formatting Arguments
     :keyword new_line: Append new line at the end of the print message (defaults to True)
     """
-    function_queue.enqueue(print, text.format(*args) + Fore.RESET + ('\n' if kwargs.get('new_line', True) else ''))
-    # print(text.format(*args) + f"{Fore.RESET}\n")
+    event_bus.publish(Message(text.format(*args) + Fore.RESET + ('\n' if kwargs.get('new_line', True) else '')))
 
 
 def _to_date(date_string) -> Optional[datetime]:
@@ -1157,6 +3185,426 @@ def _to_date(date_string) -> Optional[datetime]:
             return datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S.%fZ')
 
 
+class PartialDownload:
+    """
+    Tracks the Temporary (.part) File of a Download so an Interrupted Transfer Can be Resumed
+
+    -----
+
+    Alongside the .part File a Small JSON State File Records the ETag of the Version Being Downloaded and How Many
+    Bytes of it are Safely on Disk. The Next Attempt Requests the Remainder with Range/If-Range, so if the File has
+    Changed (or the Server Ignores Ranges) the Full File is Sent Instead and the Download Starts Over
+
+    A File Fetched in Segments is Written Out of Order, so its State Records the Byte Ranges on Disk Instead. The Next
+    Attempt Requests the Whole File and SegmentedDownload Only Fetches the Missing Ranges if the ETag Still Matches
+    """
+
+    SAVE_INTERVAL = 16 * 1024 * 1024  # Bytes Written Between Recording Progress
+
+    def __init__(self, location: str, hash_content: bool = False):
+        """
+        :param location: The Final Location of the File
+        :param hash_content: Hash the File as it is Written (For the BlobStore)
+        """
+        self.location = location
+        self.part_location = location + ".part"
+        self.state_location = self.part_location + ".json"
+        self.etag: Optional[str] = None
+        self.written = 0
+        self.ranges: Optional[List[Tuple[int, int]]] = None  # The Byte Ranges on Disk (Segmented Downloads Only)
+        self.hash_content = hash_content
+        self.hasher = None
+        self._last_saved = 0
+        try:
+            with open(self.state_location) as f:
+                state = json.load(f)
+            self.etag = state['etag']
+            # Never Trust More than is Actually on Disk
+            if state.get('ranges', None) is not None:
+                size = os.path.getsize(self.part_location)
+                self.ranges = [(int(start), int(end)) for start, end in state['ranges']]
+                if self.etag is None or any(not 0 <= start <= end < size for start, end in self.ranges):
+                    raise ValueError("Recorded Ranges are Past the End of the .part File")
+                self.written = sum(end - start + 1 for start, end in self.ranges)
+            else:
+                self.written = min(int(state['written']), os.path.getsize(self.part_location))
+        except (OSError, ValueError, KeyError, TypeError):  # No (Valid) Partial Download
+            self.etag = None
+            self.written = 0
+            self.ranges = None
+
+    def request_headers(self) -> Dict[str, str]:
+        """
+        Generates the Headers Required to Request Only the Missing Part of the File
+
+        :return: The Range/If-Range Headers (Empty if there is Nothing to Resume, or the Missing Parts are Fetched
+        in Segments Once the Whole Files Headers have Confirmed it hasn't Changed)
+        """
+        if self.etag is None or self.written <= 0 or self.ranges is not None:
+            return {}
+        return {"Range": f"bytes={self.written}-", "If-Range": self.etag}
+
+    def open(self, status_code: int, headers: Dict[str, str]):
+        """
+        Opens the .part File for the Response Body, Continuing Where it Left Off if the Server Resumed the Transfer
+
+        :param status_code: The Status Code of the Response
+        :param headers: The Headers of the Response
+        :return: The .part File Opened for Writing at the Correct Offset
+        """
+        content_range = _parse_content_range(headers.get('Content-Range', None))
+        resumed = status_code == 206 and content_range is not None and content_range[0] == self.written
+        if status_code == 206 and not resumed:
+            self.discard()
+            raise OSError("Server Resumed the Download From an Unexpected Offset")
+        if not resumed:
+            self.written = 0
+        self.ranges = None  # Streamed in Order from Here
+        total = content_range[1] if resumed else headers.get('Content-Length', None)
+
+        etag = headers.get('ETag', None)
+        self.etag = etag if etag and not etag.startswith('W/') else None  # Weak ETags Can't be Used with If-Range
+
+        file_out = open(self.part_location, 'r+b' if resumed else 'wb')
+        if self.hash_content:
+            self.hasher = hashlib.sha256()
+            remaining = self.written  # Bytes Kept from the Earlier Attempt (the File May be Preallocated Past them)
+            while remaining > 0:
+                chunk = file_out.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                self.hasher.update(chunk)
+                remaining -= len(chunk)
+        if total is not None and str(total).isdigit():
+            _preallocate(file_out, int(total))
+        file_out.seek(self.written)
+        self._save()
+        event_bus.publish(Started(self.location, os.path.basename(self.location),
+                                  int(total) if total is not None and str(total).isdigit() else None, self.written))
+        return file_out
+
+    def wrote(self, file_out, chunk: bytes) -> None:
+        """
+        Records that Another Chunk has been Written, Periodically Saving Progress
+
+        :param file_out: The .part File
+        :param chunk: The Bytes Written
+        """
+        size = len(chunk)
+        self.written += size
+        if self.hasher is not None:
+            self.hasher.update(chunk)
+        event_bus.publish(Bytes(self.location, size))
+        if self.written - self._last_saved >= PartialDownload.SAVE_INTERVAL:
+            file_out.flush()
+            self._save()
+
+    def finish(self, file_out, complete: bool) -> None:
+        """
+        Closes the .part File, Keeping it (and its State) for Later if the Transfer was Interrupted
+
+        :param file_out: The .part File
+        :param complete: Whether the Entire Body was Written
+        """
+        # Trim Anything Preallocated but Not Yet Written
+        file_out.truncate(self.written)
+        file_out.close()
+        if complete:
+            self._remove(self.state_location)
+        elif self.etag is not None:
+            self._save()
+        else:  # Can't Safely Resume Without an ETag to Validate Against
+            self.discard()
+
+    def stream(self, response: requests.Response, chunk_size: int, stop: Optional[threading.Event] = None) -> str:
+        """
+        Streams a Response Body into the .part File
+
+        -----
+
+        At Most chunk_size Bytes of the Body are Held in Memory at Once. The Caller is Responsible for Renaming the
+        Returned File into Place, so an Interrupted Download Never Replaces a Complete File
+
+        :param response: A Response Requested with stream=True
+        :param chunk_size: The Number of Bytes to Read and Write at a Time
+        :param stop: When Set, the Transfer is Interrupted (and Kept for Resuming) After the Current Chunk
+        :return: The Location of the Completed .part File
+        """
+        file_out = self.open(response.status_code, response.headers)
+        try:
+            for chunk in profiler.timed(response.iter_content(chunk_size=chunk_size), 'transfer'):
+                if stop is not None and stop.is_set():
+                    raise DownloadQueue.DownloadQueueCancelled()
+                if chunk:
+                    with profiler.phase('write'):
+                        file_out.write(chunk)
+                    self.wrote(file_out, chunk)
+        except BaseException:
+            self.finish(file_out, complete=False)
+            raise
+        self.finish(file_out, complete=True)
+        return self.part_location
+
+    def record_ranges(self, etag: Optional[str], ranges: List[Tuple[int, int]]) -> None:
+        """
+        Records the Byte Ranges of a Segmented Download that are Safely on Disk
+
+        :param etag: The ETag of the Version Being Downloaded (Without One the Download Can't be Resumed)
+        :param ranges: The (Inclusive) Byte Ranges Written and Flushed to the .part File
+        """
+        if etag is None:
+            self.discard()
+            return
+        self.etag = etag
+        self.ranges = _merge_ranges(ranges)
+        self.written = sum(end - start + 1 for start, end in self.ranges)
+        self._save()
+
+    def completed(self) -> None:
+        """
+        Forgets the Recorded Progress Once the .part File is Complete
+        """
+        self._remove(self.state_location)
+        self.ranges = None
+
+    def digest(self) -> str:
+        """
+        Finishes Hashing the Completed .part File
+
+        :return: The Hex SHA-256 Digest of the File
+        """
+        if self.hasher is not None and self.written == os.path.getsize(self.part_location):
+            return self.hasher.hexdigest()
+        return _hash_file(self.part_location)  # Not Hashed While Written (eg. Fetched in Segments)
+
+    def discard(self) -> None:
+        """
+        Deletes the .part File and its State
+        """
+        self._remove(self.part_location)
+        self._remove(self.state_location)
+        self.etag = None
+        self.written = 0
+        self.ranges = None
+
+    def _save(self) -> None:
+        """
+        Records the ETag and Number of Bytes Written (and Which Ranges they Cover for a Segmented Download)
+        """
+        state = {'etag': self.etag, 'written': self.written}
+        if self.ranges is not None:
+            state['ranges'] = self.ranges
+        with open(self.state_location, 'w') as f:
+            json.dump(state, f)
+        self._last_saved = self.written
+
+    @staticmethod
+    def _remove(location: str) -> None:
+        if os.path.isfile(location):
+            os.remove(location)
+
+
+class SegmentedDownload:
+    """
+    Fetches a Large File as Several Byte Ranges over Separate Connections in Parallel
+
+    -----
+
+    Each Segment is Written Directly at its Offset in a Preallocated .part File. The Initial (Full) Response is Kept
+    Open Until the Server has Proven it Honours Ranges, so it Can Still be Streamed Normally if it Doesn't. Segments
+    are Requested Through the Client Like Any Other Request, so they Share its Rate Limit, Throttling Backoff and
+    Re-Authentication
+
+    The Ranges Written are Periodically Recorded in the PartialDownload's State (and Always When the Transfer Fails or
+    is Interrupted), so a Later Attempt at the Same Version Only Fetches the Ranges Still Missing
+    """
+
+    class Unsupported(Exception):
+        """
+        Raised When the Server Doesn't Honour the Segment Range Requests
+        """
+        pass
+
+    def __init__(self, client: BlackBoardClient, response: requests.Response, endpoint: str):
+        """
+        :param client: The Client Whose Session the Segments are Fetched With
+        :param response: The Initial (200) Response for the Whole File
+        :param endpoint: The Download Endpoint (API Path) the Response Came From
+        """
+        self.client = client
+        self.endpoint = endpoint
+        self.response = response
+        self.size = int(response.headers['Content-Length'])
+        etag = response.headers.get('ETag', None)
+        self.etag = etag if etag and not etag.startswith('W/') else None
+        self._failed = threading.Event()
+        self._lock = threading.Lock()
+        self._kept: List[Tuple[int, int]] = []  # Ranges Already on Disk from an Earlier Attempt
+        self._written: Dict[int, int] = {}  # Bytes Written (and Flushed) so Far by Each Segment, by its First Byte
+        self._unsaved = 0
+
+    @staticmethod
+    def applicable(client: BlackBoardClient, response: requests.Response) -> bool:
+        """
+        Checks Whether a Response is Large Enough to be Segmented and the Server Advertises Byte Range Support
+
+        :param client: The Client Holding the Segment Configuration
+        :param response: The Initial Response for the File
+        :return: Whether the File Should be Fetched in Segments
+        """
+        content_length = response.headers.get('Content-Length', '')
+        return client.segments > 1 and response.status_code == 200 and content_length.isdigit() and \
+            int(content_length) >= client.segment_threshold and \
+            response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+
+    def fetch(self, partial_download: PartialDownload) -> str:
+        """
+        Fetches Every Segment, Blocking Until the File is Complete
+
+        :param partial_download: The Partial Download Tracking the Files .part Location
+        :return: The Location of the Completed .part File
+        """
+        self.client.rate_controller.idle(self.response)  # Unread While the Segments are Fetched, so Not in Flight
+        if partial_download.ranges is not None and self.etag is not None and partial_download.etag == self.etag \
+                and os.path.isfile(partial_download.part_location) \
+                and os.path.getsize(partial_download.part_location) == self.size:
+            self._kept = list(partial_download.ranges)  # The Same Version, so Only Fetch What is Missing
+        else:
+            partial_download.discard()
+            with open(partial_download.part_location, 'wb') as file_out:
+                _preallocate(file_out, self.size)
+        kept = sum(end - start + 1 for start, end in self._kept)
+        event_bus.publish(Started(partial_download.location, os.path.basename(partial_download.location), self.size,
+                                  kept))
+
+        missing, position = [], 0
+        for start, end in self._kept + [(self.size, self.size)]:
+            if start > position:
+                missing.append((position, start - 1))
+            position = max(position, end + 1)
+        segment_size = -(-(self.size - kept) // self.client.segments)  # Ceiling Division
+        bounds = [(start, min(start + segment_size - 1, end))
+                  for first, end in missing for start in range(first, end + 1, segment_size)]
+        with futures.ThreadPoolExecutor(max_workers=max(min(len(bounds), self.client.segments), 1)) as pool:
+            segments = [pool.submit(self.__fetch_segment, partial_download, start, end)
+                        for start, end in bounds]
+            try:
+                for segment in futures.as_completed(segments):
+                    segment.result()
+            except SegmentedDownload.Unsupported:
+                self.__stop(segments)
+                partial_download.discard()  # Streamed from the Start Instead
+                raise
+            except BaseException:
+                self.__stop(segments)
+                with self._lock:
+                    self.__save(partial_download)  # Kept for the Next Attempt to Resume
+                raise
+        partial_download.completed()
+        return partial_download.part_location
+
+    def __stop(self, segments: List[futures.Future]) -> None:
+        """
+        Stops the Remaining Segments, Waiting for the Running Ones to Return
+
+        :param segments: Every Segment of the Transfer
+        """
+        self._failed.set()
+        for segment in segments:
+            segment.cancel()
+        futures.wait(segments)
+
+    def __save(self, partial_download: PartialDownload) -> None:
+        """
+        Records Every Range on Disk in the Partial Downloads State. Must be Called Holding self._lock
+
+        :param partial_download: The Partial Download Tracking the .part File
+        """
+        partial_download.record_ranges(self.etag, self._kept + [(start, start + written - 1) for start, written
+                                                                in self._written.items() if written > 0])
+        self._unsaved = 0
+
+    def __fetch_segment(self, partial_download: PartialDownload, start: int, end: int) -> None:
+        """
+        Fetches a Single Byte Range and Writes it at its Offset
+
+        :param partial_download: The Partial Download Tracking the Preallocated .part File
+        :param start: The First Byte of the Segment
+        :param end: The Last Byte of the Segment (Inclusive)
+        """
+        headers = {"Range": f"bytes={start}-{end}"}
+        if self.etag is not None:
+            headers["If-Range"] = self.etag
+        # A Single Attempt, as a Failed Segment Fails the Whole Transfer, which download() Retries
+        with self.client.send_get_request(self.endpoint, retry=RetryPolicy.once(), allow_redirects=True,
+                                          headers=headers, stream=True) as segment:
+            content_range = _parse_content_range(segment.headers.get('Content-Range', None))
+            if segment.status_code != 206 or content_range is None or content_range[0] != start:
+                raise SegmentedDownload.Unsupported()
+            written = 0
+            with open(partial_download.part_location, 'r+b') as file_out:
+                file_out.seek(start)
+                for chunk in profiler.timed(segment.iter_content(chunk_size=self.client.chunk_size), 'transfer'):
+                    if self.client.stop_event.is_set():
+                        raise DownloadQueue.DownloadQueueCancelled()
+                    if self._failed.is_set():
+                        return
+                    if chunk:
+                        with profiler.phase('write'):
+                            file_out.write(chunk)
+                            file_out.flush()  # Only Bytes Handed to the OS are Recorded as Written
+                        written += len(chunk)
+                        event_bus.publish(Bytes(partial_download.location, len(chunk)))
+                        with self._lock:
+                            self._written[start] = written
+                            self._unsaved += len(chunk)
+                            if self._unsaved >= PartialDownload.SAVE_INTERVAL:
+                                self.__save(partial_download)
+            if written != end - start + 1:
+                raise OSError(f"Segment {start}-{end} Ended After {written} Bytes")
+
+
+def _parse_content_range(content_range: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Parses a Content-Range Header (eg. "bytes 100-999/1000")
+
+    :param content_range: The Header Value
+    :return: The First Byte Position and the Complete Length (None if Unknown) if the Header is Valid
+    """
+    match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", content_range or '')
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2)) if match.group(2) != '*' else None
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    :param ranges: Inclusive Byte Ranges, in Any Order
+    :return: The Same Bytes as the Fewest Sorted Ranges
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _preallocate(file, size: int) -> None:
+    """
+    Reserves Disk Space for a File that is About to be Written
+
+    :param file: The File Object Opened for Writing
+    :param size: The Number of Bytes to Reserve
+    """
+    try:
+        os.posix_fallocate(file.fileno(), 0, size)
+    except (AttributeError, OSError):  # Not Available on Windows or Unsupported by the File System
+        file.truncate(size)
+        file.seek(0)
+
+
 class DownloadQueue(futures.ThreadPoolExecutor):
     """
     A Download Queue to Allow For Multi-Threaded Downloads
@@ -1173,6 +3621,9 @@ class DownloadQueue(futures.ThreadPoolExecutor):
         :param thread_count: The Maximum Number of Worker Threads to Spawn
         """
         super().__init__(max_workers=thread_count)
+        self.waiting = 0  # Queued Downloads that No Worker has Started Yet
+        self._waiting_lock = threading.Lock()
+        queue_depth.track(lambda: self.waiting, queue='downloads')
 
     def enqueue(self, fn: Callable[..., None], cb: Callable[[Optional[Exception]], None], *args) -> None:
         """
@@ -1182,13 +3633,28 @@ class DownloadQueue(futures.ThreadPoolExecutor):
         :param cb: The Function to Call After Execution
         :param args: The Arguments For the Function to Execute (fn)
         """
+        with self._waiting_lock:
+            self.waiting += 1
         try:
-            self.submit(DownloadQueue.__fn_with_cb, *(fn, cb, *args))
+            self.submit(self.__fn_with_cb, *(fn, cb, *args)).add_done_callback(partial(self.__cancelled, cb))
         except RuntimeError:
+            with self._waiting_lock:
+                self.waiting -= 1
             raise DownloadQueue.DownloadQueueCancelled()
 
-    @staticmethod
-    def __fn_with_cb(fn: Callable[..., None], cb: Callable[[Optional[Exception]], None], *args) -> None:
+    def __cancelled(self, cb: Callable[[Optional[Exception]], None], future: futures.Future) -> None:
+        """
+        Still Calls the Callback for a Queued Function that was Cancelled (By a Shutdown) Before it Could Run
+
+        :param cb: The Function to Call After Execution
+        :param future: The Future of the Queued Function
+        """
+        if future.cancelled():
+            with self._waiting_lock:
+                self.waiting -= 1
+            cb(DownloadQueue.DownloadQueueCancelled())
+
+    def __fn_with_cb(self, fn: Callable[..., None], cb: Callable[[Optional[Exception]], None], *args) -> None:
         """
         The Function That is Passed into the ThreadPool and wraps the functions in a Try Except to Detect Errors
 
@@ -1196,6 +3662,8 @@ class DownloadQueue(futures.ThreadPoolExecutor):
         :param cb: The Function to Call After Execution
         :param args: The Arguments For the Function to Execute (fn)
         """
+        with self._waiting_lock:
+            self.waiting -= 1
         error = None
         try:
             fn(*args)
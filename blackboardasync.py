@@ -0,0 +1,570 @@
+"""
+Blackboard Async Module Provides asyncio Variants of the Blackboard Classes
+
+-----
+
+Every Request is Made on a Single Event Loop and Limited by the Clients max_concurrency, so Hundreds of Metadata
+Requests and Downloads can be in Flight Without a Thread Each
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import time
+
+import aiohttp
+import xmltodict
+from colorama import Fore
+from typing import AsyncIterator, List, Optional, Tuple
+
+from blackboardevents import event_bus, Discovered, Finished, Failed
+from blackboardmetrics import observe_request, record_retry
+from blackboardprofile import profiler
+from blackboard import BlackBoardClient, BlackBoardCourse, BlackBoardContent, BlackBoardAttachment, \
+    BlackBoardEndPoints, ContentCrawler, PartialDownload, RateController, RetryPolicy, get_cookies, \
+    _parse_retry_after, _println
+
+
+class AsyncBlackBoardClient(BlackBoardClient):
+    """
+    Represents The User (Client) Account Session of a Blackboard Server Using asyncio
+
+    -----
+
+    Must be Used as an Async Context Manager so the HTTP Session is Opened and Closed on the Running Event Loop
+    """
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Arguments to Set Certain Client Options (See BlackBoardClient, the Account, Storage and Retry
+        Options Apply but the Thread, Pool and Rate Controller Options Don't, as Requests are Sent on the Event Loop)
+        :keyword max_concurrency: The Maximum Number of Requests (Metadata and Downloads) in Flight at Once
+        :keyword connect_timeout: Seconds to Wait when Opening a Connection
+        :keyword read_timeout: Seconds to Wait Between Bytes Received from the Server
+        """
+        self._configure(**kwargs)  # No Requests Session, Download Queue or Thread Pools are Needed
+        self.__password = kwargs.get('password', None)
+        self.max_concurrency = int(kwargs.get('max_concurrency', 100))
+        self.timeout = (float(kwargs.get('connect_timeout', 10)), float(kwargs.get('read_timeout', 60)))
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.limit: Optional[asyncio.Semaphore] = None
+        self._paused_until = 0.0  # Event Loop Time Until Which Requests Wait Out a Throttling Response
+        self.http_cache = None  # API Responses aren't Cached by the asyncio Client
+
+    async def __aenter__(self) -> AsyncBlackBoardClient:
+        self.limit = asyncio.Semaphore(self.max_concurrency)
+        self._async_login_lock = asyncio.Lock()
+        # No Total Timeout (aiohttp Defaults to 5 Minutes), so Only a Stalled Transfer is Cut Off, Not a Long One
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout[0], sock_read=self.timeout[1]))
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.session.close()
+
+    async def login(self) -> Tuple[bool, int]:
+        """
+        Attempts to Log the User Into the Provided Blackboard Learn Server Using the Specified Username and Password
+
+        :return: Returns a Tuple Containing whether the Login was a Success [0] and the
+        Status Code From the Login Endpoint [1]
+        """
+        if self.browser:
+            cookie_jar = await asyncio.get_running_loop().run_in_executor(None, get_cookies, self.site, self.browser)
+            if cookie_jar is not None:
+                self.session.cookie_jar.update_cookies({cookie.name: cookie.value for cookie in cookie_jar})
+
+        if self.institute is None or self.institute.b2_url is None:
+            login_endpoint = self.site + "/webapps/Bb-mobile-bb_bb60/"
+        else:
+            login_endpoint = self.institute.b2_url
+
+        async with self.session.post(login_endpoint + "sslUserLogin",
+                                     data={'username': self.username, 'password': self.__password}) as login:
+            login_text = await login.text()
+            if login.status == 200:
+                response_xml = xmltodict.parse(login_text)['mobileresponse']
+                if response_xml['@status'] == 'OK':
+                    self.use_rest_api = response_xml['@use_learn_rest_api']
+                    self.api_version = self.LearnAPIVersion(response_xml['@learn_version'])
+                    if self.browser:
+                        # Sent Directly, as login() Runs Under reauthenticate()'s Lock and a 401 Here (Expired
+                        # Browser Cookies) Must Fail the Login Rather than Try to Log in Again
+                        endpoint = BlackBoardEndPoints.get_user_by_username(self.username)
+                        async with self.session.get(self.site + endpoint) as user:
+                            try:
+                                self.user_id = (await user.json(content_type=None))['results'][0]['id']
+                            except (ValueError, KeyError, IndexError, TypeError):  # Rejected or Malformed Response
+                                return False, user.status
+                        self.batch_uid = None
+                    else:
+                        self.user_id = response_xml['@userid']
+                        self.batch_uid = response_xml['@batch_uid']
+                    return True, login.status
+            return False, login.status
+
+    async def reauthenticate(self, stale_generation: int) -> None:
+        """
+        Logs Back in After a Request was Rejected (401), Unless Another Task has Already Done so
+
+        :param stale_generation: The session_generation at the Time the Rejected Request was Sent
+        """
+        async with self._async_login_lock:
+            if self.session_generation == stale_generation:
+                await self.login()
+                self.session_generation += 1
+
+    async def wait_out_throttling(self) -> None:
+        """
+        Waits Until Any Pause Requested by a Throttling Response has Passed
+        """
+        pause = self._paused_until - asyncio.get_running_loop().time()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    def back_off(self, endpoint: str, status: int, retry_after: Optional[float]) -> None:
+        """
+        Pauses Every Request for a Throttling Responses Retry-After (or the Default Backoff)
+
+        :param endpoint: The API Path that was Throttled
+        :param status: The Throttling Status Code
+        :param retry_after: The Seconds the Server Asked to Wait (None if it Didn't Say)
+        """
+        record_retry(endpoint, 'throttled')
+        _println(f"{Fore.YELLOW}[THROTTLED] {status} From {endpoint}")
+        self._paused_until = max(self._paused_until, asyncio.get_running_loop().time() + (
+            retry_after if retry_after is not None else RateController.DEFAULT_BACKOFF))
+
+    def throttling_failure(self, status: int, retry_after: Optional[float]) -> str:
+        """
+        :param status: The Status Code of the Last Throttling Response
+        :param retry_after: The Seconds it Asked to Wait (None if it Didn't Say)
+        :return: The Error Recorded Once a Request has Run Out of Throttle Retries
+        """
+        return f"Throttled {self.throttle_retries + 1} Time(s), Last With Status {status} " \
+               f"(Retry-After: {retry_after if retry_after is not None else 'None'})"
+
+    async def get_json(self, endpoint: str) -> Optional[dict]:
+        """
+        Sends a GET Request to the Endpoint Specified Using the Clients Base Site and Decodes the JSON Response
+
+        -----
+
+        Follows the Same Policy as the Synchronous Client: a 401 Logs Back in Once, a Throttling Response (429/503)
+        Pauses Every Request for the Servers Retry-After and is Retried up to throttle_retries Times, and Transient
+        Failures (Dropped Connections, Timeouts and 500/502/504 Responses) are Retried with Backoff According to the
+        Metadata Retry Policy, Only Being Recorded as Failed in the Retry Report Once it is Exhausted
+
+        :param endpoint: The API Path that the Client Should Take (Excluding the Base Path)
+        :return: The Decoded Response if the Request was Successful
+        """
+        policy = self.metadata_retry
+        attempt = throttled = 0
+        reauthenticated = False
+        while True:
+            generation = self.session_generation
+            await self.wait_out_throttling()
+            status, error, retry_after = None, None, None
+            async with self.limit:
+                started = time.perf_counter()
+                try:
+                    with profiler.phase('request'):
+                        response = await self.session.get(self.site + endpoint)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:  # Transient
+                    observe_request(endpoint, e, time.perf_counter() - started)
+                    error = str(e) or type(e).__name__
+                else:
+                    async with response:
+                        observe_request(endpoint, response.status, time.perf_counter() - started)
+                        status, error = response.status, f"Status {response.status}"
+                        if status in RateController.THROTTLING_STATUS_CODES:
+                            retry_after = _parse_retry_after(response.headers.get('Retry-After', None))
+                        elif (status != 401 or reauthenticated) and status not in RetryPolicy.TRANSIENT_STATUS_CODES:
+                            if status in (400, 403, 404):  # Bad Request | Forbidden | Not Found
+                                _println(f"{Fore.RED}REST Exception:\nPath: {response.url}\nStatus: {status}")
+                                return None
+                            try:
+                                return await response.json(content_type=None)
+                            except ValueError:  # JSON Response Malformed
+                                _println("{}[ERROR] Failed to Decode JSON Response From Endpoint: {}",
+                                         Fore.RED, self.site + endpoint)
+                                return None
+            if status == 401:  # Unauthorised, Log Back In (Outside the Limit so Waiting Requests Can't Starve it)
+                reauthenticated = True
+                await self.reauthenticate(generation)
+            elif status in RateController.THROTTLING_STATUS_CODES:
+                throttled += 1
+                if throttled > self.throttle_retries:
+                    self.retry_report.failed(endpoint, self.throttling_failure(status, retry_after))
+                    return None
+                self.back_off(endpoint, status, retry_after)
+            else:
+                if attempt + 1 >= policy.attempts:
+                    self.retry_report.failed(endpoint, error)
+                    return None
+                self.retry_report.retried(endpoint, error)
+                record_retry(endpoint, 'transient')
+                await asyncio.sleep(policy.delay(attempt))
+                attempt += 1
+
+    async def paginate(self, endpoint: str) -> AsyncIterator[dict]:
+        """
+        Yields Every Result of a Paged Listing Endpoint
+
+        :param endpoint: The First Page of the Listing
+        :return: An Async Iterator over the Raw Results of Each Page
+        """
+        while endpoint:
+            page = await self.get_json(endpoint)
+            if not page:
+                return
+            for result in page.get("results", []):
+                yield result
+            endpoint = page.get("paging", {}).get("nextPage", None)
+
+    async def courses(self) -> AsyncIterator[AsyncBlackBoardCourse]:
+        """
+        Yields All the Courses that the Client (User) has Access to
+
+        :return: An Async Iterator over the Clients Courses
+        """
+        # Course Records are Embedded in the Membership Listing Where Supported, Otherwise Looked Up Concurrently
+        unresolved = []
+        async for enrollment in self.paginate(BlackBoardEndPoints.get_user_courses(self.user_id, expand=['course'])):
+            if isinstance(enrollment.get('course', None), dict):
+                course = AsyncBlackBoardCourse(self, enrollment['course'])
+                if course.id is not None and course.name is not None:
+                    yield course
+            else:
+                unresolved.append(AsyncBlackBoardCourse.generate_course(self, enrollment['courseId']))
+        for course in await asyncio.gather(*unresolved):
+            if course is not None and course.id is not None and course.name is not None:
+                yield course
+        for course in self.additional_courses:
+            yield course
+
+    async def find_courses(self, identifiers: List[str]) -> List[AsyncBlackBoardCourse]:
+        """
+        Looks Up Only the Provided Courses (Concurrently) Rather than Listing Every Enrollment
+
+        :param identifiers: The Course Identifiers (Primary IDs, or externalId:, courseId: or uuid: Prefixed IDs)
+        :return: The Found Courses in the Order Provided, Each Course at Most Once
+        """
+        found = await asyncio.gather(*(AsyncBlackBoardCourse.generate_course(
+            self, BlackBoardCourse.course_key(identifier)) for identifier in identifiers))
+        courses, seen = [], set()
+        for identifier, course in zip(identifiers, found):
+            if course is None or course.id is None or course.name is None:
+                _println("{}[WARNING] Course Not Found: {}", Fore.YELLOW, identifier)
+            elif course.id not in seen:
+                seen.add(course.id)
+                courses.append(course)
+        return courses
+
+    async def term(self, term_id: str) -> Optional[dict]:
+        """
+        Looks Up a Term Record, Each Term Only Once
+
+        :param term_id: The ID of the Term
+        :return: The Term's JSON Record (None if it Couldn't be Fetched)
+        """
+        if term_id not in self.terms:
+            term = await self.get_json(BlackBoardEndPoints.get_term(term_id))
+            self.terms[term_id] = term if isinstance(term, dict) and 'id' in term else None
+        return self.terms[term_id]
+
+    async def add_course(self, course_id: str) -> None:
+        """
+        Attempts to Add an Specific Course to the Clients Additional Course List
+        :param course_id: The ID of the Course that is to be Added
+        """
+        if course_id is None:
+            raise Exception("Failed to Add Course")
+        self.additional_courses.append(await AsyncBlackBoardCourse.generate_course(self, course_id))
+
+
+class AsyncBlackBoardCourse(BlackBoardCourse):
+    """
+    Represents a Blackboard Course Retrieved with an AsyncBlackBoardClient
+    """
+
+    __slots__ = ()
+
+    async def contents(self, fields: Optional[List[str]] = None) -> AsyncIterator[AsyncBlackBoardContent]:
+        """
+        Yields the Contents that the Course Contains
+
+        :param fields: The Only Fields to Request for Each Content (All Fields if None)
+        :return: An Async Iterator over the Top Level Course Contents
+        """
+        async for data in self.client.paginate(BlackBoardEndPoints.get_contents(self.id, fields=fields)):
+            content = AsyncBlackBoardContent(self, data, fields)
+            if content.id is not None and content.title is not None:
+                yield content
+
+    async def download_all_attachments(self, save_location='./') -> None:
+        """
+        Crawls Through all the Possible Content Within the Course, Downloading Each Attachment as it is Discovered
+
+        :param save_location: The Base Location to Save All Attachment Downloads
+        """
+
+        async def crawl_attachments(content: AsyncBlackBoardContent, path: str) -> None:
+            """
+            Lists the Attachments of the Given Content and Downloads them Concurrently
+
+            :param content: The Content to Search For Attachments
+            :param path: The Current Path to Save Downloads
+            """
+            downloads = []
+            async for attachment in content.attachments(ContentCrawler.ATTACHMENT_FIELDS):
+                event_bus.publish(Discovered(attachment.file_name_safe))
+                downloads.append(attachment.download(path))
+            await _gather_reporting(downloads)
+
+        async def crawl_content(content: AsyncBlackBoardContent, path: str) -> None:
+            """
+            Crawls the Given Content, its Attachments and its Child Content Concurrently
+
+            :param content: The Parent Content to Search For Child Content and Attachments
+            :param path: The Current Path to Save Downloads
+            """
+            if content.content_handler.id == "resource/x-bb-folder":
+                path = os.path.join(path, content.title_safe)
+            tasks = [crawl_attachments(content, path)]
+            if content.has_children:
+                tasks.extend([crawl_content(child, path)
+                              async for child in content.children(ContentCrawler.CONTENT_FIELDS)])
+            await _gather_reporting(tasks)
+
+        course_path = os.path.join(save_location, self.name_safe)
+        await _gather_reporting([crawl_content(content, course_path)
+                                  async for content in self.contents(ContentCrawler.CONTENT_FIELDS)])
+        self.finished_course_downloads()
+
+    @staticmethod
+    async def generate_course(client: AsyncBlackBoardClient, course_id: str) -> Optional[AsyncBlackBoardCourse]:
+        """
+        Contacts The Learn Course Endpoint and Makes an AsyncBlackBoardCourse Class
+
+        :param client: The Client to use when Generating the Provided Course
+        :param course_id: The Course ID Related to the Course to Generate
+        :return: The Blackboard Course Associated with The Provided Course ID
+        """
+        if client.api_version >= client.LearnAPIVersion("3400.8.0"):
+            endpoint = BlackBoardEndPoints.get_course(course_id)
+        else:
+            endpoint = BlackBoardEndPoints.get_course_v1(course_id)
+        course_data = await client.get_json(endpoint)
+        return AsyncBlackBoardCourse(client, course_data) if course_data else None
+
+
+class AsyncBlackBoardContent(BlackBoardContent):
+    """
+    Represents a Piece Content Within a Blackboard Course Retrieved with an AsyncBlackBoardClient
+    """
+
+    __slots__ = ()
+
+    async def children(self, fields: Optional[List[str]] = None) -> AsyncIterator[AsyncBlackBoardContent]:
+        """
+        Yields All Child Content Associated with the current Content
+
+        :param fields: The Only Fields to Request for Each Child (All Fields if None)
+        :return: An Async Iterator over the Child Content
+        """
+        if not self.has_children:
+            return
+        async for data in self.client.paginate(
+                BlackBoardEndPoints.get_content_children(self.course.id, self.id, fields=fields)):
+            content = AsyncBlackBoardContent(self.course, data, fields)
+            if content.id is not None and content.title is not None:
+                yield content
+
+    async def attachments(self, fields: Optional[List[str]] = None) -> AsyncIterator[AsyncBlackBoardAttachment]:
+        """
+        Yields All Attachments Associated with the current Content
+
+        :param fields: The Only Fields to Request for Each Attachment (All Fields if None)
+        :return: An Async Iterator over the Contents Attachments
+        """
+        if self.content_handler.id not in ("resource/x-bb-file", "resource/x-bb-document", "resource/x-bb-assignment"):
+            return
+        async for data in self.client.paginate(
+                BlackBoardEndPoints.get_file_attachments(self.course.id, self.id, fields=fields)):
+            attachment = AsyncBlackBoardAttachment(self, data)
+            if attachment.id is not None and attachment.file_name is not None:
+                yield attachment
+
+
+class AsyncBlackBoardAttachment(BlackBoardAttachment):
+    """
+    Represents an Attachment Within Blackboard Content Retrieved with an AsyncBlackBoardClient
+    """
+
+    async def download(self, location: str) -> None:
+        """
+        Streams the Attachment File to The Specified Location
+
+        -----
+
+        Follows the Same Policy as the Synchronous Client: a Dropped Connection, Timeout or 500/502/504 Response (or
+        Being Throttled Past throttle_retries) is Retried According to the Clients Download Retry Policy, Resuming from
+        the Bytes Already in the .part File Where the Server Allows
+
+        :param location: The Location to Save the Attachment to (Is a Directory as Download Will Append the File Name)
+        """
+        policy = self.client.download_retry
+        download_location = self.save_location(location)
+        try:
+            for attempt in range(policy.attempts):
+                try:
+                    return await self.__download(download_location)
+                except (aiohttp.ClientError, asyncio.TimeoutError, BlackBoardClient.BBRequestException) as e:
+                    error = str(e) or type(e).__name__
+                    if attempt + 1 >= policy.attempts:
+                        self.client.retry_report.failed(self.file_name_safe, error)
+                        raise
+                    self.client.retry_report.retried(self.file_name_safe, error)
+                    record_retry(None, 'transient', family='download')
+                    await asyncio.sleep(policy.delay(attempt))
+        except asyncio.CancelledError:
+            event_bus.publish(Finished(download_location, self.file_name_safe, 'PAUSED'))
+            raise
+        except Exception as e:
+            event_bus.publish(Failed(download_location, self.file_name_safe, e))
+            raise
+
+    async def __download(self, download_location: str) -> None:
+        """
+        Makes a Single Attempt at Downloading the Attachment File, Logging Back in Once on a 401 and Waiting Out
+        Throttling Responses
+
+        :param download_location: The Absolute Path to Save the Attachment to
+        :raises BlackBoardClient.BBRequestException: On a Transient Status, or Once Throttled Past throttle_retries
+        """
+        endpoint = BlackBoardEndPoints.get_file_attachment_download(self.course.id, self.content.id, self.id)
+        reauthenticated = False
+        throttled = 0
+        while True:
+            # Continue Any Previously Interrupted Download of this File
+            request_headers = PartialDownload(download_location).request_headers()
+            if self.client.use_manifest and self.course.get_manifest_entry(self) is not None:
+                request_headers["If-None-Match"] = self.course.get_manifest_entry(self)
+
+            generation = self.client.session_generation
+            await self.client.wait_out_throttling()
+            async with self.client.limit:
+                started = time.perf_counter()
+                try:
+                    with profiler.phase('request'):
+                        download = await self.client.session.get(self.client.site + endpoint, headers=request_headers)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    observe_request(endpoint, e, time.perf_counter() - started)
+                    raise
+                async with download:
+                    observe_request(endpoint, download.status, time.perf_counter() - started)
+                    status = download.status
+                    retry_after = _parse_retry_after(download.headers.get('Retry-After', None))
+                    if status in RetryPolicy.TRANSIENT_STATUS_CODES:
+                        raise BlackBoardClient.BBRequestException(f"Status {status}")
+                    if (status != 401 or reauthenticated) and status not in RateController.THROTTLING_STATUS_CODES:
+                        return await self.__save(download, download_location)
+            if status == 401:  # Unauthorised, Log Back In (Outside the Limit so Waiting Requests Can't Starve it)
+                reauthenticated = True
+                await self.client.reauthenticate(generation)
+            else:
+                throttled += 1
+                if throttled > self.client.throttle_retries:
+                    raise BlackBoardClient.BBRequestException(self.client.throttling_failure(status, retry_after))
+                self.client.back_off(endpoint, status, retry_after)
+
+    async def __save(self, download: aiohttp.ClientResponse, download_location: str) -> None:
+        """
+        Handles the Download Response, Writing the File (and Backing up the Outdated Copy) if it has Changed
+
+        :param download: The Response from the Attachment Download Endpoint
+        :param download_location: The Absolute Path to Save the Attachment to
+        """
+        download_directory = os.path.dirname(download_location)
+        if download.status == 304:  # No Need to Update File
+            PartialDownload(download_location).discard()  # Any Partial Copy is of a Different Version
+            _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
+            event_bus.publish(Finished(download_location, self.file_name_safe, 'UP TO DATE'))
+            return
+        if download.status not in (200, 206):  # Full or Resumed (Partial) Content
+            _println(f"{Fore.RED}[UNKNOWN STATUS CODE] {download.status}")
+            event_bus.publish(Failed(download_location, self.file_name_safe))
+            return
+
+        os.makedirs(download_directory, exist_ok=True)
+        file_exists = os.path.isfile(download_location)
+        if file_exists and not self.client.use_manifest:
+            _println(f"{Fore.YELLOW}[UP TO DATE] {self.file_name_safe}\n[LOCATION] {download_directory}")
+            event_bus.publish(Finished(download_location, self.file_name_safe, 'UP TO DATE'))
+            return
+
+        digest = None
+        if self.client.blob_store is not None and download.status == 200:
+            digest = self.client.blob_store.lookup(download.headers.get('ETag', None),
+                                                   download.headers.get('Content-Length', None))
+        if digest is not None:  # Already Downloaded (Elsewhere), so the Body is Never Read
+            partial_download = PartialDownload(download_location)
+            partial_download.discard()
+            part_location = self.client.blob_store.link(digest, partial_download.part_location)
+        else:
+            part_location = await self.__stream_to_part_file(download, download_location)
+        if file_exists and self.client.use_manifest and self.client.backup_files:
+            self._backup(download_location, download.headers)
+        os.replace(part_location, download_location)
+        self.course.record_manifest_entry(self, download.headers.get("ETag", -1))
+        status = 'LINKED' if digest is not None else 'UPDATED' if file_exists else 'DOWNLOADED'
+        _println("{}[{}] {}\n[LOCATION] {}", Fore.GREEN, status, self.file_name_safe, download_directory)
+        event_bus.publish(Finished(download_location, self.file_name_safe, status))
+
+    async def __stream_to_part_file(self, download: aiohttp.ClientResponse, location: str) -> str:
+        """
+        Streams a Response Body into the .part File Next to the Given Location
+
+        -----
+
+        Disk Writes are Handed to the Default Executor so a Slow Disk Never Stalls the Event Loop. If the Task is
+        Cancelled the .part File is Kept so the Next Run Can Resume it
+
+        :param download: The Response to Read the Body From
+        :param location: The Final Location of the File
+        :return: The Location of the Completed .part File
+        """
+        loop = asyncio.get_running_loop()
+        blob_store = self.client.blob_store
+        partial_download = PartialDownload(location, hash_content=blob_store is not None)
+        file_out = partial_download.open(download.status, download.headers)
+        try:
+            async for chunk in profiler.timed_async(download.content.iter_chunked(self.client.chunk_size), 'transfer'):
+                with profiler.phase('write'):
+                    await loop.run_in_executor(None, file_out.write, chunk)
+                partial_download.wrote(file_out, chunk)
+        except BaseException:
+            partial_download.finish(file_out, complete=False)
+            raise
+        partial_download.finish(file_out, complete=True)
+        if blob_store is not None:
+            await loop.run_in_executor(None, lambda: blob_store.add(partial_download.part_location,
+                                                                    partial_download.digest(),
+                                                                    download.headers.get('ETag', None)))
+        return partial_download.part_location
+
+
+async def _gather_reporting(tasks: List) -> None:
+    """
+    Runs the Provided Coroutines Concurrently, Reporting (Rather than Raising) Any Failures so One Broken Item Doesn't
+    Cancel its Siblings
+
+    :param tasks: The Coroutines to Run
+    """
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, Exception):
+            _println(f"{Fore.RED}[FAILED TO DOWNLOAD] Error: {str(result)}")
@@ -0,0 +1,421 @@
+"""
+Events Module Carries Console Output and Download Progress to a Single Consumer Thread, Which Renders it
+"""
+
+from __future__ import annotations
+import atexit
+import collections
+import queue
+import shutil
+import sys
+import threading
+import time
+from typing import Callable, Deque, Dict, List, Optional, TextIO, Tuple
+
+from colorama import Fore
+
+
+class Event:
+    """
+    Something that Happened which the Output May Want to Show
+    """
+
+    __slots__ = ()
+
+
+class Message(Event):
+    """
+    A Line of Already Formatted Text to Print
+    """
+
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        :param text: The Text to Print
+        """
+        self.text = text
+
+
+class Discovered(Event):
+    """
+    An Attachment was Found by the Crawl and Will be Downloaded
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        """
+        :param name: The Attachment's File Name
+        """
+        self.name = name
+
+
+class Started(Event):
+    """
+    The Body of a File Began Transferring
+    """
+
+    __slots__ = ('key', 'name', 'total', 'offset')
+
+    def __init__(self, key: str, name: str, total: Optional[int], offset: int = 0):
+        """
+        :param key: Identifies the Transfer (The Files Final Location)
+        :param name: The File Name to Display
+        :param total: The Full Size of the File in Bytes (None if Unknown)
+        :param offset: The Number of Bytes Already on Disk From an Earlier Attempt
+        """
+        self.key = key
+        self.name = name
+        self.total = total
+        self.offset = offset
+
+
+class Bytes(Event):
+    """
+    Another Chunk of a Transfer was Written to Disk
+    """
+
+    __slots__ = ('key', 'count')
+
+    def __init__(self, key: str, count: int):
+        """
+        :param key: Identifies the Transfer
+        :param count: The Number of Bytes Written
+        """
+        self.key = key
+        self.count = count
+
+
+class Finished(Event):
+    """
+    A File was Dealt With, Whether Downloaded, Already Up to Date or Paused for the Next Run
+    """
+
+    __slots__ = ('key', 'name', 'status')
+
+    def __init__(self, key: str, name: str, status: str):
+        """
+        :param key: Identifies the Transfer
+        :param name: The File Name to Display
+        :param status: DOWNLOADED, UPDATED, LINKED (From an Identical File Already Downloaded), UP TO DATE or PAUSED
+        """
+        self.key = key
+        self.name = name
+        self.status = status
+
+
+class Failed(Event):
+    """
+    A File Could Not be Downloaded
+    """
+
+    __slots__ = ('key', 'name', 'error')
+
+    def __init__(self, key: str, name: str, error: Optional[BaseException] = None):
+        """
+        :param key: Identifies the Transfer
+        :param name: The File Name to Display
+        :param error: What Went Wrong (if Known)
+        """
+        self.key = key
+        self.name = name
+        self.error = error
+
+
+class Tick(Event):
+    """
+    Delivered when No Other Event has Arrived for a While so Time Based Output (eg. Throughput) Stays Current
+    """
+
+    __slots__ = ()
+
+
+class EventBus:
+    """
+    Delivers Published Events, in Order, to Every Subscriber from One Long Lived Consumer Thread
+
+    -----
+
+    Subscribers are Only Ever Called from the Consumer Thread so they Need No Locking of their Own. The Thread is
+    Started by the First Publish and Drained when the Interpreter Exits
+    """
+
+    TICK_INTERVAL = 0.5  # Seconds Without Events Before a Tick is Delivered
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._subscribers: List[Callable[[Event], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber: Callable[[Event], None]) -> None:
+        """
+        Adds a Subscriber to Receive Every Event Published from Now On
+
+        :param subscriber: Called with Each Event
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [subscriber]
+
+    def unsubscribe(self, subscriber: Callable[[Event], None]) -> None:
+        """
+        Stops Delivering Events to a Subscriber
+
+        :param subscriber: A Previously Subscribed Callable
+        """
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscriber]
+
+    def publish(self, event: Event) -> None:
+        """
+        Queues an Event for Delivery, Returning Immediately
+
+        :param event: The Event to Deliver
+        """
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="EventBus", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """
+        Blocks Until Every Event Published so Far has been Delivered
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        """
+        The Consumer Thread, Delivering Events as they Arrive and a Tick Whenever it is Idle
+        """
+        while True:
+            try:
+                event = self._queue.get(timeout=EventBus.TICK_INTERVAL)
+            except queue.Empty:
+                self._deliver(Tick())
+                continue
+            try:
+                self._deliver(event)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, event: Event) -> None:
+        for subscriber in self._subscribers:
+            try:
+                subscriber(event)
+            except Exception:  # A Broken Subscriber Mustn't Stop Output for the Rest
+                pass
+
+
+class ConsoleOutput:
+    """
+    Prints Messages as they Arrive, Ignoring Progress Events
+    """
+
+    def __init__(self, stream: TextIO = None):
+        """
+        :param stream: Where to Print (Defaults to stdout)
+        """
+        self.stream = stream
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, Message):
+            print(event.text, file=self.stream or sys.stdout, flush=True)
+
+
+class QuietOutput:
+    """
+    Prints Nothing but a Single Line for Each File that Failed
+    """
+
+    def __init__(self, stream: TextIO = None):
+        """
+        :param stream: Where to Print (Defaults to stderr)
+        """
+        self.stream = stream
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, Failed):
+            print(f"{Fore.RED}[FAILED] {event.name}" + (f": {event.error}" if event.error else "") + Fore.RESET,
+                  file=self.stream or sys.stderr, flush=True)
+
+
+class ProgressRenderer:
+    """
+    Prints Messages and Keeps a Live Status Line Below them Showing Overall Throughput, ETA and the Active Transfers
+
+    -----
+
+    The Status Line is Only Drawn when the Output is a Terminal, Otherwise this Behaves Like ConsoleOutput
+    """
+
+    REDRAW_INTERVAL = 0.2  # Seconds Between Status Line Redraws
+    RATE_WINDOW = 5.0  # Seconds of Transfers Averaged for the Throughput
+
+    class Transfer:
+        """
+        The Progress of a Single Active Transfer
+        """
+
+        __slots__ = ('name', 'total', 'done')
+
+        def __init__(self, name: str, total: Optional[int], done: int):
+            self.name = name
+            self.total = total
+            self.done = done
+
+    def __init__(self, stream: TextIO = None):
+        """
+        :param stream: Where to Print (Defaults to stdout)
+        """
+        self.stream = stream or sys.stdout
+        self.live = self.stream.isatty()
+        self.discovered = 0
+        self.finished = 0
+        self.failed = 0
+        self.transferred = 0
+        self.finished_bytes = 0
+        self.active: Dict[str, ProgressRenderer.Transfer] = collections.OrderedDict()
+        self._recent: Deque[Tuple[float, int]] = collections.deque()
+        self._start = time.monotonic()
+        self._last_drawn = 0.0
+        self._drawn = False
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, Message):
+            self._clear()
+            print(event.text, file=self.stream, flush=True)
+            self._draw(force=True)
+            return
+        if isinstance(event, Discovered):
+            self.discovered += 1
+        elif isinstance(event, Started):
+            self.active[event.key] = ProgressRenderer.Transfer(event.name, event.total, event.offset)
+        elif isinstance(event, Bytes):
+            transfer = self.active.get(event.key, None)
+            if transfer is not None:
+                transfer.done += event.count
+            self.transferred += event.count
+            self._recent.append((time.monotonic(), event.count))
+        elif isinstance(event, Finished):
+            transfer = self.active.pop(event.key, None)
+            if transfer is not None and event.status != 'PAUSED':
+                self.finished_bytes += transfer.done
+            self.finished += 1
+        elif isinstance(event, Failed):
+            self.active.pop(event.key, None)
+            self.failed += 1
+        self._draw()
+
+    def rate(self) -> float:
+        """
+        Calculates the Recent Throughput
+
+        :return: Bytes per Second Averaged over the Last RATE_WINDOW Seconds
+        """
+        now = time.monotonic()
+        while self._recent and self._recent[0][0] < now - ProgressRenderer.RATE_WINDOW:
+            self._recent.popleft()
+        window = min(ProgressRenderer.RATE_WINDOW, now - self._start)
+        return sum(count for _, count in self._recent) / window if window > 0 else 0.0
+
+    def eta(self, rate: float) -> Optional[float]:
+        """
+        Estimates the Time Left from the Remaining Bytes of Active Transfers Plus the Files Not Yet Started (Assumed
+        to be the Average Size of those Already Finished)
+
+        :param rate: The Current Throughput in Bytes per Second
+        :return: The Seconds Remaining (None if it Can't be Estimated Yet)
+        """
+        if rate <= 0:
+            return None
+        remaining = sum(t.total - t.done for t in self.active.values() if t.total is not None and t.total > t.done)
+        waiting = self.discovered - self.finished - self.failed - len(self.active)
+        if waiting > 0:
+            if self.finished == 0:
+                return None
+            remaining += waiting * self.finished_bytes / self.finished
+        return remaining / rate
+
+    def status(self) -> str:
+        """
+        Builds the Status Line
+
+        :return: The Status Line's Text
+        """
+        rate = self.rate()
+        eta = self.eta(rate)
+        done = self.finished + self.failed
+        text = (f"[{done}/{max(self.discovered, done)} FILES] {_size(self.transferred)} at {_size(rate)}/s "
+                f"ETA {'--:--' if eta is None else _duration(eta)}")
+        if self.failed:
+            text += f" ({self.failed} FAILED)"
+        if self.active:
+            text += f" | {len(self.active)} ACTIVE: " + ", ".join(
+                f"{t.name} {t.done * 100 // t.total}%" if t.total else f"{t.name} {_size(t.done)}"
+                for t in self.active.values())
+        return text
+
+    def _draw(self, force: bool = False) -> None:
+        if not self.live:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_drawn < ProgressRenderer.REDRAW_INTERVAL:
+            return
+        width = shutil.get_terminal_size().columns - 1
+        self.stream.write("\r" + Fore.CYAN + self.status()[:width] + Fore.RESET + "\x1b[K")
+        self.stream.flush()
+        self._last_drawn = now
+        self._drawn = True
+
+    def _clear(self) -> None:
+        if self._drawn:
+            self.stream.write("\r\x1b[K")
+            self._drawn = False
+
+
+def _size(count: float) -> str:
+    """
+    Formats a Number of Bytes for Display
+
+    :param count: The Number of Bytes
+    :return: The Size Using the Largest Fitting Binary Unit
+    """
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if count < 1024:
+            return f"{count:.1f} {unit}" if unit != 'B' else f"{int(count)} B"
+        count /= 1024
+    return f"{count:.1f} TiB"
+
+
+def _duration(seconds: float) -> str:
+    """
+    Formats a Number of Seconds for Display
+
+    :param seconds: The Number of Seconds
+    :return: The Duration as [H:]MM:SS
+    """
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes:02}:{seconds:02}"
+
+
+def set_output(output: Callable[[Event], None]) -> None:
+    """
+    Replaces How Events are Shown (ConsoleOutput by Default)
+
+    :param output: The Subscriber to Show Events With (eg. a ProgressRenderer or QuietOutput)
+    """
+    global _output
+    event_bus.unsubscribe(_output)
+    _output = output
+    event_bus.subscribe(_output)
+
+
+event_bus = EventBus()
+_output: Callable[[Event], None] = ConsoleOutput()
+event_bus.subscribe(_output)
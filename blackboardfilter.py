@@ -0,0 +1,214 @@
+"""
+Filter Module Selects Which Courses are Downloaded From Expressions on a Course's Term, Availability, Closed/Complete
+Status, Dates and Name, so Archived Courses can be Skipped Before Any of their Content is Listed
+"""
+
+from __future__ import annotations
+import fnmatch
+import re
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from blackboard import BlackBoardCourse
+
+TEXT_FIELDS = {
+    'name': lambda course, term: course.name,
+    'id': lambda course, term: course.id,
+    'course_id': lambda course, term: course.course_id,
+    'external_id': lambda course, term: course.external_id,
+    'available': lambda course, term: course.availability.available,
+    'ultra_status': lambda course, term: course.ultra_status,
+}
+BOOLEAN_FIELDS = {
+    'closed': lambda course, term: course.closed_complete,
+    'organization': lambda course, term: course.organization,
+}
+DATE_FIELDS = ('start', 'end', 'created', 'modified')
+FIELDS = sorted([*TEXT_FIELDS, *BOOLEAN_FIELDS, *DATE_FIELDS, 'term'])
+
+EXPRESSION = re.compile(r"\s*(\w+)\s*(!=|>=|<=|=|>|<)\s*(.*?)\s*")
+BOOLEANS = {'true': True, 'yes': True, '1': True, 'false': False, 'no': False, '0': False}
+
+
+class CourseFilter:
+    """
+    Matches Courses Against a List of Expressions, All of Which Must Match
+
+    -----
+
+    Each Expression is a Field, an Operator and a Value (eg. term=2024*, closed=false, end>=2024-01-01):
+
+    Text Fields (name, id, course_id, external_id, available, ultra_status and term) are Matched with = or != Against
+    Case Insensitive Glob Patterns, Separated by | for Alternatives. term Matches the Term's ID, Name or External ID
+
+    Boolean Fields (closed, organization) are Matched with = or != Against true/false
+
+    Date Fields (start, end, created, modified) are Compared with =, <, <=, > or >= Against an ISO 8601 Date. start and
+    end are the Enrollment Dates, Falling Back to the Course's (or its Term's) Duration, and a Missing start or end is
+    Unbounded (so end>=2024-01-01 Keeps Courses that Never End)
+    """
+
+    class Expression:
+        """
+        A Single Parsed Filter Expression
+        """
+
+        __slots__ = ('text', 'field', 'operator', 'value')
+
+        def __init__(self, text: str):
+            """
+            :param text: The Expression (eg. term=2024*)
+            :raises ValueError: If the Expression is Malformed or Names an Unknown Field
+            """
+            match = EXPRESSION.fullmatch(text)
+            if match is None:
+                raise ValueError(f"Invalid Course Filter '{text}', Expected field<op>value")
+            self.text = text
+            self.field, self.operator, value = match.groups()
+            self.field = self.field.lower()
+            if self.field in DATE_FIELDS:
+                self.value = _parse_date(value, text)
+            elif self.operator not in ('=', '!='):
+                raise ValueError(f"Invalid Course Filter '{text}', {self.field} Only Supports = and !=")
+            elif self.field in BOOLEAN_FIELDS:
+                if value.lower() not in BOOLEANS:
+                    raise ValueError(f"Invalid Course Filter '{text}', Expected true or false")
+                self.value = BOOLEANS[value.lower()]
+            elif self.field in TEXT_FIELDS or self.field == 'term':
+                self.value = [pattern.strip().lower() for pattern in value.split('|')]
+            else:
+                raise ValueError(f"Invalid Course Filter '{text}', Unknown Field (Expected One of {', '.join(FIELDS)})")
+
+        def matches(self, course: BlackBoardCourse, term: Optional[dict]) -> bool:
+            """
+            :param course: The Course to Test
+            :param term: The Course's Term Record (None if it has No Term, or the Term wasn't Needed)
+            :return: Whether the Course Satisfies the Expression
+            """
+            if self.field in DATE_FIELDS:
+                return self.__compare(_course_date(course, term, self.field))
+            if self.field in BOOLEAN_FIELDS:
+                matched = bool(BOOLEAN_FIELDS[self.field](course, term)) == self.value
+            elif self.field == 'term':
+                candidates = [course.term_id] + ([term.get('name', None), term.get('externalId', None)] if term else [])
+                matched = any(_glob(candidate, self.value) for candidate in candidates)
+            else:
+                matched = _glob(TEXT_FIELDS[self.field](course, term), self.value)
+            return matched if self.operator == '=' else not matched
+
+        def __compare(self, date: Optional[datetime]) -> bool:
+            if date is None:  # Unbounded (start/end) or Unknown (created/modified)
+                if self.field == 'start':
+                    return self.operator in ('<', '<=', '!=')
+                if self.field == 'end':
+                    return self.operator in ('>', '>=', '!=')
+                return False
+            return {
+                '=': date == self.value, '!=': date != self.value,
+                '<': date < self.value, '<=': date <= self.value,
+                '>': date > self.value, '>=': date >= self.value,
+            }[self.operator]
+
+        def needs_term(self, course: BlackBoardCourse) -> bool:
+            """
+            :param course: The Course About to be Tested
+            :return: Whether the Course's Term Record has to be Fetched to Test it
+            """
+            if course.term_id is None:
+                return False
+            if self.field == 'term':
+                return not _glob(course.term_id, self.value)  # The Term ID Alone May Already Match
+            return self.field in ('start', 'end')
+
+        def __str__(self):
+            return self.text
+
+    def __init__(self, expressions: Iterable[str]):
+        """
+        :param expressions: The Filter Expressions
+        :raises ValueError: If Any Expression is Malformed
+        """
+        self.expressions: List[CourseFilter.Expression] = [self.Expression(text) for text in expressions]
+
+    def __bool__(self):
+        return bool(self.expressions)
+
+    def needs_term(self, course: BlackBoardCourse) -> bool:
+        """
+        :param course: The Course About to be Tested
+        :return: Whether Any Expression Needs the Course's Term Record
+        """
+        return any(expression.needs_term(course) for expression in self.expressions)
+
+    def matches(self, course: BlackBoardCourse, term: Optional[dict] = None) -> bool:
+        """
+        :param course: The Course to Test
+        :param term: The Course's Term Record (Only Needed When needs_term is True)
+        :return: Whether the Course Satisfies Every Expression
+        """
+        return all(expression.matches(course, term) for expression in self.expressions)
+
+    def select(self, courses: Iterable[BlackBoardCourse],
+               get_term: Callable[[str], Optional[dict]]) -> Iterator[BlackBoardCourse]:
+        """
+        Lazily Yields the Courses that Satisfy Every Expression
+
+        :param courses: The Courses to Filter
+        :param get_term: Looks Up a Term Record by its ID (Only Called When an Expression Needs it)
+        :return: An Iterator over the Matching Courses
+        """
+        for course in courses:
+            term = get_term(course.term_id) if self.needs_term(course) else None
+            if self.matches(course, term):
+                yield course
+
+
+def _glob(value: Any, patterns: List[str]) -> bool:
+    """
+    :param value: The Text to Match (None Never Matches)
+    :param patterns: Lower Case Glob Patterns, Any of Which May Match
+    :return: Whether the Value Matches a Pattern, Ignoring Case
+    """
+    if value is None:
+        return False
+    value = str(value).lower()
+    return any(fnmatch.fnmatchcase(value, pattern) for pattern in patterns)
+
+
+def _parse_date(value: str, text: str) -> datetime:
+    """
+    :param value: An ISO 8601 Date or Date and Time (Assumed to be UTC Without an Offset)
+    :param text: The Whole Expression, for the Error Message
+    :return: The Time Zone Aware Date
+    :raises ValueError: If the Date can't be Parsed
+    """
+    try:
+        date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f"Invalid Course Filter '{text}', Expected a Date Such as 2024-01-31") from None
+    return _aware(date)
+
+
+def _aware(date: Optional[datetime]) -> Optional[datetime]:
+    """
+    Treats Dates Without a Time Zone as UTC so they Compare with Ones that have One
+    """
+    if date is not None and date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date
+
+
+def _course_date(course: BlackBoardCourse, term: Optional[dict], field: str) -> Optional[datetime]:
+    """
+    :param course: The Course
+    :param term: The Course's Term Record (If Fetched)
+    :param field: start, end, created or modified
+    :return: The Course's Date for the Field (None if it has None)
+    """
+    if field in ('created', 'modified'):
+        return _aware(getattr(course, field))
+    date = getattr(course.enrollment, field) or getattr(course.availability.duration, field)
+    if date is None and term:  # Term Records Share the Course Duration Format
+        duration = BlackBoardCourse.Duration((term.get('availability', None) or {}).get('duration', None))
+        date = getattr(duration, field)
+    return _aware(date)
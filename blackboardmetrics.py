@@ -0,0 +1,401 @@
+"""
+Metrics Module Counts and Times the Requests and Downloads Made During a Run
+
+-----
+
+The Metrics can be Scraped in the Prometheus Text Format from a Local HTTP Endpoint, Written Periodically to a
+Prometheus Text File (eg. for the node_exporter Textfile Collector) and Written as a JSON Summary When the Run Ends
+"""
+
+from __future__ import annotations
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from blackboardevents import Event, Bytes, Finished, Failed
+
+
+class Metric:
+    """
+    A Named Set of Values, One for Each Combination of Label Values
+    """
+
+    TYPE = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        """
+        :param name: The Metric Name (Prometheus Naming Rules)
+        :param documentation: What the Metric Measures
+        :param labels: The Names of the Labels the Values are Split By
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(label, '')) for label in self.labels)
+
+    def _format_labels(self, key: Tuple[str, ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.labels, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join('{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"'))
+                              for name, value in pairs) + '}'
+
+    def prometheus(self) -> List[str]:
+        """
+        :return: The Lines Describing the Metric in the Prometheus Text Format
+        """
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{self._format_labels(key)} {value}" for key, value in sorted(self._values.items())]
+
+    def values(self) -> Dict[str, Any]:
+        """
+        :return: The Current Values Keyed by their Label Values (Joined with a Comma)
+        """
+        with self._lock:
+            return {','.join(key): value for key, value in sorted(self._values.items())}
+
+
+class Counter(Metric):
+    """
+    A Value that Only Goes Up
+    """
+
+    TYPE = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        :param amount: How Much to Add
+        :param labels: The Label Values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    A Value Read When the Metrics are Collected
+    """
+
+    TYPE = 'gauge'
+
+    def track(self, read: Callable[[], float], **labels) -> None:
+        """
+        :param read: Called to Get the Current Value Whenever the Metrics are Collected
+        :param labels: The Label Values
+        """
+        with self._lock:
+            self._values[self._key(labels)] = read
+
+    def _read(self) -> List[Tuple[Tuple[str, ...], float]]:
+        with self._lock:
+            readers = sorted(self._values.items())
+        values = []
+        for key, read in readers:
+            try:
+                values.append((key, read()))
+            except Exception:  # The Tracked Object has Gone Away
+                pass
+        return values
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{self._format_labels(key)} {value}" for key, value in self._read()]
+
+    def values(self) -> Dict[str, Any]:
+        return {','.join(key): value for key, value in self._read()}
+
+
+class Histogram(Metric):
+    """
+    Counts Observations into Buckets, Keeping their Sum and Maximum
+    """
+
+    TYPE = 'histogram'
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    class Series:
+        """
+        The Observations Recorded for One Combination of Label Values
+        """
+
+        __slots__ = ('buckets', 'count', 'sum', 'max')
+
+        def __init__(self, size: int):
+            self.buckets = [0] * size  # The Last Bucket is +Inf
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        :param name: The Metric Name (Prometheus Naming Rules)
+        :param documentation: What the Metric Measures
+        :param labels: The Names of the Labels the Values are Split By
+        :param buckets: The Upper Bounds of the Buckets (+Inf is Added)
+        """
+        super().__init__(name, documentation, labels)
+        self.bounds = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        :param value: The Observed Value
+        :param labels: The Label Values
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            series = self._values.get(key, None)
+            if series is None:
+                series = self._values[key] = Histogram.Series(len(self.bounds) + 1)
+            series.buckets[index] += 1
+            series.count += 1
+            series.sum += value
+            series.max = max(series.max, value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, series in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.bounds + (float('inf'),), series.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f"{self.name}_bucket{self._format_labels(key, (('le', le),))} {cumulative}")
+                lines.append(f"{self.name}_sum{self._format_labels(key)} {series.sum}")
+                lines.append(f"{self.name}_count{self._format_labels(key)} {series.count}")
+        return lines
+
+    def quantile(self, series: Histogram.Series, q: float) -> float:
+        """
+        Estimates a Quantile as the Upper Bound of the Bucket it Falls in
+
+        :param series: The Observations
+        :param q: The Quantile (0 to 1)
+        :return: The Estimated Value (the Largest Observation if it Falls in the +Inf Bucket)
+        """
+        rank = q * series.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, series.buckets):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, series.max)
+        return series.max
+
+    def values(self) -> Dict[str, Any]:
+        with self._lock:
+            return {','.join(key): {
+                'count': series.count,
+                'mean': series.sum / series.count if series.count else 0.0,
+                'p50': self.quantile(series, 0.5),
+                'p95': self.quantile(series, 0.95),
+                'p99': self.quantile(series, 0.99),
+                'max': series.max,
+            } for key, series in sorted(self._values.items())}
+
+
+class MetricsRegistry:
+    """
+    Holds Every Metric so they Can be Exported Together
+    """
+
+    def __init__(self):
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        :param metric: The Metric to Export
+        :return: The Metric
+        """
+        self.metrics.append(metric)
+        return metric
+
+    def prometheus(self) -> str:
+        """
+        :return: Every Metric in the Prometheus Text Format
+        """
+        return '\n'.join(line for metric in self.metrics for line in metric.prometheus()) + '\n'
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        :return: Every Metric's Values Keyed by the Metric Name
+        """
+        return {metric.name: metric.values() for metric in self.metrics}
+
+
+# Most Specific First, Matched Against the API Path of a Request
+ENDPOINT_FAMILIES = (
+    (re.compile(r'/attachments/[^/?]+/download'), 'download'),
+    (re.compile(r'/attachments'), 'attachments'),
+    (re.compile(r'/children'), 'children'),
+    (re.compile(r'/contents'), 'contents'),
+    (re.compile(r'/courses'), 'courses'),
+)
+
+registry = MetricsRegistry()
+requests_total = registry.register(Counter(
+    'blackboard_requests_total', "HTTP Requests Sent, by Endpoint Family and Status Code (or Error)",
+    ('endpoint', 'status')))
+request_seconds = registry.register(Histogram(
+    'blackboard_request_seconds', "Seconds Until the Response Headers Arrived, by Endpoint Family", ('endpoint',)))
+retries_total = registry.register(Counter(
+    'blackboard_retries_total', "Requests Retried, by Endpoint Family and Reason", ('endpoint', 'reason')))
+download_bytes_total = registry.register(Counter(
+    'blackboard_download_bytes_total', "Bytes of Attachment Files Written to Disk"))
+downloads_total = registry.register(Counter(
+    'blackboard_downloads_total', "Attachment Files Dealt With, by Outcome", ('status',)))
+queue_depth = registry.register(Gauge(
+    'blackboard_queue_depth', "Tasks Waiting for a Free Worker, by Queue", ('queue',)))
+http_cache_total = registry.register(Counter(
+    'blackboard_http_cache_total', "API Responses Looked Up in the HTTP Cache, by Endpoint Family and Result "
+                                   "(hit, revalidated or miss)", ('endpoint', 'result')))
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Groups an API Path with the Other Paths of the Same Kind so Metrics Don't Have a Label per Course or Content
+
+    :param endpoint: The API Path (or Full URL) of the Request
+    :return: The Endpoint Family (download, attachments, children, contents, courses or other)
+    """
+    for pattern, family in ENDPOINT_FAMILIES:
+        if pattern.search(endpoint):
+            return family
+    return 'other'
+
+
+def observe_request(endpoint: Optional[str], status: Any, seconds: float, family: Optional[str] = None) -> None:
+    """
+    Records a Request that was Sent
+
+    :param endpoint: The API Path (or Full URL) of the Request
+    :param status: The Status Code Returned (or the Exception Raised Instead)
+    :param seconds: How Long Until the Response Headers Arrived
+    :param family: The Endpoint Family, When it Can't be Told From the Endpoint (eg. a Redirected File Host URL)
+    """
+    family = family or endpoint_family(endpoint)
+    requests_total.inc(endpoint=family, status=type(status).__name__ if isinstance(status, BaseException) else status)
+    request_seconds.observe(seconds, endpoint=family)
+
+
+def record_retry(endpoint: Optional[str], reason: str, family: Optional[str] = None) -> None:
+    """
+    Records a Request that is About to be Retried
+
+    :param endpoint: The API Path (or Full URL) of the Request
+    :param reason: Why it is being Retried (eg. transient or throttled)
+    :param family: The Endpoint Family, When it Can't be Told From the Endpoint
+    """
+    retries_total.inc(endpoint=family or endpoint_family(endpoint), reason=reason)
+
+
+class MetricsRecorder:
+    """
+    Event Bus Subscriber Counting Downloaded Bytes and Files, and Optionally Keeping a Prometheus Text File Current
+    """
+
+    def __init__(self, prometheus_file: Optional[str] = None, interval: float = 15.0):
+        """
+        :param prometheus_file: Where to Periodically Write the Metrics in the Prometheus Text Format (None to Skip)
+        :param interval: Seconds Between Writes of the Prometheus Text File
+        """
+        self.prometheus_file = prometheus_file
+        self.interval = interval
+        self._last_written = 0.0
+        self._lock = threading.Lock()  # Written from the Event Bus and Once More at Exit
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, Bytes):
+            download_bytes_total.inc(event.count)
+        elif isinstance(event, Finished):
+            downloads_total.inc(status=event.status)
+        elif isinstance(event, Failed):
+            downloads_total.inc(status='FAILED')
+        if self.prometheus_file and time.monotonic() - self._last_written >= self.interval:
+            self.write()
+
+    def write(self) -> None:
+        """
+        Writes the Prometheus Text File Now
+        """
+        if self.prometheus_file:
+            with self._lock:
+                _write_atomically(self.prometheus_file, registry.prometheus())
+                self._last_written = time.monotonic()
+
+
+class MetricsServer:
+    """
+    Serves the Metrics in the Prometheus Text Format at /metrics on a Local Port
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:  # Don't Print a Line for Every Scrape
+            pass
+
+    def __init__(self, port: int, host: str = '127.0.0.1'):
+        """
+        :param port: The Port to Listen on (0 Picks a Free Port)
+        :param host: The Address to Listen on (Local Only by Default)
+        """
+        self.server = ThreadingHTTPServer((host, port), MetricsServer.Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="MetricsServer", daemon=True)
+
+    def start(self) -> MetricsServer:
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def write_summary(location: str) -> None:
+    """
+    Writes Every Metric as JSON
+
+    :param location: Where to Write the Summary ('-' Prints it Instead)
+    """
+    summary = json.dumps(registry.summary(), indent=2)
+    if location == '-':
+        print(summary)
+    else:
+        _write_atomically(location, summary + '\n')
+
+
+def _write_atomically(location: str, text: str) -> None:
+    """
+    Writes a File so Readers Never See it Half Written
+
+    :param location: The File to Write
+    :param text: The Contents
+    """
+    temporary = location + '.tmp'
+    with open(temporary, 'w') as f:
+        f.write(text)
+    os.replace(temporary, location)
@@ -0,0 +1,320 @@
+"""
+Profile Module Times Each Phase of a Run (Login, Discovery, Requests, Transfers and Disk Writes) so a Slow Run Can be
+Blamed on the Network, the API or the Disk
+
+-----
+
+Profiling is Off Unless Enabled, in Which Case Timing a Phase Costs Nothing but a Shared No-Op Span. When Enabled it
+Can Also Capture a cProfile of Every Thread and a tracemalloc Snapshot of Where Memory was Allocated
+"""
+
+from __future__ import annotations
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+# What Each Phase Measures, Used to Name What a Run was Bound by
+BOUND_BY = {
+    'request': "the API (Waiting for Response Headers)",
+    'transfer': "the Network (Reading Response Bodies)",
+    'write': "the Disk (Writing Downloaded Files)",
+}
+
+
+class Phase:
+    """
+    The Accumulated Timings of One Phase
+
+    -----
+
+    Phases Overlap Across Threads, so Both the Summed Time of Every Span (cumulative) and the Time at Least One Span
+    was Running (wall) are Kept
+    """
+
+    __slots__ = ('name', 'calls', 'cumulative', 'wall', '_active', '_since')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.cumulative = 0.0
+        self.wall = 0.0
+        self._active = 0
+        self._since = 0.0
+
+    def as_dict(self, elapsed: float) -> Dict[str, Any]:
+        """
+        :param elapsed: The Seconds the Whole Run has Taken so Far
+        :return: The Phase's Timings as JSON Compatible Values
+        """
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'wall': round(self.wall, 6),
+            'cumulative': round(self.cumulative, 6),
+            'share': round(self.wall / elapsed, 4) if elapsed > 0 else 0.0,
+        }
+
+
+class Span:
+    """
+    A Single Timed Run of a Phase, Used as a Context Manager or Ended Explicitly (Only the First End Counts)
+    """
+
+    __slots__ = ('profiler', 'phase', 'started')
+
+    def __init__(self, profiler: Profiler, phase: Phase, started: float):
+        self.profiler = profiler
+        self.phase = phase
+        self.started = started
+
+    def end(self) -> None:
+        if self.started is not None:
+            self.profiler._end(self.phase, self.started)
+            self.started = None
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.end()
+
+
+class _NoSpan:
+    """
+    The Span Handed Out While Profiling is Disabled
+    """
+
+    __slots__ = ()
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Profiler:
+    """
+    Records how Long Each Phase of the Run Takes, and Optionally CPU and Memory Profiles
+    """
+
+    CPU_FUNCTIONS = 25  # Functions Listed in the Report, by Cumulative Time
+    MEMORY_SITES = 15  # Lines Listed in the Report, by Bytes Still Allocated
+
+    def __init__(self):
+        self.enabled = False
+        self.cpu = False
+        self.memory = False
+        self.started = 0.0
+        self.phases: Dict[str, Phase] = {}
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def enable(self, cpu: bool = False, memory: bool = False) -> None:
+        """
+        Starts Profiling the Run
+
+        :param cpu: Also Profile Every Function Call (in Every Thread Started from Now On) with cProfile
+        :param memory: Also Trace Memory Allocations with tracemalloc
+        """
+        self.enabled = True
+        self.started = time.perf_counter()
+        if cpu and not self.cpu:
+            self.cpu = True
+            threading.setprofile(self._profile_thread)
+            self._profile_thread()
+        if memory and not self.memory:
+            self.memory = True
+            tracemalloc.start()
+
+    def phase(self, name: str):
+        """
+        Starts Timing a Run of a Phase
+
+        :param name: The Phase Name (eg. login, request, transfer, write)
+        :return: The Span to End (or Exit) when the Phase is Over
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        now = time.perf_counter()
+        with self._lock:
+            phase = self.phases.get(name, None)
+            if phase is None:
+                phase = self.phases[name] = Phase(name)
+            if phase._active == 0:
+                phase._since = now
+            phase._active += 1
+        return Span(self, phase, now)
+
+    def timed(self, iterable: Iterable, name: str) -> Iterator:
+        """
+        Times Each Wait for the Next Item of an Iterable (eg. the Chunks of a Response Body) as a Run of a Phase
+
+        :param iterable: The Iterable to Time
+        :param name: The Phase Name
+        :return: An Iterator Over the Same Items
+        """
+        if not self.enabled:
+            return iter(iterable)
+        return self.__timed(iter(iterable), name)
+
+    def __timed(self, iterator: Iterator, name: str) -> Iterator:
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    async def timed_async(self, iterable: AsyncIterable, name: str) -> AsyncIterator:
+        """
+        Times Each Wait for the Next Item of an Asynchronous Iterable as a Run of a Phase
+
+        :param iterable: The Asynchronous Iterable to Time
+        :param name: The Phase Name
+        :return: An Asynchronous Iterator Over the Same Items
+        """
+        iterator = iterable.__aiter__()
+        while True:
+            with self.phase(name):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+
+    def _end(self, phase: Phase, started: float) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            phase.calls += 1
+            phase.cumulative += now - started
+            phase._active -= 1
+            if phase._active == 0:
+                phase.wall += now - phase._since
+
+    def _profile_thread(self, *_) -> None:
+        """
+        Starts a cProfile for the Current Thread (Installed with threading.setprofile so it Runs First in Each Thread)
+        """
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def elapsed(self) -> float:
+        """
+        :return: The Seconds Since Profiling was Enabled
+        """
+        return time.perf_counter() - self.started if self.enabled else 0.0
+
+    def bound_by(self) -> Optional[str]:
+        """
+        Names Which of the API, Network or Disk the Run Spent the Most Time Waiting on
+
+        :return: The Name of the Phase with the Most Cumulative Time (None if Nothing was Downloaded)
+        """
+        timed = [self.phases[name] for name in BOUND_BY if name in self.phases]
+        return max(timed, key=lambda phase: phase.cumulative).name if timed else None
+
+    def stop_cpu(self) -> Optional[pstats.Stats]:
+        """
+        Stops the CPU Profiling, Combining the Profiles of Every Thread
+
+        :return: The Combined Statistics (None if CPU Profiling wasn't Enabled)
+        """
+        if not self.cpu:
+            return None
+        threading.setprofile(None)
+        with self._lock:
+            profiles, self._profiles = self._profiles, []
+        self.cpu = False
+        for profile in profiles:
+            profile.disable()
+        return pstats.Stats(*profiles, stream=io.StringIO())
+
+    def breakdown(self) -> str:
+        """
+        Builds a Table of the Time Spent in Each Phase
+
+        :return: The Table's Text
+        """
+        elapsed = self.elapsed()
+        lines = [f"[PROFILE] {elapsed:.2f}s Total",
+                 "{:<40} {:>8} {:>10} {:>12} {:>7}".format("phase", "calls", "wall", "cumulative", "share")]
+        with self._lock:
+            phases = list(self.phases.values())
+        for phase in phases:
+            lines.append("{:<40} {:>8} {:>9.2f}s {:>11.2f}s {:>6.1f}%".format(
+                phase.name[:40], phase.calls, phase.wall, phase.cumulative,
+                phase.wall * 100 / elapsed if elapsed > 0 else 0.0))
+        bound_by = self.bound_by()
+        if bound_by is not None:
+            lines.append(f"Most Time was Spent Waiting on {BOUND_BY[bound_by]}")
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"Memory: {current / 2 ** 20:.1f} MiB Allocated, {peak / 2 ** 20:.1f} MiB Peak")
+        return '\n'.join(lines)
+
+    def report(self, cpu_stats: Optional[pstats.Stats] = None) -> Dict[str, Any]:
+        """
+        Builds a Machine Readable Report of the Run
+
+        :param cpu_stats: The Combined CPU Profile to Summarise (From stop_cpu)
+        :return: The Report as JSON Compatible Values
+        """
+        elapsed = self.elapsed()
+        with self._lock:
+            phases = [phase.as_dict(elapsed) for phase in self.phases.values()]
+        report: Dict[str, Any] = {'elapsed': round(elapsed, 6), 'bound_by': self.bound_by(), 'phases': phases}
+        if cpu_stats is not None:
+            functions = sorted(cpu_stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+            report['cpu'] = [{
+                'function': f"{filename}:{line}({name})",
+                'calls': calls,
+                'own': round(own, 6),
+                'cumulative': round(cumulative, 6),
+            } for (filename, line, name), (_, calls, own, cumulative, _) in functions[:Profiler.CPU_FUNCTIONS]]
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().statistics('lineno')[:Profiler.MEMORY_SITES]
+            report['memory'] = {
+                'current': current,
+                'peak': peak,
+                'sites': [{'location': str(statistic.traceback), 'size': statistic.size, 'count': statistic.count}
+                          for statistic in statistics],
+            }
+        return report
+
+
+def write_report(location: Optional[str], cpu_location: Optional[str] = None) -> None:
+    """
+    Stops any CPU Profiling and Writes the Report
+
+    :param location: Where to Write the JSON Report ('-' Prints it, None Skips it)
+    :param cpu_location: Where to Write the Combined cProfile Statistics (Readable by pstats, snakeviz etc.)
+    """
+    cpu_stats = profiler.stop_cpu()
+    if cpu_stats is not None and cpu_location:
+        cpu_stats.dump_stats(cpu_location)
+    if location:
+        report = json.dumps(profiler.report(cpu_stats), indent=2)
+        if location == '-':
+            print(report)
+        else:
+            with open(location, 'w') as f:
+                f.write(report + '\n')
+
+
+profiler = Profiler()
@@ -32,7 +32,11 @@ def test():
     client_data["successful_login"] = attempt[0]
     client_vars = vars(client)
     for item in client_vars:
-        if item not in ('_BlackBoardClient__password', 'session', 'institute', 'api_version', 'thread_pool'):
+        if item not in ('_BlackBoardClient__password', 'session', 'institute', 'api_version', 'thread_pool',
+                        'crawl_pool', 'course_scheduler', 'http_adapter',
+                        'prefetch_pool', 'stop_event', 'rate_controller',
+                        'metadata_retry', 'download_retry', 'retry_report', '_login_lock', 'blob_store',
+                        'http_cache', '_terms_lock'):
             client_data[item] = client_vars[item]
     print("Dumped Client Properties...")
     # Get Parent Course Data
@@ -58,7 +62,8 @@ def test():
                     course_request = client.send_get_request(BlackBoardEndPoints.get_course(course["courseId"]))
                     course = course_request.json()
                     bbcourse = BlackBoardCourse(client, course)
-                    course_vars = vars(bbcourse)
+                    course_vars = {name: getattr(bbcourse, name) for name in dir(bbcourse)
+                                   if not name.startswith('_') and not callable(getattr(bbcourse, name))}
                     course_sub_data = dict()
                     course_sub_data["course_endpoint"] = course_request.url
                     course_sub_data['status_code'] = course_request.status_code
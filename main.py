@@ -4,12 +4,17 @@ Main Module is the Main CLI Application
 from typing import Optional, Any, List, Union
 from blackboard import BlackBoardContent, BlackBoardClient, BlackBoardAttachment, BlackBoardInstitute, \
     BlackBoardCourse, DownloadQueue
+from blackboardevents import event_bus, set_output, ProgressRenderer, QuietOutput
+from blackboardfilter import CourseFilter
+from blackboardmetrics import MetricsRecorder, MetricsServer, write_summary
+from blackboardprofile import profiler, write_report
 import argparse
 import sys
 import json
 import os
 import getpass
 import signal
+import asyncio
 
 
 # TODO: Add Inline Comments Explaining Possibly Confusing or Dumb Implementations
@@ -30,16 +35,67 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument("-p", "--password", help="Password to Login With")
     parser.add_argument("-s", "--site", help="Base Website Where Institute Black Board is Located")
     parser.add_argument("-l", "--location", help="Local Path To Save Content", default='.')
-    parser.add_argument("-c", "--course", help="Course ID to Download")
+    parser.add_argument("-c", "--course", help="Comma Separated Course IDs to Download (Primary IDs, or externalId:, "
+                                               "courseId: or uuid: Prefixed IDs), Looked Up Directly", default=None)
+    parser.add_argument("-f", "--filter", help="Only Download Courses Matching this Expression (Repeatable, eg. "
+                                               "term=2024*, closed=false, end>=2024-01-01, name!=*Sandbox*)",
+                        action="append", default=[])
     parser.add_argument("-r", "--record", help="Create A Manifest For Downloaded Data", action="store_true",
                         default=True)
+    parser.add_argument("--manifest-backend", help="How the Manifest is Stored", choices=["sqlite", "json"],
+                        default="sqlite")
     parser.add_argument("-b", "--backup", help="Keep Local Copy of Outdated Files", action="store_true", default=False)
-    parser.add_argument("-V", "--verbose", help="Print Program Runtime Information", action="store_true")
+    parser.add_argument("--dedupe", help="Store Identical Files Once and Hardlink them Wherever they are Attached",
+                        action="store_true")
+    parser.add_argument("--blob-store", help="Where Deduplicated Files are Stored (Defaults to <location>/.blobs)",
+                        default=None)
+    parser.add_argument("--incremental", help="Skip Listing Content that hasn't Changed Since the Last Crawl",
+                        action="store_true")
+    parser.add_argument("--full-crawl-days", help="Days Between Full Crawls when Crawling Incrementally", default=7)
+    parser.add_argument("--http-cache", help="Cache API Responses on Disk and Revalidate them Instead of Refetching",
+                        action="store_true")
+    parser.add_argument("--http-cache-size", help="Max Number of MiB of Responses the HTTP Cache Keeps", default=64)
+    parser.add_argument("--cache-ttl", help="Seconds Cached Responses are Used Without Revalidating, as "
+                                            "family=seconds Pairs (eg. courses=3600,contents=0)", default=None)
+    parser.add_argument("-V", "--verbose", help="Print Program Runtime Information (Including the Time Spent in Each "
+                                                "Phase)", action="store_true")
+    parser.add_argument("--profile", help="Write a JSON Report of the Time Spent in Each Phase Here at Exit ('-' for "
+                                          "stdout)", default=None)
+    parser.add_argument("--profile-cpu", help="Profile Every Thread with cProfile, Writing the Statistics Here at Exit",
+                        default=None)
+    parser.add_argument("--profile-memory", help="Trace Memory Allocations, Reporting the Peak and the Largest Sites",
+                        action="store_true")
+    parser.add_argument("-q", "--quiet", help="Only Print Files that Failed to Download", action="store_true")
+    parser.add_argument("--progress", help="Show Live Throughput, ETA and Active Downloads While Mass Downloading",
+                        action="store_true")
+    parser.add_argument("--metrics-port", help="Serve Prometheus Metrics at http://127.0.0.1:<port>/metrics",
+                        default=None)
+    parser.add_argument("--metrics-file", help="Keep a Prometheus Text File of the Metrics at this Path", default=None)
+    parser.add_argument("--metrics-json", help="Write a JSON Summary of the Metrics Here at Exit ('-' for stdout)",
+                        default=None)
     parser.add_argument("-C", "--config", help="Location of Configuration File", default='.')
     parser.add_argument("-i", "--ignore-input", help="Ignore Input at Runtime", action="store_true")
     parser.add_argument("-t", "--threaded", help="Enable multi-threaded downloading", action="store_true", default=True)
     parser.add_argument("-n", "--num-threads", help="Max Number of Threads to Use When Downloading", default=4)
+    parser.add_argument("--crawl-threads", help="Max Number of Threads to Use When Discovering Course Content",
+                        default=None)
     parser.add_argument("-B", "--browser", help="Browser to get cookies from, for authenticated sessions", default=None)
+    parser.add_argument("--segments", help="Split Large Files into this Many Byte Ranges Fetched in Parallel",
+                        default=1)
+    parser.add_argument("--segment-threshold", help="Size in Bytes a File Must Reach Before it is Segmented",
+                        default=64 * 1024 * 1024)
+    parser.add_argument("--pool-size", help="Max Number of Connections Kept Open to a Single Host", default=None)
+    parser.add_argument("--no-keep-alive", help="Disable TCP Keep-Alive on Pooled Connections", action="store_true")
+    parser.add_argument("--connect-timeout", help="Seconds to Wait when Opening a Connection", default=10)
+    parser.add_argument("--read-timeout", help="Seconds to Wait Between Bytes Received from the Server", default=60)
+    parser.add_argument("--max-requests", help="Max Number of Requests the Rate Limiter Allows in Flight", default=None)
+    parser.add_argument("--retries", help="Attempts Each Listing Request Gets Before it Fails", default=4)
+    parser.add_argument("--download-retries", help="Attempts Each File Download Gets Before it Fails", default=3)
+    parser.add_argument("-a", "--async", dest="use_async", help="Run Mass Downloads on a Single asyncio Event Loop",
+                        action="store_true")
+    parser.add_argument("--max-concurrency", help="Max Number of Requests in Flight When Using --async", default=100)
+    parser.add_argument("--chunk-size", help="Number of Bytes Each Download Thread Holds in Memory at Once",
+                        default=1024 * 1024)
     return parser.parse_args()
 
 
@@ -52,6 +108,8 @@ def handle_arguments(debug=False) -> None:
     if args.version:
         print("Application Version: v{}".format("1.0.0"))
         sys.exit(0)
+    if args.verbose or args.profile or args.profile_cpu or args.profile_memory:
+        profiler.enable(cpu=bool(args.profile_cpu), memory=args.profile_memory)
 
     # Config Will Always Be Relative to Script Location Directory Unless Absolute Path is Provided
     args.config = os.path.abspath(os.path.join(script_directory, args.config, "config.json"))
@@ -112,15 +170,18 @@ def handle_arguments(debug=False) -> None:
 
         if ((not args.site or not args.site.strip()) and not possible_site and not args.ignore_input) or \
                 args.site == 'c':
-            args.site = navigation(options=BlackBoardInstitute.find(input("Institute Name: ")),
-                                   attribute='name', sort=True).display_lms_host
+            institute_name = input("Institute Name: ")
+            with profiler.phase('institute'):
+                institutes = BlackBoardInstitute.find(institute_name)
+            args.site = navigation(options=institutes, attribute='name', sort=True).display_lms_host
             if args.site is None:
                 print("No Site Supplied!")
                 sys.exit(0)
         else:
             args.site = possible_site
     if args.site:
-        args.institute = BlackBoardInstitute.find(args.site)[0]
+        with profiler.phase('institute'):
+            args.institute = BlackBoardInstitute.find(args.site)[0]
 
     # if args.dump:
     #    pass
@@ -146,12 +207,55 @@ def main(args) -> None:
     The Main Function That is Used to Traverse the Blackboard Content
     :param args: The Parsed Arguments from the CLI, Configuration File and Inputs
     """
+    try:
+        args.course_filter = CourseFilter(args.filter)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    if args.quiet:
+        set_output(QuietOutput())
+    elif args.progress and args.mass_download:
+        set_output(ProgressRenderer())
+    metrics_recorder = MetricsRecorder(args.metrics_file)
+    event_bus.subscribe(metrics_recorder)
+    if args.metrics_port is not None:
+        print(f"Serving Metrics at http://127.0.0.1:{MetricsServer(int(args.metrics_port)).start().port}/metrics")
+
+    if args.mass_download and args.use_async:  # The asyncio Client Logs in Itself, so No Threaded Client is Made
+        from blackboardasync import AsyncBlackBoardClient  # aiohttp is Only Required When Running on asyncio
+        client = AsyncBlackBoardClient(username=args.username, password=args.password, site=args.site,
+                                       institute=args.institute, save_location=args.location,
+                                       use_manifest=args.record, manifest_backend=args.manifest_backend,
+                                       backup_files=args.backup, browser=args.browser,
+                                       deduplicate=args.dedupe, blob_location=args.blob_store,
+                                       chunk_size=int(args.chunk_size), connect_timeout=args.connect_timeout,
+                                       read_timeout=args.read_timeout, metadata_retries=args.retries,
+                                       download_retries=args.download_retries,
+                                       max_concurrency=int(args.max_concurrency))
+        try:
+            asyncio.run(async_mass_download(args, client))
+        except KeyboardInterrupt:
+            print(f"Cancelling All Remaining Downloads...")
+        report_run(args, client, metrics_recorder)
+        return
 
     client = BlackBoardClient(username=args.username,
                               password=args.password, site=args.site, thread_count=int(args.num_threads),
+                              crawl_thread_count=int(args.crawl_threads) if args.crawl_threads else None,
                               institute=args.institute, save_location=args.location,
-                              use_manifest=args.record, backup_files=args.backup, browser=args.browser)
-    login_resp = client.login()
+                              use_manifest=args.record, manifest_backend=args.manifest_backend,
+                              backup_files=args.backup, browser=args.browser,
+                              deduplicate=args.dedupe, blob_location=args.blob_store,
+                              incremental=args.incremental, full_crawl_days=float(args.full_crawl_days),
+                              http_cache=args.http_cache, http_cache_size=int(float(args.http_cache_size) * 2 ** 20),
+                              http_cache_ttls=parse_cache_ttls(args.cache_ttl),
+                              chunk_size=int(args.chunk_size), segments=int(args.segments),
+                              segment_threshold=int(args.segment_threshold), pool_size=args.pool_size,
+                              keep_alive=not args.no_keep_alive, connect_timeout=args.connect_timeout,
+                              read_timeout=args.read_timeout, max_requests=args.max_requests,
+                              metadata_retries=args.retries, download_retries=args.download_retries)
+    with profiler.phase('login'):
+        login_resp = client.login()
     if login_resp[0]:
         signal.signal(signal.SIGINT, client.stop_threaded_downloads)  # Hook SIGINT (ctrl + c) so we can kill threads
         if not client.use_rest_api:
@@ -164,17 +268,29 @@ def main(args) -> None:
                 "application to function...\n\nPress Any Key to Exit")
             sys.exit(0)
         save_config(args)
-        for course in args.additional_courses:  # Append Additional Courses
-            client.add_course(course)
+        if not (args.mass_download and args.course):  # Specified Courses are Looked Up Directly
+            for course in args.additional_courses:  # Append Additional Courses
+                client.add_course(course)
         if args.mass_download:
             try:
-                for course in client.courses():
-                    if args.course is None or course.id == args.course:  # Download only Specified Course
+                # Download only Specified Courses, Without Listing Every Enrollment
+                with profiler.phase('courses'):
+                    if args.course is None:
+                        courses = client.iter_courses()
+                    else:
+                        courses = client.find_courses(parse_course_ids(args.course))
+                    # Filtered Before Anything is Crawled, so Excluded Courses Cost No Content Listings
+                    courses = list(args.course_filter.select(courses, client.term))
+                if args.threaded:
+                    client.download_courses(courses, args.location)  # Courses are Downloaded Concurrently
+                else:
+                    for course in courses:
                         course.download_all_attachments(args.location, args.threaded)
             except DownloadQueue.DownloadQueueCancelled:  # We Have Shutdown The Downloads
                 print(f"Cancelling All Remaining Downloads...")
         else:
             navigate(client)
+        report_run(args, client, metrics_recorder)
     else:
         if input("FAILED TO LOGIN\n" +
                  f"Username: {args.username}\n" +
@@ -188,6 +304,67 @@ def main(args) -> None:
     return
 
 
+def report_run(args, client: BlackBoardClient, metrics_recorder: MetricsRecorder) -> None:
+    """
+    Closes the Clients On Disk Stores, then Prints the Summary of a Run and Writes the Requested Metrics and Profile
+    Reports
+    :param args: The Parsed Arguments from the CLI, Configuration File and Inputs
+    :param client: The Client the Run was Made With
+    :param metrics_recorder: The Recorder Subscribed to the Runs Events
+    """
+    event_bus.flush()  # Let Queued Output Finish Before the Summary
+    client.flush()
+    if args.progress and not args.quiet:
+        print()  # Leave the Final Status Line in Place
+    if client.retry_report.summary():
+        print(client.retry_report.summary())
+    if args.verbose and hasattr(client, 'http_adapter'):  # Only the Threaded Client Pools Connections Itself
+        print(f"Connection Pool: {client.http_adapter.stats}")
+    if profiler.enabled:
+        print(profiler.breakdown())
+    metrics_recorder.write()
+    if args.metrics_json:
+        write_summary(args.metrics_json)
+    write_report(args.profile, args.profile_cpu)
+
+
+async def async_mass_download(args, client) -> None:
+    """
+    Downloads All Course Documents Using the asyncio Client
+    :param args: The Parsed Arguments from the CLI, Configuration File and Inputs
+    :param client: The (Not Yet Logged in) AsyncBlackBoardClient to Download With
+    """
+    async with client:
+        with profiler.phase('login'):
+            login_resp = await client.login()
+        if not login_resp[0]:
+            print(f"FAILED TO LOGIN\nResponse Status Code: {login_resp[1]}")
+            return
+        save_config(args)
+        if args.course is not None:  # Download only Specified Courses, Without Listing Every Enrollment
+            for course in await client.find_courses(parse_course_ids(args.course)):
+                if await async_course_selected(client, args.course_filter, course):
+                    await course.download_all_attachments(args.location)
+            return
+        for course in args.additional_courses:  # Append Additional Courses
+            await client.add_course(course)
+        async for course in client.courses():
+            if await async_course_selected(client, args.course_filter, course):
+                await course.download_all_attachments(args.location)
+
+
+async def async_course_selected(client, course_filter: CourseFilter, course: BlackBoardCourse) -> bool:
+    """
+    Tests a Course Against the Course Filter, Looking Up its Term Only When the Filter Needs it
+    :param client: The AsyncBlackBoardClient the Course was Retrieved with
+    :param course_filter: The Course Filter from the --filter Arguments
+    :param course: The Course to Test
+    :return: Whether the Course Should be Downloaded
+    """
+    term = await client.term(course.term_id) if course_filter.needs_term(course) else None
+    return course_filter.matches(course, term)
+
+
 def navigate(selected_item: Union[BlackBoardClient, BlackBoardCourse, BlackBoardContent, BlackBoardAttachment],
              path: list = None, error_message='') -> None:
     """
@@ -217,6 +394,7 @@ def navigate(selected_item: Union[BlackBoardClient, BlackBoardCourse, BlackBoard
 
         # Going Backwards
         if next_item is None:
+            selected_item.flush()
             sys.exit(0)
 
     elif item_class_name == "BlackBoardCourse":
@@ -344,6 +522,33 @@ def current_path(path: list = None, addition: str = '', step: int = -2) -> None:
         del path[step:]
 
 
+def parse_course_ids(course: str) -> List[str]:
+    """
+    Splits the --course Argument into Course Identifiers
+    :param course: Comma Separated Course Identifiers
+    :return: The Course Identifiers, in the Order Given
+    """
+    return [identifier.strip() for identifier in course.split(',') if identifier.strip()]
+
+
+def parse_cache_ttls(cache_ttl: Optional[str]) -> Optional[dict]:
+    """
+    Reads the Time to Live of Each Endpoint Family from the --cache-ttl Argument
+    :param cache_ttl: Comma Separated family=seconds Pairs (eg. courses=3600,contents=0)
+    :return: The Seconds Keyed by Endpoint Family (None if Not Provided)
+    """
+    if not cache_ttl:
+        return None
+    ttls = {}
+    for pair in cache_ttl.split(','):
+        family, _, seconds = pair.partition('=')
+        try:
+            ttls[family.strip()] = float(seconds)
+        except ValueError:
+            print(f"Ignoring Invalid Cache TTL: {pair}")
+    return ttls
+
+
 def save_config(args) -> None:
     """
     Dumps the Required Properties into the Config.json file
@@ -0,0 +1,434 @@
+"""
+Mock Learn Module Provides a Local Stand-In for a Blackboard Learn Server so the Client Can be Run (and Benchmarked)
+Without Access to an Institute
+
+-----
+
+Only the Parts of Learn the Client Uses are Implemented: the Mobile sslUserLogin Login, the REST Paths Built by
+BlackBoardEndPoints (with Paging, fields= and expand=course) and Attachment Downloads (with ETags, 304s and Byte
+Ranges). Courses are Generated Synthetically, and Latency and Bandwidth Can be Limited to Mimic a Real Server
+"""
+
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+API = "/learn/api/public/v1"
+FOLDER_HANDLER = "resource/x-bb-folder"
+FILE_HANDLER = "resource/x-bb-file"
+
+
+class MockLearnServer:
+    """
+    Serves a Generated Set of Courses Over HTTP on a Local Port
+
+    -----
+
+    Every Course Contains `breadth` Folders Nested `depth` Levels Deep, and Every Folder Holds `items` File Items
+    with `attachments` Attachments of `file_size` Bytes Each. File Contents are Generated on Demand so Large Trees
+    Don't Need to be Held in Memory
+    """
+
+    USER_ID = "_1_1"
+    LEARN_VERSION = "3900.0.0"
+    SESSION_COOKIE = "s_session_id"
+
+    def __init__(self, courses: int = 2, depth: int = 2, breadth: int = 3, items: int = 2, attachments: int = 1,
+                 file_size: int = 64 * 1024, page_size: int = 100, latency: float = 0.0,
+                 bandwidth: Optional[int] = None, distinct_files: Optional[int] = None, terms: int = 1,
+                 host: str = '127.0.0.1', port: int = 0):
+        """
+        :param courses: The Number of Courses the User is Enrolled in
+        :param depth: How Many Levels of Folders Each Course Has
+        :param breadth: The Number of Folders in Each Folder (and at the Top of the Course)
+        :param items: The Number of File Items in Each Folder
+        :param attachments: The Number of Attachments on Each File Item
+        :param file_size: The Size of Each Attachment in Bytes
+        :param page_size: The Most Results Returned in a Single Page of a Listing
+        :param latency: Seconds Added Before Every Response
+        :param bandwidth: The Most Bytes per Second Sent on a Single Connection (None for Unlimited)
+        :param distinct_files: The Number of Different Files the Attachments Cycle Through, so the Same File is
+        Attached to Several Items and Courses (None Makes Every Attachment Unique)
+        :param terms: The Number of Yearly Terms the Courses are Spread Across (the Last Course is in the Latest Term)
+        :param host: The Address to Listen on
+        :param port: The Port to Listen on (0 Picks a Free Port)
+        """
+        self.file_size = file_size
+        self.page_size = page_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.distinct_files = distinct_files
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+        self.terms: Dict[str, dict] = {}
+        for year in range(2021 - terms, 2021):
+            self.terms[f"_{year}_1"] = {
+                'id': f"_{year}_1",
+                'externalId': f"TERM{year}",
+                'name': f"{year} Academic Year",
+                'availability': {'available': "Yes", 'duration': {'type': "DateRange",
+                                                                  'start': f"{year}-09-01T00:00:00.000Z",
+                                                                  'end': f"{year + 1}-07-01T00:00:00.000Z"}},
+            }
+        self.courses: Dict[str, dict] = {}
+        self.contents: Dict[Tuple[str, str], dict] = {}
+        self.children: Dict[Tuple[str, Optional[str]], List[str]] = {}
+        self.attachments: Dict[Tuple[str, str], List[dict]] = {}
+        self.files: Dict[str, str] = {}  # The File Served for Each Attachment ID
+        for course_index in range(1, courses + 1):
+            course_id = f"_{course_index}_1"
+            self.courses[course_id] = {
+                'id': course_id,
+                'uuid': hashlib.md5(course_id.encode()).hexdigest(),
+                'externalId': f"MOCK{course_index}",
+                'courseId': f"MOCK{course_index}",
+                'name': f"Mock Course {course_index}",
+                'description': "A Generated Course",
+                'created': "2020-01-01T00:00:00.000Z",
+                'modified': "2020-01-01T00:00:00.000Z",
+                'organization': False,
+                'ultraStatus': "Classic",
+                'termId': list(self.terms)[(course_index - courses - 1) % terms],
+                'availability': {'available': "Yes", 'duration': {'type': "Term"}},
+            }
+            self.__generate(course_id, None, depth, breadth, items, attachments)
+
+        self.server = ThreadingHTTPServer((host, port), self.__handler())
+        self.server.daemon_threads = True
+        address, port = self.server.server_address[:2]
+        # aiohttp Ignores Cookies Set by IP Addresses, so the Loopback Address is Served by Name
+        self.url = f"http://{'localhost' if address == '127.0.0.1' else address}:{port}"
+        self.thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> MockLearnServer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> MockLearnServer:
+        """
+        Starts Serving in a Background Thread
+
+        :return: The Server
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, name="MockLearnServer", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops Serving and Closes the Listening Socket
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def attachment_count(self) -> int:
+        """
+        The Total Number of Attachments Across All Courses
+        """
+        return sum(len(attachments) for attachments in self.attachments.values())
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        The Combined Size of Every Attachment
+        """
+        return self.attachment_count * self.file_size
+
+    def __generate(self, course_id: str, parent_id: Optional[str], depth: int, breadth: int, items: int,
+                   attachments: int) -> None:
+        """
+        Generates a Level of a Courses Content Tree (and the Levels Below it)
+        """
+        listing = self.children.setdefault((course_id, parent_id), [])
+        for index in range(breadth if depth > 0 else 0):
+            content_id = self.__add_content(course_id, parent_id, f"Folder {index + 1}", FOLDER_HANDLER,
+                                            has_children=True)
+            listing.append(content_id)
+            self.__generate(course_id, content_id, depth - 1, breadth, items, attachments)
+        if parent_id is None:
+            return
+        for index in range(items):
+            content_id = self.__add_content(course_id, parent_id, f"Item {index + 1}", FILE_HANDLER,
+                                            has_children=False)
+            listing.append(content_id)
+            self.attachments[(course_id, content_id)] = [{
+                'id': f"{content_id}_{number + 1}",
+                'fileName': f"{content_id.strip('_')}-{number + 1}.bin",
+                'mimeType': "application/octet-stream",
+            } for number in range(attachments)]
+            for attachment in self.attachments[(course_id, content_id)]:
+                self.files[attachment['id']] = attachment['id'] if self.distinct_files is None else \
+                    f"file-{len(self.files) % self.distinct_files}"
+
+    def __add_content(self, course_id: str, parent_id: Optional[str], title: str, handler: str,
+                      has_children: bool) -> str:
+        content_id = f"_{len(self.contents) + 1}_1"
+        self.contents[(course_id, content_id)] = {
+            'id': content_id,
+            'parentId': parent_id,
+            'title': title,
+            'body': "<p>Generated Content</p>",
+            'description': "Generated Content",
+            'created': "2020-01-01T00:00:00.000Z",
+            'modified': "2020-01-01T00:00:00.000Z",
+            'position': len(self.children.get((course_id, parent_id), [])),
+            'hasChildren': has_children,
+            'hasGradebookColumns': False,
+            'hasAssociatedGroups': False,
+            'availability': {'available': "Yes", 'allowGuests': True, 'adaptiveRelease': {}},
+            'contentHandler': {'id': handler},
+            'links': [{'href': f"/ultra/courses/{course_id}/cl/outline", 'rel': "alternate",
+                       'title': "User Interface View", 'type': "text/html"}],
+        }
+        return content_id
+
+    def file_body(self, attachment_id: str) -> bytes:
+        """
+        Generates the Contents of an Attachment File (the Same Every Time for the Same Attachment)
+
+        :param attachment_id: The Attachment's ID
+        :return: The File's Bytes
+        """
+        block = hashlib.sha256(self.files[attachment_id].encode()).digest()
+        return (block * (self.file_size // len(block) + 1))[:self.file_size]
+
+    def etag(self, attachment_id: str) -> str:
+        """
+        :param attachment_id: The Attachment's ID
+        :return: The (Strong) ETag of the Attachment's File
+        """
+        return '"' + hashlib.md5(self.files[attachment_id].encode()).hexdigest() + '"'
+
+    def __handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                server._count()
+                length = int(self.headers.get('Content-Length', 0) or 0)
+                self.rfile.read(length)
+                if not self.path.endswith("/sslUserLogin"):
+                    return self._send(404, b"")
+                body = ('<?xml version="1.0" encoding="UTF-8"?><mobileresponse status="OK" userid="{}" '
+                        'batch_uid="mock" use_learn_rest_api="true" learn_version="{}"/>') \
+                    .format(MockLearnServer.USER_ID, MockLearnServer.LEARN_VERSION).encode()
+                self._send(200, body, "text/xml", {"Set-Cookie": f"{MockLearnServer.SESSION_COOKIE}=mock; Path=/"})
+
+            def do_GET(self):
+                server._count()
+                if server.latency:
+                    time.sleep(server.latency)
+                if f"{MockLearnServer.SESSION_COOKIE}=" not in self.headers.get('Cookie', ''):
+                    return self._send(401, b'{"status":401,"message":"Unauthorized"}', "application/json")
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                try:
+                    status, body, content_type, headers = server._route(url.path, query, self.headers)
+                except KeyError:
+                    status, body, content_type, headers = 404, b'{"status":404}', "application/json", {}
+                if status == 200 and content_type == "application/json":  # Listings Can be Revalidated
+                    headers = dict(headers, ETag='"' + hashlib.md5(body).hexdigest() + '"')
+                    if self.headers.get('If-None-Match', None) == headers['ETag']:
+                        status, body = 304, b""
+                self._send(status, body, content_type, headers)
+
+            def _send(self, status: int, body: bytes, content_type: str = "application/json",
+                      headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                server._write(self.wfile, body)
+
+            def handle(self) -> None:
+                try:
+                    super().handle()
+                except ConnectionError:  # The Client Hung Up (eg. Closing a Download Once it Saw the Headers)
+                    self.close_connection = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _write(self, stream, body: bytes) -> None:
+        """
+        Writes a Response Body, Pacing it to the Bandwidth Limit
+        """
+        chunk_size = 64 * 1024
+        for offset in range(0, len(body), chunk_size):
+            chunk = body[offset:offset + chunk_size]
+            stream.write(chunk)
+            with self._lock:
+                self.bytes_sent += len(chunk)
+            if self.bandwidth:
+                time.sleep(len(chunk) / self.bandwidth)
+
+    def _course(self, key: str) -> dict:
+        """
+        Finds a Course by its Primary ID, or by an externalId:, courseId: or uuid: Prefixed ID
+
+        :raises KeyError: If No Course Matches
+        """
+        field, separator, value = key.partition(':')
+        if not separator:
+            return self.courses[key]
+        for course in self.courses.values():
+            if course.get(field, None) == value:
+                return course
+        raise KeyError(key)
+
+    def _route(self, path: str, query: Dict[str, List[str]], headers) -> Tuple[int, bytes, str, Dict[str, str]]:
+        """
+        Answers a GET Request for One of the Supported Paths
+
+        :return: The Status Code, Body, Content Type and Extra Headers
+        :raises KeyError: If the Path (or Anything it Refers to) Doesn't Exist
+        """
+        fields = query.get('fields', [''])[0].split(',') if 'fields' in query else None
+        if path == f"{API}/system/version":
+            version = map(int, self.LEARN_VERSION.split('.'))
+            return self._json({'learn': dict(zip(('major', 'minor', 'patch'), version))})
+
+        match = re.fullmatch(rf"{API}/users/([^/]+)/courses", path)
+        if match:
+            expand = 'course' in query.get('expand', [''])[0].split(',')
+            memberships = [dict({'userId': match.group(1), 'courseId': course_id},
+                                **({'course': course} if expand else {}))
+                           for course_id, course in self.courses.items()]
+            return self._page(path, query, memberships, None)
+
+        match = re.fullmatch(rf"{API}/terms/([^/]+)", path)
+        if match:
+            return self._json(_project(self.terms[match.group(1)], fields))
+
+        match = re.fullmatch(r"/learn/api/public/v[12]/courses/([^/]+)", path)
+        if match:
+            return self._json(_project(self._course(unquote(match.group(1))), fields))
+
+        match = re.fullmatch(rf"{API}/courses/([^/]+)/contents(?:/([^/]+)(/children)?)?", path)
+        if match:
+            course_id, content_id, children = match.groups()
+            self.courses[course_id]  # Unknown Courses are 404s
+            if content_id is None or children:
+                listing = [self.contents[(course_id, child)] for child in self.children[(course_id, content_id)]]
+                return self._page(path, query, listing, fields)
+            return self._json(_project(self.contents[(course_id, content_id)], fields))
+
+        match = re.fullmatch(rf"{API}/courses/([^/]+)/contents/([^/]+)/attachments(?:/([^/]+)(/download)?)?", path)
+        if match:
+            course_id, content_id, attachment_id, download = match.groups()
+            attachments = self.attachments.get((course_id, content_id), [])
+            if attachment_id is None:
+                return self._page(path, query, attachments, fields)
+            attachment = next((a for a in attachments if a['id'] == attachment_id), None)
+            if attachment is None:
+                raise KeyError(attachment_id)
+            if not download:
+                return self._json(_project(attachment, fields))
+            return self._download(attachment_id, headers)
+        raise KeyError(path)
+
+    def _download(self, attachment_id: str, headers) -> Tuple[int, bytes, str, Dict[str, str]]:
+        """
+        Serves an Attachment's File, Honouring If-None-Match and (If-)Range
+        """
+        etag = self.etag(attachment_id)
+        response_headers = {"ETag": etag, "Accept-Ranges": "bytes",
+                            "Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}
+        if headers.get('If-None-Match', None) == etag:
+            return 304, b"", "application/octet-stream", response_headers
+        body = self.file_body(attachment_id)
+        byte_range = re.fullmatch(r"bytes=(\d+)-(\d*)", headers.get('Range', '') or '')
+        if byte_range and headers.get('If-Range', etag) == etag and int(byte_range.group(1)) < len(body):
+            start = int(byte_range.group(1))
+            end = min(int(byte_range.group(2)), len(body) - 1) if byte_range.group(2) else len(body) - 1
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            return 206, body[start:end + 1], "application/octet-stream", response_headers
+        return 200, body, "application/octet-stream", response_headers
+
+    def _page(self, path: str, query: Dict[str, List[str]], results: List[dict], fields: Optional[List[str]]) \
+            -> Tuple[int, bytes, str, Dict[str, str]]:
+        """
+        Returns One Page of a Listing, Linking to the Next Page if there is One
+        """
+        offset = int(query.get('offset', ['0'])[0])
+        limit = min(int(query.get('limit', [str(self.page_size)])[0]), self.page_size)
+        page = {'results': [_project(result, fields) for result in results[offset:offset + limit]]}
+        if offset + limit < len(results):
+            next_query = {key: values[0] for key, values in query.items()}
+            next_query['offset'] = str(offset + limit)
+            page['paging'] = {'nextPage': f"{path}?{urlencode(next_query)}"}
+        return self._json(page)
+
+    @staticmethod
+    def _json(data: dict) -> Tuple[int, bytes, str, Dict[str, str]]:
+        return 200, json.dumps(data).encode(), "application/json", {}
+
+
+def _project(data: dict, fields: Optional[List[str]]) -> dict:
+    """
+    Keeps Only the Requested Top Level Fields, the Way Learn Handles fields=
+
+    :param data: The Full Object
+    :param fields: The Fields to Keep (All if None)
+    :return: The Projected Object
+    """
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields}
+
+
+def get_arguments() -> argparse.Namespace:
+    """
+    Reads the Arguments Passed into The Script
+    :return: The Parsed and Default Arguments
+    """
+    parser = argparse.ArgumentParser(description='Runs a Local Mock Blackboard Learn Server')
+    parser.add_argument("--port", help="Port to Listen on", type=int, default=8000)
+    parser.add_argument("--courses", help="Number of Courses", type=int, default=2)
+    parser.add_argument("--depth", help="Levels of Folders in Each Course", type=int, default=2)
+    parser.add_argument("--breadth", help="Folders in Each Folder", type=int, default=3)
+    parser.add_argument("--items", help="File Items in Each Folder", type=int, default=2)
+    parser.add_argument("--attachments", help="Attachments on Each File Item", type=int, default=1)
+    parser.add_argument("--file-size", help="Bytes in Each Attachment", type=int, default=64 * 1024)
+    parser.add_argument("--page-size", help="Most Results in a Page of a Listing", type=int, default=100)
+    parser.add_argument("--latency", help="Seconds Added Before Every Response", type=float, default=0.0)
+    parser.add_argument("--bandwidth", help="Most Bytes per Second per Connection", type=int, default=None)
+    parser.add_argument("--distinct-files", help="Number of Different Files the Attachments Cycle Through", type=int,
+                        default=None)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = get_arguments()
+    mock = MockLearnServer(courses=args.courses, depth=args.depth, breadth=args.breadth, items=args.items,
+                           attachments=args.attachments, file_size=args.file_size, page_size=args.page_size,
+                           latency=args.latency, bandwidth=args.bandwidth, distinct_files=args.distinct_files,
+                           port=args.port)
+    print(f"Serving {len(mock.courses)} Courses ({mock.attachment_count} Attachments) at {mock.url}\n"
+          f"Log in with Any Username and Password, eg: python main.py -s {mock.url} -u user -p pass -m")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
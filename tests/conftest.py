@@ -0,0 +1,124 @@
+"""
+Shared Fixtures for Running the Client Against a Local Mock Learn Server
+"""
+
+import os
+import sys
+from typing import Optional
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blackboard import BlackBoardClient, RetryPolicy  # noqa: E402
+from mocklearn import MockLearnServer  # noqa: E402
+
+
+@pytest.fixture
+def learn():
+    """
+    Starts a Mock Learn Server, Stopping it Once the Test Finishes
+
+    :return: A Function that Takes MockLearnServer Arguments and Returns the Running Server
+    """
+    servers = []
+
+    def start(**kwargs) -> MockLearnServer:
+        kwargs.setdefault('latency', 0)
+        server = MockLearnServer(**kwargs).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def client(tmp_path):
+    """
+    Creates Logged In Clients that Save to the Tests Temporary Directory and Retry Without Waiting
+
+    :return: A Function that Takes the Server (and Any Client Options) and Returns the Client
+    """
+
+    def create(server: MockLearnServer, **kwargs) -> BlackBoardClient:
+        kwargs.setdefault('save_location', str(tmp_path))
+        bb_client = BlackBoardClient(username='student', password='password', site=server.url, **kwargs)
+        bb_client.metadata_retry = RetryPolicy(attempts=bb_client.metadata_retry.attempts, base_delay=0.01)
+        bb_client.download_retry = RetryPolicy(attempts=bb_client.download_retry.attempts, base_delay=0.01)
+        assert bb_client.login()[0]
+        return bb_client
+
+    return create
+
+
+@pytest.fixture
+def downloads(tmp_path):
+    """
+    Reads Back the Attachments Saved to the Tests Temporary Directory
+
+    :return: A Function that Returns the File Name of Every Downloaded Attachment Mapped to its Contents
+    """
+
+    def read() -> dict:
+        files = {}
+        for root, directories, names in os.walk(tmp_path):
+            directories[:] = [directory for directory in directories if not directory.startswith('.')]
+            for name in names:
+                if name.endswith('.bin'):
+                    with open(os.path.join(root, name), 'rb') as f:
+                        files[name] = f.read()
+        return files
+
+    return read
+
+
+@pytest.fixture
+def served():
+    """
+    Lists the Attachments a Mock Learn Server Serves
+
+    :return: A Function that Returns the File Name of Every Attachment the Server Has Mapped to its Contents
+    """
+
+    def read(server: MockLearnServer) -> dict:
+        return {attachment['fileName']: server.file_body(attachment['id'])
+                for attachments in server.attachments.values() for attachment in attachments}
+
+    return read
+
+
+@pytest.fixture
+def drop():
+    """
+    Injects Dropped Connections into Attachment Downloads
+
+    :return: A Function that Makes a Server Hang Up Part Way Through the Next Attachment Bodies it Sends, Taking the
+    Server, the Number of Bytes Sent Before Hanging Up, the Number of Bodies to Drop and (Optionally) a Size Only
+    Smaller Bodies are Dropped Below (eg. Segments, Not the Whole File). It Returns the Range and If-Range Headers of
+    Every Download Request the Server Receives
+    """
+
+    def inject(server: MockLearnServer, size: int, drops: int = 1, below: Optional[int] = None) -> list:
+        write, route, requests = server._write, server._route, []
+        remaining = [drops]
+
+        def dropping_write(stream, body: bytes) -> None:
+            if size < len(body) < (below or len(body) + 1) and remaining[0] > 0:
+                remaining[0] -= 1
+                stream.write(body[:size])
+                stream.flush()
+                raise ConnectionResetError("Dropped by the Test")
+            write(stream, body)
+
+        def recording_route(path, query, headers):
+            if path.endswith('/download'):
+                requests.append((headers.get('Range', None), headers.get('If-Range', None)))
+            return route(path, query, headers)
+
+        server._write = dropping_write
+        server._route = recording_route
+        return requests
+
+    return inject
@@ -0,0 +1,104 @@
+"""
+Tests the asyncio Client Against the Mock Learn Server
+"""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from blackboard import RetryPolicy  # noqa: E402
+from blackboardasync import AsyncBlackBoardClient  # noqa: E402
+
+
+def async_client(server, tmp_path, **kwargs) -> AsyncBlackBoardClient:
+    """
+    :param server: The Mock Learn Server
+    :param tmp_path: The Tests Temporary Directory to Save to
+    :param kwargs: Any Other Client Options
+    :return: An asyncio Client that is Not Yet Logged in
+    """
+    return AsyncBlackBoardClient(username='student', password='password', site=server.url,
+                                 save_location=str(tmp_path), **kwargs)
+
+
+def test_only_stalled_transfers_time_out(learn, tmp_path):
+    server = learn(courses=1, depth=0)
+    bb_client = async_client(server, tmp_path, connect_timeout=3, read_timeout=7)
+
+    async def session_timeout() -> aiohttp.ClientTimeout:
+        async with bb_client:
+            return bb_client.session.timeout
+
+    timeout = asyncio.run(session_timeout())
+    assert timeout.total is None
+    assert (timeout.sock_connect, timeout.sock_read) == (3, 7)
+
+
+def download_all(bb_client: AsyncBlackBoardClient) -> None:
+    """
+    Logs in and Downloads Every Course with the asyncio Client
+
+    :param bb_client: The Client (Retrying Without Waiting)
+    """
+    bb_client.download_retry = RetryPolicy(attempts=bb_client.download_retry.attempts, base_delay=0.01)
+
+    async def run() -> None:
+        async with bb_client:
+            assert (await bb_client.login())[0]
+            async for course in bb_client.courses():
+                await course.download_all_attachments(bb_client.base_path)
+
+    asyncio.run(run())
+
+
+def test_dropped_body_is_resumed(learn, drop, downloads, served, tmp_path):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=256 * 1024)
+    requests = drop(server, 64 * 1024)
+    bb_client = async_client(server, tmp_path, chunk_size=1024)
+
+    download_all(bb_client)
+
+    assert downloads() == served(server)
+    (first_range, _), (resume_range, if_range) = requests
+    assert first_range is None and resume_range is not None and if_range is not None
+    assert bb_client.retry_report.retries and not bb_client.retry_report.failures
+
+
+@pytest.mark.parametrize('status, headers', [(502, {}), (429, {"Retry-After": "0"})], ids=['transient', 'throttled'])
+def test_failed_download_is_retried(learn, downloads, served, tmp_path, status, headers):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=64 * 1024)
+    route, failures = server._route, [1]
+
+    def failing_route(path, query, request_headers):
+        if path.endswith('/download') and failures[0] > 0:
+            failures[0] -= 1
+            return status, b'{}', "application/json", headers
+        return route(path, query, request_headers)
+
+    server._route = failing_route
+    bb_client = async_client(server, tmp_path)
+
+    download_all(bb_client)
+
+    assert downloads() == served(server)
+    assert not bb_client.retry_report.failures
+
+
+def test_download_failure_is_reported(learn, downloads, tmp_path):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=64 * 1024)
+    route = server._route
+
+    def failing_route(path, query, headers):
+        if path.endswith('/download'):
+            return 500, b'{}', "application/json", {}
+        return route(path, query, headers)
+
+    server._route = failing_route
+    bb_client = async_client(server, tmp_path, download_retries=2)
+
+    download_all(bb_client)
+
+    assert downloads() == {}
+    assert list(bb_client.retry_report.failures.values()) == ["Status 500"]
@@ -0,0 +1,62 @@
+"""
+Tests that Deduplicated Downloads Link Identical Files to a Single Blob
+"""
+
+import os
+
+
+def saved_locations(location) -> list:
+    """
+    :param location: The Directory Downloads were Saved to
+    :return: The Location of Every Downloaded Attachment (Outside the Blob Store)
+    """
+    return sorted(os.path.join(root, name) for root, directories, names in os.walk(location)
+                  for name in names if name.endswith('.bin') and '.blobs' not in root)
+
+
+def test_identical_files_are_linked(learn, client, downloads, served):
+    server = learn(courses=2, depth=1, breadth=1, items=2, distinct_files=1, file_size=64 * 1024)
+    bb_client = client(server, deduplicate=True)
+
+    for course in bb_client.courses():
+        course.download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert downloads() == served(server)
+    locations = saved_locations(bb_client.base_path)
+    assert len(locations) == 4
+    blob = bb_client.blob_store.blob_location(bb_client.blob_store.lookup(server.etag(next(iter(server.files))),
+                                                                          server.file_size))
+    assert all(os.path.samefile(location, blob) for location in locations)
+
+
+def test_different_files_are_kept_apart(learn, client, downloads, served):
+    server = learn(courses=1, depth=1, breadth=1, items=3, file_size=64 * 1024)
+    bb_client = client(server, deduplicate=True)
+
+    bb_client.courses()[0].download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert downloads() == served(server)
+    inodes = {os.stat(location).st_ino for location in saved_locations(bb_client.base_path)}
+    assert len(inodes) == 3
+
+
+def test_edited_blob_is_not_linked(learn, client, served):
+    server = learn(courses=2, depth=1, breadth=1, items=1, distinct_files=1, file_size=64 * 1024)
+    bb_client = client(server, deduplicate=True)
+    first_course, second_course = bb_client.courses()
+    body = next(iter(served(server).values()))
+
+    first_course.download_all_attachments(bb_client.base_path, threaded=False)
+    edited, = saved_locations(bb_client.base_path)
+    with open(edited, 'r+b') as f:  # Edits the Blob Too, they Share an Inode
+        f.write(b"edited")
+    second_course.download_all_attachments(bb_client.base_path, threaded=False)
+
+    locations = saved_locations(bb_client.base_path)
+    assert len(locations) == 2
+    with open(edited, 'rb') as f:
+        assert f.read() == b"edited" + body[len(b"edited"):]
+    fresh, = [location for location in locations if location != edited]
+    with open(fresh, 'rb') as f:
+        assert f.read() == body
+    assert not os.path.samefile(edited, fresh)
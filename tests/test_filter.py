@@ -0,0 +1,42 @@
+"""
+Tests Selecting Courses with Filter Expressions
+"""
+
+import pytest
+
+from blackboardfilter import CourseFilter
+
+
+@pytest.mark.parametrize('expressions, expected', [
+    ([], ["Mock Course 1", "Mock Course 2", "Mock Course 3"]),
+    (["term=TERM2020"], ["Mock Course 3"]),
+    (["term=2019 Academic Year|TERM2018"], ["Mock Course 1", "Mock Course 2"]),
+    (["term!=TERM2020", "name=*2"], ["Mock Course 2"]),
+    (["end>=2020-01-01"], ["Mock Course 2", "Mock Course 3"]),
+    (["start<2019-01-01"], ["Mock Course 1"]),
+    (["closed=false", "course_id=mock*"], ["Mock Course 1", "Mock Course 2", "Mock Course 3"]),
+    (["organization=true"], []),
+])
+def test_filter_selects_courses(learn, client, expressions, expected):
+    server = learn(courses=3, depth=0, terms=3)
+    bb_client = client(server)
+
+    selected = CourseFilter(expressions).select(bb_client.courses(), bb_client.term)
+
+    assert sorted(course.name for course in selected) == expected
+
+
+def test_terms_are_only_fetched_when_needed(learn, client):
+    server = learn(courses=3, depth=0, terms=3)
+    bb_client = client(server)
+    courses = bb_client.courses()
+    requests = server.requests
+
+    assert len(list(CourseFilter(["name=Mock*", "term=_2020_1|_2019_1"]).select(courses, bb_client.term))) == 2
+    assert server.requests == requests + 1  # Only the Course in 2018 Needs its Term Name Checked
+
+
+@pytest.mark.parametrize('expression', ["term", "colour=red", "closed=maybe", "name>b", "end>=yesterday"])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        CourseFilter([expression])
@@ -0,0 +1,52 @@
+"""
+Tests Serving API Responses from the On Disk HTTP Cache
+"""
+
+import os
+import sqlite3
+
+
+def accessed(location) -> list:
+    """
+    :param location: The Directory the HTTP Cache is Kept in
+    :return: When Each Cached Response was Last Used, as Recorded in the Database
+    """
+    connection = sqlite3.connect(os.path.join(location, "responses.db"))
+    try:
+        return sorted(row[0] for row in connection.execute("SELECT accessed FROM responses"))
+    finally:
+        connection.close()
+
+
+def test_fresh_responses_are_served_from_disk(learn, client, tmp_path):
+    server = learn(courses=1, depth=1, breadth=2, items=1)
+    bb_client = client(server, http_cache=True, http_cache_location=str(tmp_path / "cache"))
+    course = bb_client.courses()[0]
+    listed = [content.title for content in course.contents()]
+    requests = server.requests
+    before = accessed(tmp_path / "cache")
+
+    assert [content.title for content in course.contents()] == listed
+    assert server.requests == requests
+    assert accessed(tmp_path / "cache") == before  # Uses are Only Written in Batches
+
+    bb_client.flush()
+    assert accessed(tmp_path / "cache") != before
+
+
+def test_stale_responses_are_revalidated(learn, client, tmp_path):
+    server = learn(courses=1, depth=1, breadth=2, items=1)
+    bb_client = client(server, http_cache=True, http_cache_location=str(tmp_path / "cache"),
+                       http_cache_ttls={'contents': 0})
+    course = bb_client.courses()[0]
+    listed = [content.title for content in course.contents()]
+    not_modified = []
+    route = server._route
+
+    def recording_route(path, query, headers):
+        not_modified.append(headers.get('If-None-Match', None) is not None)
+        return route(path, query, headers)
+
+    server._route = recording_route
+    assert [content.title for content in course.contents()] == listed
+    assert not_modified == [True]
@@ -0,0 +1,42 @@
+"""
+Tests that Incremental Crawls Pick Up Whatever an Earlier Crawl Failed to List
+"""
+
+import pytest
+
+
+def fail_listing(server, content_id: str) -> list:
+    """
+    Makes the Server Answer the Child Listing of a Folder with a 500 Until the Returned Flag is Cleared
+
+    :param server: The Mock Learn Server
+    :param content_id: The ID of the Folder Whose Listing Fails
+    :return: A Single Element List Holding Whether the Listing Still Fails
+    """
+    route, failing = server._route, [True]
+
+    def failing_route(path, query, headers):
+        if failing[0] and path.endswith(f"/contents/{content_id}/children"):
+            return 500, b'{"status":500}', "application/json", {}
+        return route(path, query, headers)
+
+    server._route = failing_route
+    return failing
+
+
+@pytest.mark.parametrize('threaded', [True, False], ids=['threaded', 'sequential'])
+def test_failed_listing_is_crawled_again(learn, client, downloads, served, threaded):
+    server = learn(courses=1, depth=2, breadth=2, items=1, file_size=1024)
+    folder = next(content_id for (course_id, content_id), content in server.contents.items()
+                  if content['hasChildren'] and content['parentId'] is not None)
+    failing = fail_listing(server, folder)
+
+    for run in range(3):
+        bb_client = client(server, incremental=True, metadata_retries=2)
+        for course in bb_client.courses():
+            course.download_all_attachments(bb_client.base_path, threaded=threaded)
+        if run == 0:
+            assert 0 < len(downloads()) < server.attachment_count
+            failing[0] = False
+        else:
+            assert downloads() == served(server)
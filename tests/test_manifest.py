@@ -0,0 +1,26 @@
+"""
+Tests Recording Downloaded Versions in Both Manifest Backends
+"""
+
+import pytest
+
+from blackboard import DownloadManifest
+
+
+@pytest.mark.parametrize('backend', ['sqlite', 'json'])
+def test_entries_survive_reopening(tmp_path, backend):
+    manifest = DownloadManifest.open(str(tmp_path), backend)
+    manifest.record("_1_1", "_1_1_1", '"v1"')
+    manifest.record("_1_1", "_1_1_2", -1)  # Downloaded Without an ETag
+    manifest.flush()
+
+    manifest = DownloadManifest.open(str(tmp_path), backend)
+    assert manifest.get("_1_1", "_1_1_1") == '"v1"'
+    assert manifest.get("_1_1", "_1_1_2") is None
+    assert manifest.get("_2_1", "_2_1_1") is None
+    assert set(manifest.content_entries("_1_1")) == {"_1_1_1", "_1_1_2"}
+
+
+def test_base_manifest_is_abstract():
+    with pytest.raises(TypeError):
+        DownloadManifest()
@@ -0,0 +1,56 @@
+"""
+Tests the Request Slots Held by Streamed Responses
+"""
+
+import gc
+import io
+
+import requests
+
+from blackboard import RateController
+
+
+def held_response(controller: RateController) -> requests.Response:
+    """
+    :param controller: The Rate Controller
+    :return: A Streamed Response Holding One of the Controllers Slots
+    """
+    controller.acquire()
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(b"")
+    controller.release(response, free_slot=False)
+    controller.hold_until_closed(response)
+    return response
+
+
+def test_closing_frees_the_slot():
+    controller = RateController(max_concurrency=2)
+    response = held_response(controller)
+    assert controller.active == 1
+
+    response.close()
+    response.close()  # Only Freed Once
+
+    assert controller.active == 0
+
+
+def test_dropped_response_frees_the_slot_without_the_garbage_collector():
+    controller = RateController(max_concurrency=2)
+    response = held_response(controller)
+    gc.disable()
+    try:
+        del response
+        assert controller.active == 0
+    finally:
+        gc.enable()
+
+
+def test_idle_response_frees_the_slot_once():
+    controller = RateController(max_concurrency=2)
+    response = held_response(controller)
+
+    controller.idle(response)
+    response.close()
+
+    assert controller.active == 0
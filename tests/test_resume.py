@@ -0,0 +1,45 @@
+"""
+Tests Resuming Interrupted Downloads with Range/If-Range
+"""
+
+import json
+import os
+
+from blackboard import PartialDownload
+
+
+def test_retry_resumes_with_range(learn, client, drop, downloads, served):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=256 * 1024)
+    requests = drop(server, 64 * 1024)
+    bb_client = client(server, chunk_size=1024)
+
+    bb_client.courses()[0].download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert downloads() == served(server)
+    (first_range, _), (resume_range, if_range) = requests
+    assert first_range is None
+    assert resume_range is not None and int(resume_range[len('bytes='):-1]) > 0
+    assert if_range == server.etag(next(iter(server.files)))
+
+
+def test_changed_file_restarts_download(learn, client, drop, downloads, served, tmp_path):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=64 * 1024)
+    requests = drop(server, 0, drops=0)
+    bb_client = client(server)
+    course = bb_client.courses()[0]
+    name, body = next(iter(served(server).items()))
+    location = os.path.join(str(tmp_path), course.name_safe, "Folder 1", name)
+
+    # A Partial Copy of an Older Version of the File
+    os.makedirs(os.path.dirname(location))
+    with open(location + ".part", 'wb') as f:
+        f.write(b"x" * 1024)
+    with open(location + ".part.json", 'w') as f:
+        json.dump({'etag': '"outdated"', 'written': 1024}, f)
+    assert PartialDownload(location).request_headers() == {"Range": "bytes=1024-", "If-Range": '"outdated"'}
+
+    course.download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert requests == [("bytes=1024-", '"outdated"')]
+    assert downloads() == {name: body}
+    assert not os.path.exists(location + ".part") and not os.path.exists(location + ".part.json")
@@ -0,0 +1,48 @@
+"""
+Tests Retrying Transient Failures and Reporting the Ones that Never Succeed
+"""
+
+
+def test_dropped_body_is_retried(learn, client, drop, downloads, served):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=256 * 1024)
+    drop(server, 64 * 1024)
+    bb_client = client(server)
+
+    bb_client.courses()[0].download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert downloads() == served(server)
+    assert bb_client.retry_report.retries and not bb_client.retry_report.failures
+
+
+def test_throttled_request_reports_status_and_retry_after(learn, client):
+    server = learn(courses=1, depth=1, breadth=1, items=1)
+    route = server._route
+
+    def throttling_route(path, query, headers):
+        if path.endswith('/contents'):
+            return 429, b'{"status":429}', "application/json", {"Retry-After": "0"}
+        return route(path, query, headers)
+
+    server._route = throttling_route
+    bb_client = client(server, throttle_retries=1)
+    course = bb_client.courses()[0]
+
+    assert course.contents() == []
+    error, = bb_client.retry_report.failures.values()
+    assert "429" in error and "Retry-After: 0" in error
+
+
+def test_failure_reports_the_final_error(learn, client):
+    server = learn(courses=1, depth=1, breadth=1, items=1)
+    route = server._route
+
+    def failing_route(path, query, headers):
+        if path.endswith('/contents'):
+            return 502, b'{"status":502}', "application/json", {}
+        return route(path, query, headers)
+
+    server._route = failing_route
+    bb_client = client(server, metadata_retries=2)
+
+    assert bb_client.courses()[0].contents() == []
+    assert list(bb_client.retry_report.failures.values()) == ["Status 502"]
@@ -0,0 +1,22 @@
+"""
+Tests Fetching Large Attachments in Segments
+"""
+
+
+def test_segmented_retry_only_fetches_missing_ranges(learn, client, drop, downloads, served):
+    server = learn(courses=1, depth=1, breadth=1, items=1, file_size=512 * 1024)
+    requests = drop(server, 64 * 1024, below=server.file_size)
+    bb_client = client(server, chunk_size=8 * 1024, segments=4, segment_threshold=256 * 1024)
+
+    bb_client.courses()[0].download_all_attachments(bb_client.base_path, threaded=False)
+
+    assert downloads() == served(server)
+    attempts = []
+    for byte_range, if_range in requests:
+        if byte_range is None:  # Every Attempt Starts with a Request for the Whole File
+            attempts.append([])
+        else:
+            start, end = map(int, byte_range[len('bytes='):].split('-'))
+            attempts[-1].append(end - start + 1)
+    assert len(attempts) == 2 and sum(attempts[0]) == server.file_size
+    assert 0 < sum(attempts[1]) < server.file_size